@@ -1,18 +1,23 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from typing import Optional
 
 from loguru import logger
 
 from contracts.application import (
     ApplicationAdapterContract,
+    DeleteBatchUseCaseContract,
     DeleteUseCaseContract,
+    RetrieveMetaBatchUseCaseContract,
+    RetrieveMetaUseCaseContract,
+    RetrieveRangeUseCaseContract,
     RetrieveUseCaseContract,
     UpdateUseCaseContract,
     UploadUseCaseContract,
 )
 from domain.models import FileId, FileMeta, FileName
-from shared.enums import Buckets
+from shared.enums import BatchDeleteStatus, Buckets
 from shared.exceptions.application import ApplicationRunTimeError
+from shared.io.byte_range import ByteRange, RangeSpec
 
 logger = logger.bind(name="info")
 
@@ -25,19 +30,35 @@ class FileApplicationAdapter(ApplicationAdapterContract):
     Атрибуты:
         _upload_usecase (Optional[UploadUseCaseContract]): Use case для обработки загрузки файлов.
         _retrieve_usecase (Optional[RetrieveUseCaseContract]): Use case для получения файлов.
+        _retrieve_range_usecase (Optional[RetrieveRangeUseCaseContract]): Use case для получения диапазонов файла.
+        _retrieve_meta_usecase (Optional[RetrieveMetaUseCaseContract]): Use case для получения метаданных файла.
+        _retrieve_meta_batch_usecase (Optional[RetrieveMetaBatchUseCaseContract]): Use case для получения метаданных пачки файлов.
         _delete_usecase (Optional[DeleteUseCaseContract]): Use case для удаления файлов.
+        _delete_batch_usecase (Optional[DeleteBatchUseCaseContract]): Use case для удаления пачки файлов.
         _update_usecase (Optional[UpdateUseCaseContract]): Use case для обновления файлов.
     Методы:
-        upload(name: FileName, stream: AsyncIterator[bytes], bucket: Buckets) -> FileMeta:
-            Загружает файл в указанный bucket. Вызывает ApplicationRunTimeError, если
+        upload(name: FileName, stream: AsyncIterator[bytes], bucket: Buckets, size: Optional[int] = None) -> FileMeta:
+            Загружает файл в указанный bucket; size - заявленный клиентом размер, если известен. Вызывает ApplicationRunTimeError, если
             use case для загрузки недоступен.
         retrieve(file_id: FileId, bucket: Buckets) -> tuple[FileMeta, AsyncIterator[bytes]]:
             Получает файл и его метаданные из указанного bucket. Вызывает
             ApplicationRunTimeError, если use case для получения недоступен.
+        retrieve_meta(file_id: FileId) -> FileMeta:
+            Получает только метаданные файла. Вызывает ApplicationRunTimeError,
+            если use case для получения метаданных недоступен.
+        retrieve_meta_batch(file_ids: Sequence[FileId]) -> list[FileMeta]:
+            Получает метаданные пачки файлов, несуществующие пропускаются.
+            Вызывает ApplicationRunTimeError, если use case недоступен.
+        retrieve_range(file_id: FileId, bucket: Buckets, ranges: Sequence[RangeSpec]) -> tuple[FileMeta, list[tuple[ByteRange, AsyncIterator[bytes]]]]:
+            Получает запрошенные диапазоны файла. Вызывает ApplicationRunTimeError,
+            если use case для получения диапазонов недоступен.
         delete(file_id: FileId, bucket: Buckets) -> None:
             Удаляет файл из указанного bucket. Вызывает ApplicationRunTimeError, если
             use case для удаления недоступен.
-        update(bucket: Buckets, file_id: FileId, name: FileName, stream: Optional[AsyncIterator[bytes]] = None) -> FileMeta:
+        delete_batch(file_ids: Sequence[FileId], bucket: Buckets) -> dict[str, BatchDeleteStatus]:
+            Удаляет пачку файлов и возвращает исход по каждому id. Вызывает
+            ApplicationRunTimeError, если use case для удаления пачки недоступен.
+        update(bucket: Buckets, file_id: FileId, name: FileName, stream: Optional[AsyncIterator[bytes]] = None, size: Optional[int] = None) -> FileMeta:
             Обновляет метаданные файла и, при необходимости, его содержимое в указанном bucket.
             Вызывает ApplicationRunTimeError, если use case для обновления недоступен.
     """
@@ -48,11 +69,19 @@ class FileApplicationAdapter(ApplicationAdapterContract):
         retrieve_usecase: Optional[RetrieveUseCaseContract] = None,
         delete_usecase: Optional[DeleteUseCaseContract] = None,
         update_usecase: Optional[UpdateUseCaseContract] = None,
+        retrieve_range_usecase: Optional[RetrieveRangeUseCaseContract] = None,
+        retrieve_meta_usecase: Optional[RetrieveMetaUseCaseContract] = None,
+        retrieve_meta_batch_usecase: Optional[RetrieveMetaBatchUseCaseContract] = None,
+        delete_batch_usecase: Optional[DeleteBatchUseCaseContract] = None,
     ) -> None:
         self._upload_usecase = upload_usecase
         self._retrieve_usecase = retrieve_usecase
         self._delete_usecase = delete_usecase
         self._update_usecase = update_usecase
+        self._retrieve_range_usecase = retrieve_range_usecase
+        self._retrieve_meta_usecase = retrieve_meta_usecase
+        self._retrieve_meta_batch_usecase = retrieve_meta_batch_usecase
+        self._delete_batch_usecase = delete_batch_usecase
 
     async def upload(
         self,
@@ -60,6 +89,7 @@ class FileApplicationAdapter(ApplicationAdapterContract):
         name: FileName,
         stream: AsyncIterator[bytes],
         bucket: Buckets,
+        size: Optional[int] = None,
     ) -> FileMeta:
         if not self._upload_usecase:
             raise ApplicationRunTimeError("Upload usecase is not available")
@@ -67,6 +97,7 @@ class FileApplicationAdapter(ApplicationAdapterContract):
             name=name,
             stream=stream,
             bucket=bucket,
+            size=size,
         )
         logger.info(f"[APP] File uploaded: id={meta.get_id()}, size={meta.get_size()}")
         return meta
@@ -88,6 +119,51 @@ class FileApplicationAdapter(ApplicationAdapterContract):
         logger.info(f"[APP] File retrieved: id={meta.get_id()}, size={meta.get_size()}")
         return meta, stream
 
+    async def retrieve_meta(self, *, file_id: FileId) -> FileMeta:
+        if not self._retrieve_meta_usecase:
+            raise ApplicationRunTimeError("Retrieve meta usecase is not available")
+
+        meta = await self._retrieve_meta_usecase.execute(file_id=file_id)
+
+        logger.debug(f"[APP] File meta retrieved: id={meta.get_id()}")
+        return meta
+
+    async def retrieve_meta_batch(
+        self, *, file_ids: Sequence[FileId]
+    ) -> list[FileMeta]:
+        if not self._retrieve_meta_batch_usecase:
+            raise ApplicationRunTimeError(
+                "Retrieve meta batch usecase is not available"
+            )
+
+        metas = await self._retrieve_meta_batch_usecase.execute(file_ids=file_ids)
+
+        logger.debug(
+            f"[APP] File meta batch retrieved: requested={len(file_ids)}, found={len(metas)}"
+        )
+        return metas
+
+    async def retrieve_range(
+        self,
+        *,
+        file_id: FileId,
+        bucket: Buckets,
+        ranges: Sequence[RangeSpec],
+    ) -> tuple[FileMeta, list[tuple[ByteRange, AsyncIterator[bytes]]]]:
+        if not self._retrieve_range_usecase:
+            raise ApplicationRunTimeError("Retrieve range usecase is not available")
+
+        meta, parts = await self._retrieve_range_usecase.execute(
+            file_id=file_id,
+            bucket=bucket,
+            ranges=ranges,
+        )
+
+        logger.info(
+            f"[APP] File ranges retrieved: id={meta.get_id()}, ranges={len(parts)}"
+        )
+        return meta, parts
+
     async def delete(
         self,
         *,
@@ -103,6 +179,25 @@ class FileApplicationAdapter(ApplicationAdapterContract):
         )
         logger.info(f"[APP] File deleted: id={file_id}")
 
+    async def delete_batch(
+        self,
+        *,
+        file_ids: Sequence[FileId],
+        bucket: Buckets,
+    ) -> dict[str, BatchDeleteStatus]:
+        if not self._delete_batch_usecase:
+            raise ApplicationRunTimeError("Delete batch usecase is not available")
+
+        outcomes = await self._delete_batch_usecase.execute(
+            file_ids=file_ids,
+            bucket=bucket,
+        )
+        deleted = sum(s is BatchDeleteStatus.DELETED for s in outcomes.values())
+        logger.info(
+            f"[APP] Files deleted: requested={len(outcomes)}, deleted={deleted}"
+        )
+        return outcomes
+
     async def update(
         self,
         *,
@@ -110,11 +205,12 @@ class FileApplicationAdapter(ApplicationAdapterContract):
         file_id: FileId,
         name: FileName,
         stream: Optional[AsyncIterator[bytes]] = None,
+        size: Optional[int] = None,
     ) -> FileMeta:
         if not self._update_usecase:
             raise ApplicationRunTimeError("Update usecase is not available")
         meta = await self._update_usecase.execute(
-            file_id=file_id, name=name, stream=stream, bucket=bucket
+            file_id=file_id, name=name, stream=stream, bucket=bucket, size=size
         )
         logger.info(f"[APP] File updated: id={meta.get_id()}, size={meta.get_size()}")
         return meta
@@ -1,13 +1,21 @@
 from application.usecases.files.delete import DeleteUseCase
+from application.usecases.files.delete_batch import DeleteBatchUseCase
 from application.usecases.files.retrieve import RetrieveUseCase
+from application.usecases.files.retrieve_meta import RetrieveMetaUseCase
+from application.usecases.files.retrieve_meta_batch import RetrieveMetaBatchUseCase
+from application.usecases.files.retrieve_range import RetrieveRangeUseCase
 from application.usecases.files.update import UpdateUseCase
 from application.usecases.files.upload import UploadUseCase
 from application.usecases.system.healthcheck import HealthCheckUseCase
 from application.usecases.system.snapshot import SnapShotUseCase
 
 __all__ = (
+    "DeleteBatchUseCase",
     "DeleteUseCase",
     "HealthCheckUseCase",
+    "RetrieveMetaBatchUseCase",
+    "RetrieveMetaUseCase",
+    "RetrieveRangeUseCase",
     "RetrieveUseCase",
     "SnapShotUseCase",
     "UpdateUseCase",
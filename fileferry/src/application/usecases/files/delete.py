@@ -2,16 +2,17 @@ from application.exceptions.infra_handler import wrap_infrastructure_failures
 from contracts.application import DeleteUseCaseContract
 from contracts.infrastructure import OperationCoordinationContract
 from domain.models import FileId
-from shared.enums import Buckets
+from shared.enums import Buckets, OutboxOperation
 
 
 class DeleteUseCase(DeleteUseCaseContract):
     """
     Случай использования для удаления файла из хранилища файлов и уровня доступа к данным.
 
-    Этот класс координирует удаление файла, взаимодействуя с хранилищем файлов
-    и уровнем доступа к данным через транзакционную операцию. Он гарантирует, что обе
-    операции выполняются в одном транзакционном контексте для поддержания согласованности.
+    Этот класс координирует удаление файла через транзакционную операцию:
+    вместе с удалением метаданных в outbox фиксируется удаление объекта.
+    Сам объект удаляет outbox relay вне запроса - пачками и с повторами,
+    так что сбой хранилища не оставит ни висящих метаданных, ни сирот.
 
     Атрибуты:
         _coordinator (OperationCoordinationContract): Координатор, отвечающий за
@@ -19,7 +20,7 @@ class DeleteUseCase(DeleteUseCaseContract):
 
     Методы:
         execute(file_id: FileId, bucket: Buckets) -> None:
-            Удаляет указанный файл из хранилища файлов и уровня доступа к данным
+            Удаляет метаданные файла и ставит объект в очередь на удаление
             в транзакционном контексте.
     """
 
@@ -29,5 +30,9 @@ class DeleteUseCase(DeleteUseCaseContract):
     @wrap_infrastructure_failures
     async def execute(self, file_id: FileId, bucket: Buckets) -> None:
         async with self._coordinator as transaction:
-            await transaction.data_access.delete(file_id=file_id.value)
-            await transaction.file_storage.delete(file_id=file_id.value, bucket=bucket)
+            object_key = await transaction.data_access.delete(file_id=file_id.value)
+            await transaction.outbox.add(
+                operation=OutboxOperation.DELETE,
+                object_keys=[object_key],
+                bucket=bucket,
+            )
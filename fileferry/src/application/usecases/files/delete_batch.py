@@ -0,0 +1,47 @@
+from collections.abc import Sequence
+
+from application.exceptions.infra_handler import wrap_infrastructure_failures
+from contracts.application.usecases import DeleteBatchUseCaseContract
+from contracts.infrastructure import OperationCoordinationContract
+from domain.models import FileId
+from shared.enums import BatchDeleteStatus, Buckets, OutboxOperation
+
+
+class DeleteBatchUseCase(DeleteBatchUseCaseContract):
+    """
+    Сценарий удаления пачки файлов.
+
+    В одной транзакции: один DELETE ... RETURNING по всем id и одна
+    пачка записей outbox на удаление объектов по реально удалённым строкам.
+    Хранилище в запросе не участвует: объекты удаляет outbox relay
+    multi-object delete'ами, повторяя отказы до успеха.
+
+    Методы:
+        execute(file_ids: Sequence[FileId], bucket: Buckets) -> dict[str, BatchDeleteStatus]:
+            Удаляет файлы и возвращает исход по каждому id в порядке запроса.
+    """
+
+    def __init__(self, coordinator: OperationCoordinationContract) -> None:
+        self._coordinator = coordinator
+
+    @wrap_infrastructure_failures
+    async def execute(
+        self, file_ids: Sequence[FileId], bucket: Buckets
+    ) -> dict[str, BatchDeleteStatus]:
+        ids = list(dict.fromkeys(file_id.value for file_id in file_ids))
+        async with self._coordinator as transaction:
+            deleted = await transaction.data_access.delete_many(ids)
+            await transaction.outbox.add(
+                operation=OutboxOperation.DELETE,
+                object_keys=[deleted[file_id] for file_id in ids if file_id in deleted],
+                bucket=bucket,
+            )
+
+        return {
+            file_id: (
+                BatchDeleteStatus.DELETED
+                if file_id in deleted
+                else BatchDeleteStatus.NOT_FOUND
+            )
+            for file_id in ids
+        }
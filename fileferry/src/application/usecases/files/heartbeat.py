@@ -0,0 +1,53 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from typing import Optional
+
+from contracts.infrastructure import OperationCoordinationContract
+from shared.enums import Buckets, OutboxOperation
+from shared.exceptions.infrastructure import InfraError
+
+
+@contextlib.asynccontextmanager
+async def upload_heartbeat(
+    coordinator: OperationCoordinationContract,
+    *,
+    object_key: str,
+    bucket: Buckets,
+    interval: Optional[float],
+) -> AsyncIterator[None]:
+    """
+    Пока идёт передача в хранилище, раз в interval продлевает запись upload
+    в outbox короткой транзакцией, чтобы relay не счёл долгую загрузку
+    брошенной. interval=None - без продления.
+    """
+    if interval is None:
+        yield
+        return
+    task = asyncio.create_task(_beat(coordinator, object_key, bucket, interval))
+    try:
+        yield
+    finally:
+        # дожидаемся остановки: следующая транзакция сценария идёт в том же
+        # координаторе
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+async def _beat(
+    coordinator: OperationCoordinationContract,
+    object_key: str,
+    bucket: Buckets,
+    interval: float,
+) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        # сбой продления не прерывает передачу: если relay всё же забрал
+        # запись, об этом скажет снятие записи после загрузки
+        with contextlib.suppress(InfraError):
+            async with coordinator as transaction:
+                await transaction.outbox.touch(
+                    operation=OutboxOperation.UPLOAD,
+                    object_key=object_key,
+                    bucket=bucket,
+                )
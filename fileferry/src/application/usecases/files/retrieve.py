@@ -30,12 +30,12 @@ class RetrieveUseCase(RetrieveUseCaseContract):
     async def execute(
         self, file_id: FileId, bucket: Buckets
     ) -> tuple[FileMeta, AsyncIterator[bytes]]:
-        async with self._coordinator as transaction:
+        async with self._coordinator.read() as transaction:
             meta = await transaction.data_access.get(
                 file_id=file_id.value,
             )
             stream = await transaction.file_storage.retrieve(
-                file_id=file_id.value, bucket=bucket
+                file_id=meta.get_object_key(), bucket=bucket
             )
 
         return meta, stream
@@ -0,0 +1,27 @@
+from application.exceptions.infra_handler import wrap_infrastructure_failures
+from contracts.application.usecases import RetrieveMetaUseCaseContract
+from contracts.infrastructure import OperationCoordinationContract
+from domain.models import FileId, FileMeta
+
+
+class RetrieveMetaUseCase(RetrieveMetaUseCaseContract):
+    """
+    Сценарий получения только метаданных файла (HEAD, /meta).
+
+    Обращается исключительно к data_access: хранилище файлов не трогается.
+    Поверх CachedFileMetaDataAccess при попадании в кэш не трогается и БД -
+    соединение из пула берётся лишь на первом запросе, а чтение идёт
+    в режиме read() - без BEGIN/COMMIT.
+
+    Методы:
+        execute(file_id: FileId) -> FileMeta:
+            Возвращает метаданные файла.
+    """
+
+    def __init__(self, coordinator: OperationCoordinationContract) -> None:
+        self._coordinator = coordinator
+
+    @wrap_infrastructure_failures
+    async def execute(self, file_id: FileId) -> FileMeta:
+        async with self._coordinator.read() as transaction:
+            return await transaction.data_access.get(file_id=file_id.value)
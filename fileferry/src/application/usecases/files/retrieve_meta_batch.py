@@ -0,0 +1,30 @@
+from collections.abc import Sequence
+
+from application.exceptions.infra_handler import wrap_infrastructure_failures
+from contracts.application.usecases import RetrieveMetaBatchUseCaseContract
+from contracts.infrastructure import OperationCoordinationContract
+from domain.models import FileId, FileMeta
+
+
+class RetrieveMetaBatchUseCase(RetrieveMetaBatchUseCaseContract):
+    """
+    Сценарий получения метаданных пачки файлов.
+
+    Как и RetrieveMetaUseCase, обращается только к data_access: поверх
+    CachedFileMetaDataAccess вся пачка - один запрос в кэш и не больше
+    одного запроса в БД. Несуществующие id в ответ просто не попадают.
+
+    Методы:
+        execute(file_ids: Sequence[FileId]) -> list[FileMeta]:
+            Возвращает найденные метаданные в порядке file_ids.
+    """
+
+    def __init__(self, coordinator: OperationCoordinationContract) -> None:
+        self._coordinator = coordinator
+
+    @wrap_infrastructure_failures
+    async def execute(self, file_ids: Sequence[FileId]) -> list[FileMeta]:
+        async with self._coordinator.read() as transaction:
+            return await transaction.data_access.get_many(
+                [file_id.value for file_id in file_ids]
+            )
@@ -0,0 +1,46 @@
+from collections.abc import AsyncIterator, Sequence
+
+from application.exceptions.infra_handler import wrap_infrastructure_failures
+from contracts.application.usecases import RetrieveRangeUseCaseContract
+from contracts.infrastructure import OperationCoordinationContract
+from domain.models import FileId, FileMeta
+from shared.enums import Buckets
+from shared.io.byte_range import ByteRange, RangeSpec, resolve_ranges
+
+
+class RetrieveRangeUseCase(RetrieveRangeUseCaseContract):
+    """
+    Сценарий частичного извлечения файла (HTTP Range).
+
+    Диапазоны привязываются к размеру из метаданных, после чего для каждого
+    открывается отдельный поток хранилища с offset/length - байты вне
+    диапазонов из MiniO не читаются. Потоки ленивые и открываются по мере
+    того, как их дочитывает транспорт.
+
+    Методы:
+        execute(file_id: FileId, bucket: Buckets, ranges: Sequence[RangeSpec])
+            -> tuple[FileMeta, list[tuple[ByteRange, AsyncIterator[bytes]]]]:
+            Возвращает метаданные и потоки по каждому выполнимому диапазону.
+            Если ни один диапазон не выполним - InvalidRangeError (416).
+    """
+
+    def __init__(self, coordinator: OperationCoordinationContract) -> None:
+        self._coordinator = coordinator
+
+    @wrap_infrastructure_failures
+    async def execute(
+        self, file_id: FileId, bucket: Buckets, ranges: Sequence[RangeSpec]
+    ) -> tuple[FileMeta, list[tuple[ByteRange, AsyncIterator[bytes]]]]:
+        async with self._coordinator.read() as transaction:
+            meta = await transaction.data_access.get(file_id=file_id.value)
+            parts: list[tuple[ByteRange, AsyncIterator[bytes]]] = []
+            for byte_range in resolve_ranges(ranges, meta.get_size()):
+                stream = await transaction.file_storage.retrieve(
+                    file_id=meta.get_object_key(),
+                    bucket=bucket,
+                    offset=byte_range.start,
+                    length=byte_range.length,
+                )
+                parts.append((byte_range, stream))
+
+        return meta, parts
@@ -1,7 +1,9 @@
+import contextlib
 from collections.abc import AsyncIterator, Callable
 from typing import Optional
 
 from application.exceptions.infra_handler import wrap_infrastructure_failures
+from application.usecases.files.heartbeat import upload_heartbeat
 from contracts.application import UpdateUseCaseContract
 from contracts.domain import PolicyContract
 from contracts.infrastructure import (
@@ -9,11 +11,13 @@ from contracts.infrastructure import (
     OperationCoordinationContract,
 )
 from domain.models import FileId, FileMeta, FileName
-from shared.enums import Buckets
+from shared.enums import Buckets, OutboxOperation
 from shared.exceptions.application import (
     DomainRejectedError,
 )
 from shared.exceptions.domain import FilePolicyViolationError
+from shared.exceptions.infrastructure import StorageError
+from shared.io.stream_inspector import StreamInspector
 
 
 class UpdateUseCase(UpdateUseCaseContract):
@@ -22,15 +26,32 @@ class UpdateUseCase(UpdateUseCaseContract):
 
     Атрибуты:
         coordinator (OperationCoordinationContract): Контракт для управления транзакциями.
-        meta_factory (Callable[[Optional[str], str, int, str], FileMeta]): Фабрика для создания метаданных файла.
+        meta_factory (Callable[[Optional[str], str, int, str, Optional[str]], FileMeta]): Фабрика для создания метаданных файла.
         helper (FileHelperContract): Вспомогательный объект для анализа файлов.
         policy (PolicyContract): Политика, определяющая разрешенные операции с файлами.
+        upload_grace (Optional[float]): Через сколько секунд без продления outbox relay
+            сочтёт загрузку новой версии брошенной.
+        version_grace (float): Сколько секунд прежняя версия остаётся в хранилище
+            после замены: её ещё дочитывают начатые скачивания и воркеры,
+            в чьём L1 осталась старая запись.
 
     Методы:
-        execute(file_id: FileId, name: FileName, stream: Optional[AsyncIterator[bytes]], bucket: Buckets) -> FileMeta:
+        execute(file_id: FileId, name: FileName, stream: Optional[AsyncIterator[bytes]], bucket: Buckets, size: Optional[int] = None) -> FileMeta:
             Выполняет обновление файла. Если передан поток данных (stream), файл анализируется, проверяется
-            на соответствие политике, и затем загружается в хранилище. Если поток данных отсутствует, метаданные
-            файла извлекаются из хранилища и обновляются. Возвращает обновленные метаданные файла.
+            на соответствие политике, и затем загружается в хранилище. Если поток данных отсутствует, в строке
+            меняется только имя (одним UPDATE, без чтения через кэш: размер
+            и контрольная сумма в нём могли отстать от замены содержимого). Заявленный size позволяет не вычитывать
+            поток заранее. Контрольная сумма нового содержимого считается при записи в хранилище.
+            Новое содержимое пишется вне транзакции в отдельный объект
+            под новым ключом версии, а короткая транзакция только обновляет
+            метаданные и переводит строку на этот ключ - без копирования
+            в хранилище, так что читатели видят либо старую версию целиком,
+            либо новую. Новый объект с самого начала учтён в outbox: после
+            сбоя его удаляет сам сценарий (или relay, если и это не удалось),
+            после успеха relay удаляет прежнюю версию, но не раньше чем через
+            version_grace: начатые по ней чтения успевают закончиться.
+            Пока идёт передача, запись upload продлевается.
+            Возвращает обновленные метаданные файла.
 
     Исключения:
         FilePolicyViolationError: Выбрасывается, если файл нарушает политику.
@@ -41,14 +62,18 @@ class UpdateUseCase(UpdateUseCaseContract):
     def __init__(
         self,
         coordinator: OperationCoordinationContract,
-        meta_factory: Callable[[Optional[str], str, int, str], FileMeta],
+        meta_factory: Callable[[Optional[str], str, int, str, Optional[str]], FileMeta],
         helper: FileHelperContract,
         policy: PolicyContract,
+        upload_grace: Optional[float] = None,
+        version_grace: float = 0.0,
     ) -> None:
         self._coordinator = coordinator
         self._meta_factory = meta_factory
         self._helper = helper
         self._policy = policy
+        self._heartbeat = None if upload_grace is None else upload_grace / 3
+        self._version_grace = version_grace
 
     @wrap_infrastructure_failures
     async def execute(
@@ -57,28 +82,84 @@ class UpdateUseCase(UpdateUseCaseContract):
         name: FileName,
         stream: Optional[AsyncIterator[bytes]],
         bucket: Buckets,
+        size: Optional[int] = None,
     ) -> FileMeta:
-        analyzed = None
-        meta = None
-
         if stream:
-            analyzed = await self._helper.analyze(stream)
-            stream, content_type, size = analyzed
-            meta = self._meta_factory(file_id.value, name.value, size, content_type)
-            try:
-                self._policy.is_allowed(meta)
-            except FilePolicyViolationError as exc:
-                raise DomainRejectedError(message="Policy violation") from exc
+            content, content_type, size = await self._helper.analyze(
+                stream=stream, size=size
+            )
+            # спул анализа освобождается и при отказе политики
+            async with contextlib.aclosing(content):
+                meta = self._meta_factory(
+                    file_id.value, name.value, size, content_type, None
+                )
+                try:
+                    self._policy.is_allowed(meta)
+                except FilePolicyViolationError as exc:
+                    raise DomainRejectedError(message="Policy violation") from exc
+                return await self._replace_content(
+                    meta=meta, name=name, stream=content, bucket=bucket
+                )
+
+        # только имя: размер и checksum из кэша могли устареть после замены
+        async with self._coordinator as transaction:
+            return await transaction.data_access.rename(
+                file_id=file_id.value, name=name.value
+            )
 
+    async def _replace_content(
+        self,
+        meta: FileMeta,
+        name: FileName,
+        stream: AsyncIterator[bytes],
+        bucket: Buckets,
+    ) -> FileMeta:
+        storage = self._coordinator.file_storage
+        inspector = StreamInspector(stream)
+        object_key = storage.version_key(meta.get_id())
         async with self._coordinator as transaction:
-            if meta and stream:
-                await transaction.file_storage.upload(
-                    file_meta=meta, stream=stream, bucket=bucket
+            await transaction.outbox.add(
+                operation=OutboxOperation.UPLOAD,
+                object_keys=[object_key],
+                bucket=bucket,
+            )
+        async with upload_heartbeat(
+            self._coordinator,
+            object_key=object_key,
+            bucket=bucket,
+            interval=self._heartbeat,
+        ):
+            await storage.stage(
+                file_meta=meta, stream=inspector, bucket=bucket, object_key=object_key
+            )
+        try:
+            meta = self._meta_factory(
+                meta.get_id(),
+                name.value,
+                meta.get_size(),
+                meta.get_content_type(),
+                inspector.checksum(),
+            )
+            async with self._coordinator as transaction:
+                previous = await transaction.data_access.set_object_key(
+                    file_id=meta.get_id(), object_key=object_key
                 )
-            else:
-                meta = await transaction.data_access.get(file_id=file_id.value)
-                meta = self._meta_factory(
-                    file_id.value, name.value, meta.get_size(), meta.get_content_type()
+                meta = await transaction.data_access.update(meta=meta)
+                await transaction.outbox.resolve(
+                    operation=OutboxOperation.UPLOAD,
+                    object_key=object_key,
+                    bucket=bucket,
+                )
+                # прежнюю версию удалит relay, когда её дочитают
+                await transaction.outbox.add(
+                    operation=OutboxOperation.DELETE,
+                    object_keys=[previous],
+                    bucket=bucket,
+                    delay=self._version_grace,
                 )
-            meta = await transaction.data_access.update(meta=meta)
-            return meta
+        except Exception:
+            # не удалился - запись upload осталась в outbox, уберёт relay
+            with contextlib.suppress(StorageError):
+                await storage.delete(file_id=object_key, bucket=bucket)
+            raise
+        return meta
@@ -1,14 +1,18 @@
+import contextlib
 from collections.abc import AsyncIterator, Callable
 from typing import Optional
 
 from application.exceptions.infra_handler import wrap_infrastructure_failures
+from application.usecases.files.heartbeat import upload_heartbeat
 from contracts.application import UploadUseCaseContract
 from contracts.domain import PolicyContract
 from contracts.infrastructure import FileHelperContract, OperationCoordinationContract
-from domain.models import FileMeta, FileName
-from shared.enums import Buckets
+from domain.models import FileId, FileMeta, FileName
+from shared.enums import Buckets, OutboxOperation
 from shared.exceptions.application import DomainRejectedError
 from shared.exceptions.domain import FilePolicyViolationError
+from shared.exceptions.infrastructure import StorageError
+from shared.io.stream_inspector import StreamInspector
 
 
 class UploadUseCase(UploadUseCaseContract):
@@ -22,11 +26,34 @@ class UploadUseCase(UploadUseCaseContract):
         helper (FileHelperContract): Контракт для анализа и обработки файлов.
         policy (PolicyContract): Контракт для проверки политики загрузки файлов.
         meta_factory (Callable): Фабрика для создания объекта метаданных файла.
+        streaming (bool): Загружать ли потоки без заявленного размера сразу
+            в хранилище (multipart), не вычитывая их заранее.
+        max_size (Optional[int]): Предел размера потоковой загрузки; поток
+            длиннее обрывается хранилищем на лету, а не после передачи.
+        upload_grace (Optional[float]): Через сколько секунд без продления
+            outbox relay сочтёт загрузку брошенной; пока идёт передача,
+            запись upload продлевается втрое чаще.
 
     Методы:
-        execute(name, stream, bucket):
+        execute(name, stream, bucket, size=None):
             Выполняет процесс загрузки файла, включая анализ, проверку политики,
-            сохранение метаданных и загрузку файла в хранилище.
+            сохранение метаданных и загрузку файла в хранилище. Если size
+            заявлен клиентом, поток не вычитывается заранее, а размер
+            сверяется при передаче в хранилище. Если size не заявлен и включен
+            streaming, политика по типу проверяется до передачи (размер
+            известен только сверху - max_size), поток грузится в хранилище
+            с обрывом на max_size, а итоговые размер и политика проверяются
+            после последней части; при отказе объект удаляется.
+            Поток проходит через StreamInspector, поэтому SHA-256 содержимого
+            считается в том же проходе, что и запись в хранилище.
+            Передача в хранилище идёт вне транзакции: соединение с БД
+            берётся только на короткую запись метаданных. До неё объект
+            под свежим id никому не виден, то есть фактически временный.
+            Перед передачей в outbox фиксируется запись upload, снимаемая
+            в одной транзакции с сохранением метаданных: если процесс упадёт
+            посередине, объект без метаданных удалит outbox relay.
+            Пока идёт передача, запись upload продлевается, поэтому долгая
+            загрузка не принимается relay за брошенную.
     """
 
     def __init__(
@@ -34,27 +61,128 @@ class UploadUseCase(UploadUseCaseContract):
         coordinator: OperationCoordinationContract,
         helper: FileHelperContract,
         policy: PolicyContract,
-        meta_factory: Callable[[Optional[str], str, int, str], FileMeta],
+        meta_factory: Callable[[Optional[str], str, int, str, Optional[str]], FileMeta],
+        streaming: bool = False,
+        max_size: Optional[int] = None,
+        upload_grace: Optional[float] = None,
     ) -> None:
         self._coordinator = coordinator
         self._helper = helper
         self._policy = policy
         self._meta_factory = meta_factory
+        self._streaming = streaming
+        self._max_size = max_size
+        self._heartbeat = None if upload_grace is None else upload_grace / 3
 
     @wrap_infrastructure_failures
     async def execute(
+        self,
+        name: FileName,
+        stream: AsyncIterator[bytes],
+        bucket: Buckets,
+        size: Optional[int] = None,
+    ) -> FileMeta:
+        if size is None and self._streaming:
+            return await self._execute_streaming(
+                name=name, stream=stream, bucket=bucket
+            )
+
+        content, mime, size = await self._helper.analyze(stream=stream, size=size)
+        # спул анализа освобождается и при отказе до передачи в хранилище
+        async with contextlib.aclosing(content):
+            file_meta = self._meta_factory(None, name.value, size, mime, None)
+            self._check_policy(file_meta)
+            inspector = StreamInspector(content)
+            storage = self._coordinator.file_storage
+            await self._announce(file_meta.get_id(), bucket)
+            async with self._keep_alive(file_meta.get_id(), bucket):
+                await storage.upload(
+                    file_meta=file_meta, stream=inspector, bucket=bucket
+                )
+        try:
+            file_meta = self._finalize(file_meta, inspector)
+            await self._save(file_meta, bucket)
+        except Exception:
+            await self._discard(file_meta.get_id(), bucket)
+            raise
+
+        return file_meta
+
+    async def _execute_streaming(
         self, name: FileName, stream: AsyncIterator[bytes], bucket: Buckets
     ) -> FileMeta:
-        stream, mime, size = await self._helper.analyze(stream=stream)
-        file_meta = self._meta_factory(None, name.value, size, mime)
+        content, mime = await self._helper.sniff(stream=stream)
+        file_id = FileId.new().value
+        async with contextlib.aclosing(content):
+            if self._max_size is not None:
+                self._check_policy(
+                    self._meta_factory(file_id, name.value, self._max_size, mime, None)
+                )
+            inspector = StreamInspector(content)
+            storage = self._coordinator.file_storage
+            await self._announce(file_id, bucket)
+            async with self._keep_alive(file_id, bucket):
+                size = await storage.upload_stream(
+                    file_id=file_id,
+                    content_type=mime,
+                    stream=inspector,
+                    bucket=bucket,
+                    max_size=self._max_size,
+                )
         try:
-            self._policy.is_allowed(file_meta=file_meta)
-        except FilePolicyViolationError as exc:
-            raise DomainRejectedError(message="Policy violation") from exc
+            file_meta = self._meta_factory(
+                file_id, name.value, size, mime, inspector.checksum()
+            )
+            self._check_policy(file_meta)
+            await self._save(file_meta, bucket)
+        except Exception:
+            await self._discard(file_id, bucket)
+            raise
+
+        return file_meta
+
+    async def _announce(self, file_id: str, bucket: Buckets) -> None:
+        async with self._coordinator as transaction:
+            await transaction.outbox.add(
+                operation=OutboxOperation.UPLOAD, object_keys=[file_id], bucket=bucket
+            )
+
+    def _keep_alive(
+        self, file_id: str, bucket: Buckets
+    ) -> contextlib.AbstractAsyncContextManager[None]:
+        return upload_heartbeat(
+            self._coordinator,
+            object_key=file_id,
+            bucket=bucket,
+            interval=self._heartbeat,
+        )
+
+    async def _save(self, file_meta: FileMeta, bucket: Buckets) -> None:
         async with self._coordinator as transaction:
             await transaction.data_access.save(file_meta=file_meta)
-            await transaction.file_storage.upload(
-                file_meta=file_meta, stream=stream, bucket=bucket
+            await transaction.outbox.resolve(
+                operation=OutboxOperation.UPLOAD,
+                object_key=file_meta.get_id(),
+                bucket=bucket,
             )
 
-        return file_meta
+    async def _discard(self, file_id: str, bucket: Buckets) -> None:
+        # объект уже записан, а метаданных не будет - убираем его;
+        # не вышло - запись upload в outbox осталась, объект уберёт relay
+        with contextlib.suppress(StorageError):
+            await self._coordinator.file_storage.delete(file_id=file_id, bucket=bucket)
+
+    def _check_policy(self, file_meta: FileMeta) -> None:
+        try:
+            self._policy.is_allowed(file_meta=file_meta)
+        except FilePolicyViolationError as exc:
+            raise DomainRejectedError(message="Policy violation") from exc
+
+    def _finalize(self, file_meta: FileMeta, inspector: StreamInspector) -> FileMeta:
+        return self._meta_factory(
+            file_meta.get_id(),
+            file_meta.get_name(),
+            file_meta.get_size(),
+            file_meta.get_content_type(),
+            inspector.checksum(),
+        )
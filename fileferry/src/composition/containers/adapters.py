@@ -11,7 +11,11 @@ class AdapterContainer(containers.DeclarativeContainer):
     Атрибуты:
         upload_usecase (Dependency): Зависимость для использования сценария загрузки.
         retrieve_usecase (Dependency): Зависимость для использования сценария получения данных.
+        retrieve_range_usecase (Dependency): Зависимость для использования сценария получения диапазонов файла.
+        retrieve_meta_usecase (Dependency): Зависимость для использования сценария получения метаданных файла.
+        retrieve_meta_batch_usecase (Dependency): Зависимость для использования сценария получения метаданных пачки файлов.
         delete_usecase (Dependency): Зависимость для использования сценария удаления.
+        delete_batch_usecase (Dependency): Зависимость для использования сценария удаления пачки файлов.
         update_usecase (Dependency): Зависимость для использования сценария обновления.
         health_usecase (Dependency): Зависимость для использования сценария проверки состояния системы.
         snapshot_usecase (Dependency): Зависимость для использования сценария создания снимков.
@@ -25,7 +29,11 @@ class AdapterContainer(containers.DeclarativeContainer):
 
     upload_usecase = providers.Dependency()
     retrieve_usecase = providers.Dependency()
+    retrieve_range_usecase = providers.Dependency()
+    retrieve_meta_usecase = providers.Dependency()
+    retrieve_meta_batch_usecase = providers.Dependency()
     delete_usecase = providers.Dependency()
+    delete_batch_usecase = providers.Dependency()
     update_usecase = providers.Dependency()
     health_usecase = providers.Dependency()
     snapshot_usecase = providers.Dependency()
@@ -34,7 +42,11 @@ class AdapterContainer(containers.DeclarativeContainer):
         FileApplicationAdapter,
         upload_usecase=upload_usecase,
         retrieve_usecase=retrieve_usecase,
+        retrieve_range_usecase=retrieve_range_usecase,
+        retrieve_meta_usecase=retrieve_meta_usecase,
+        retrieve_meta_batch_usecase=retrieve_meta_batch_usecase,
         delete_usecase=delete_usecase,
+        delete_batch_usecase=delete_batch_usecase,
         update_usecase=update_usecase,
     )
 
@@ -67,6 +67,8 @@ class ApplicationContainer(containers.DeclarativeContainer):
             config_minio=config_minio,
             config_redis=config_redis,
             enable_cache=config_app.provided.cache_enabled,
+            spool_max_size=config_app.provided.upload_spool_max_size,
+            mime_workers=config_app.provided.mime_workers,
         ),
     )
 
@@ -80,6 +82,10 @@ class ApplicationContainer(containers.DeclarativeContainer):
             file_helper=infrastructure.file_helper,
             default_policy=domain.default_policy,
             meta_factory=domain.meta_factory,
+            streaming_upload=config_app.provided.upload_streaming,
+            upload_max_size=config_app.provided.upload_max_size,
+            upload_grace=config_minio.provided.outbox_upload_grace,
+            version_grace=config_minio.provided.outbox_version_grace,
         ),
     )
 
@@ -90,7 +96,11 @@ class ApplicationContainer(containers.DeclarativeContainer):
             AdapterContainer,
             upload_usecase=usecases.upload_usecase,
             retrieve_usecase=usecases.retrieve_usecase,
+            retrieve_range_usecase=usecases.retrieve_range_usecase,
+            retrieve_meta_usecase=usecases.retrieve_meta_usecase,
+            retrieve_meta_batch_usecase=usecases.retrieve_meta_batch_usecase,
             delete_usecase=usecases.delete_usecase,
+            delete_batch_usecase=usecases.delete_batch_usecase,
             update_usecase=usecases.update_usecase,
             health_usecase=usecases.health_usecase,
             snapshot_usecase=usecases.snapshot_usecase,
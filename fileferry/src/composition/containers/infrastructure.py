@@ -5,21 +5,35 @@ from dependency_injector import containers, providers
 from composition.factories.infrastructure import (
     cache_invalidator_factory,
     create_db_engine,
+    create_replica_engine,
     create_transaction_context,
     create_transaction_manager,
     db_session_factory,
     db_sessionmaker,
+    http_session_pool_factory,
+    invalidation_bus_factory,
+    local_cache_factory,
     minio_client_factory,
     minio_storage_factory,
+    orphan_sweeper_factory,
+    outbox_relay_factory,
+    read_router_factory,
     redis_cache_storage_factory,
     redis_client_factory,
+    redis_pubsub_client_factory,
     resolve_data_access,
     sql_filemeta_data_access_factory,
+    sql_filemeta_reader_factory,
+    sql_storage_outbox_factory,
     task_fire_n_forget_factory,
     task_manager_factory,
+    tiered_cache_storage_factory,
 )
+from domain.models import FileMeta
 from infrastructure.coordination.minio_sqla import SqlAlchemyMinioCoordinator
 from infrastructure.utils.file_helper import FileHelper
+from infrastructure.utils.mime_detector import MimeDetector
+from infrastructure.utils.single_flight import SingleFlight
 
 
 class InfrastructureContainer(containers.DeclarativeContainer):
@@ -33,27 +47,47 @@ class InfrastructureContainer(containers.DeclarativeContainer):
         config_minio: Конфигурация для клиента MinIO.
         config_redis: Конфигурация для клиента Redis.
         enable_cache: Флаг, указывающий, включено ли кэширование.
+        spool_max_size: Сколько байт загружаемого потока держать в памяти до сброса на диск.
+        mime_workers: Число потоков (и хендлов libmagic) для определения mime.
 
     Клиенты:
         engine_postgres: Singleton для создания SQLAlchemy Engine с использованием конфигурации PostgreSQL.
+        engine_replica: Singleton Engine реплики для чтений (без replica_url - тот же engine_postgres).
+        read_router: Singleton выбора движка для чтений без транзакции: реплика или primary (read-your-writes).
         sessionmaker_postgres: Singleton для создания фабрики сессий SQLAlchemy.
+        sessionmaker_replica: Singleton фабрики сессий поверх engine_replica.
         session_factory: Factory для создания сессий базы данных.
         client_minio: Singleton для создания клиента MinIO.
         client_redis: Singleton для создания клиента Redis с поддержкой кэширования.
+        client_redis_pubsub: Singleton клиента Redis под подписку на шину инвалидации.
+        http_pool: Singleton общей aiohttp-сессии для скачивания из MinIO, закрывается при остановке.
 
     Транзакционный слой:
         tx_context: ContextLocalSingleton для управления контекстом транзакций.
         tx_manager: Factory для создания менеджера транзакций.
         dao_sqlalchemy: Factory для создания объекта доступа к данным с использованием SQLAlchemy.
+        dao_outbox: Factory outbox операций хранилища в транзакции запроса.
+        dao_reader: Singleton чтения метаданных в собственной сессии (фоновое обновление кэша).
+        dao_reader_replica: Singleton того же чтения с реплики (сверка orphan_sweeper).
 
     Задачи:
         task_exec: Singleton для управления задачами с поддержкой кэширования.
         task_scheduler: Singleton для выполнения задач в режиме fire-and-forget.
+        outbox_relay: Singleton фонового исполнителя outbox (удаления объектов,
+                      уборка брошенных загрузок); запускается в lifespan приложения.
+        orphan_sweeper: Factory сверки files с бакетами (CLI transport.cli.sweep_orphans),
+                        параметры прогона передаются при вызове.
 
     Хранилища:
         storage_minio: Factory для создания хранилища MinIO.
         storage_redis: Factory для создания Redis-хранилища с поддержкой кэширования.
-        cache_invalidator: Factory для создания объекта, отвечающего за инвалидирование кэша.
+        cache_local: Singleton LRU-кэша FileMeta в памяти процесса (L1).
+        storage_cache: Factory кэш-хранилища L1 + Redis, если L1 не отключен.
+        cache_invalidator: Factory для создания объекта, отвечающего за инвалидирование кэша
+                           (работает поверх storage_cache, поэтому вычищает и L1).
+        invalidation_bus: Singleton шины, рассылающей инвалидации L1 остальным воркерам;
+                          подписчик запускается в lifespan приложения.
+        single_flight: Singleton схлопывания одновременных промахов кэша по одному id.
 
     Доступ к данным:
         dao_data_access: Factory для разрешения доступа к данным с поддержкой кэширования,
@@ -64,6 +98,7 @@ class InfrastructureContainer(containers.DeclarativeContainer):
                            хранилище и доступ к данным.
 
     Вспомогательные компоненты:
+        mime_detector: Singleton пула libmagic, общий для всех FileHelper.
         file_helper: Factory для создания вспомогательного объекта FileHelper.
     """
 
@@ -72,12 +107,23 @@ class InfrastructureContainer(containers.DeclarativeContainer):
     config_minio = providers.Configuration()
     config_redis = providers.Configuration()
     enable_cache = providers.Configuration()
+    spool_max_size = providers.Configuration()
+    mime_workers = providers.Configuration()
 
     # --- Clients ---
     engine_postgres = providers.Singleton(
-        create_db_engine,
-        url=config_postgres.provided.url,
-        echo=config_postgres.provided.echo,
+        create_db_engine, config=config_postgres, name="primary"
+    )
+
+    engine_replica = providers.Singleton(
+        create_replica_engine, config=config_postgres, primary=engine_postgres
+    )
+
+    read_router = providers.Singleton(
+        read_router_factory,
+        primary=engine_postgres,
+        replica=engine_replica,
+        sticky_seconds=config_postgres.provided.replica_sticky_seconds,
     )
 
     sessionmaker_postgres = providers.Singleton(
@@ -87,20 +133,32 @@ class InfrastructureContainer(containers.DeclarativeContainer):
         expire_on_commit=False,
     )
 
+    sessionmaker_replica = providers.Singleton(
+        db_sessionmaker,
+        engine=engine_replica,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
     session_factory = providers.Factory(
         db_session_factory,
         sessionmaker=sessionmaker_postgres,
     )
 
     client_minio = providers.Singleton(minio_client_factory, config=config_minio)
+    http_pool = providers.Singleton(http_session_pool_factory, config=config_minio)
     client_redis = providers.Singleton(
         redis_client_factory, config=config_redis, with_cache=enable_cache
     )
+    client_redis_pubsub = providers.Singleton(
+        redis_pubsub_client_factory, config=config_redis, with_cache=enable_cache
+    )
 
     # --- Transaction Layer ---
     tx_context = providers.ContextLocalSingleton(
         create_transaction_context,
         session_factory=session_factory,
+        router=read_router,
     )
     tx_manager = providers.Factory(
         create_transaction_manager,
@@ -111,6 +169,23 @@ class InfrastructureContainer(containers.DeclarativeContainer):
         context=tx_context,
     )
 
+    dao_outbox = providers.Factory(
+        sql_storage_outbox_factory,
+        context=tx_context,
+    )
+
+    # обновление кэша читает с primary: запись с отстающей реплики
+    # осела бы в кэше на весь ttl
+    dao_reader = providers.Singleton(
+        sql_filemeta_reader_factory,
+        sessionmaker=sessionmaker_postgres,
+    )
+
+    dao_reader_replica = providers.Singleton(
+        sql_filemeta_reader_factory,
+        sessionmaker=sessionmaker_replica,
+    )
+
     # --- Tasks ---
     task_exec = providers.Singleton(task_manager_factory, with_cache=enable_cache)
     task_scheduler = providers.Singleton(
@@ -118,28 +193,71 @@ class InfrastructureContainer(containers.DeclarativeContainer):
     )
 
     # --- Storages ---
-    storage_minio = providers.Factory(minio_storage_factory, client=client_minio)
+    storage_minio = providers.Factory(
+        minio_storage_factory,
+        client=client_minio,
+        part_size=config_minio.provided.multipart_part_size,
+        parts_in_flight=config_minio.provided.multipart_parts_in_flight,
+        http_pool=http_pool,
+    )
+    outbox_relay = providers.Singleton(
+        outbox_relay_factory,
+        sessionmaker=sessionmaker_postgres,
+        storage=storage_minio,
+        config=config_minio,
+    )
+    orphan_sweeper = providers.Factory(
+        orphan_sweeper_factory, storage=storage_minio, reader=dao_reader_replica
+    )
     storage_redis = providers.Factory(
         redis_cache_storage_factory,
         with_cache=enable_cache,
         client=client_redis,
         prefix=config_redis.provided.cache_prefix,
+        codec=config_redis.provided.cache_codec,
+        ttl_jitter=config_redis.provided.cache_ttl_jitter,
+        early_refresh=config_redis.provided.cache_early_refresh,
+    )
+
+    cache_local = providers.Singleton(
+        local_cache_factory,
+        max_entries=config_redis.provided.local_cache_size,
+        ttl=config_redis.provided.local_cache_ttl,
+    )
+    storage_cache = providers.Factory(
+        tiered_cache_storage_factory,
+        local=cache_local,
+        remote=storage_redis,
     )
 
     cache_invalidator = providers.Factory(
         cache_invalidator_factory,
-        storage=storage_redis,
+        storage=storage_cache,
         manager=task_exec,
     )
 
+    invalidation_bus = providers.Singleton(
+        invalidation_bus_factory,
+        client=client_redis_pubsub,
+        local=cache_local,
+        channel=config_redis.provided.invalidation_channel,
+    )
+
+    single_flight = providers.Singleton(SingleFlight[FileMeta])
+
     dao_data_access = providers.Factory(
         resolve_data_access,
         with_cache=enable_cache,
         scheduler=task_scheduler,
-        redis_storage=storage_redis,
+        redis_storage=storage_cache,
         invalidator=cache_invalidator,
         sql_data_access=dao_sqlalchemy,
         ttl=config_redis.provided.cache_ttl,
+        negative_ttl=config_redis.provided.negative_cache_ttl,
+        bus=invalidation_bus,
+        flight=single_flight,
+        stale_ttl=config_redis.provided.cache_stale_ttl,
+        refresher=dao_reader,
     )
 
     # --- Composition Root ---
@@ -148,7 +266,11 @@ class InfrastructureContainer(containers.DeclarativeContainer):
         transaction=tx_manager,
         storage=storage_minio,
         data_access=dao_data_access,
+        outbox=dao_outbox,
     )
 
     # --- Helpers ---
-    file_helper: ClassVar[providers.Factory[FileHelper]] = providers.Factory(FileHelper)
+    mime_detector = providers.Singleton(MimeDetector, workers=mime_workers)
+    file_helper: ClassVar[providers.Factory[FileHelper]] = providers.Factory(
+        FileHelper, spool_max_size=spool_max_size, mime_detector=mime_detector
+    )
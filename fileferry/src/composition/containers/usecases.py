@@ -1,8 +1,12 @@
 from dependency_injector import containers, providers
 
 from application.usecases import (
+    DeleteBatchUseCase,
     DeleteUseCase,
     HealthCheckUseCase,
+    RetrieveMetaBatchUseCase,
+    RetrieveMetaUseCase,
+    RetrieveRangeUseCase,
     RetrieveUseCase,
     SnapShotUseCase,
     UpdateUseCase,
@@ -20,11 +24,21 @@ class UsecaseContainer(containers.DeclarativeContainer):
         file_helper (providers.Dependency): Зависимость, предоставляющая вспомогательные функции для работы с файлами.
         default_policy (providers.Dependency): Зависимость, представляющая политику по умолчанию.
         meta_factory (providers.Dependency): Зависимость, предоставляющая фабрику метаданных.
+        streaming_upload (providers.Dependency): Флаг потоковой загрузки файлов неизвестной длины.
+        upload_max_size (providers.Dependency): Предел размера потоковой загрузки, байт.
+        upload_grace (providers.Dependency): Через сколько секунд без продления
+            загрузка считается брошенной.
+        version_grace (providers.Dependency): Сколько секунд хранится прежняя
+            версия содержимого после замены.
 
     Фабрики:
         upload_usecase (providers.Factory[UploadUseCase]): Фабрика для создания экземпляров UploadUseCase.
         retrieve_usecase (providers.Factory[RetrieveUseCase]): Фабрика для создания экземпляров RetrieveUseCase.
+        retrieve_range_usecase (providers.Factory[RetrieveRangeUseCase]): Фабрика для создания экземпляров RetrieveRangeUseCase.
+        retrieve_meta_usecase (providers.Factory[RetrieveMetaUseCase]): Фабрика для создания экземпляров RetrieveMetaUseCase.
+        retrieve_meta_batch_usecase (providers.Factory[RetrieveMetaBatchUseCase]): Фабрика для создания экземпляров RetrieveMetaBatchUseCase.
         delete_usecase (providers.Factory[DeleteUseCase]): Фабрика для создания экземпляров DeleteUseCase.
+        delete_batch_usecase (providers.Factory[DeleteBatchUseCase]): Фабрика для создания экземпляров DeleteBatchUseCase.
         update_usecase (providers.Factory[UpdateUseCase]): Фабрика для создания экземпляров UpdateUseCase.
         health_usecase (providers.Factory[HealthCheckUseCase]): Фабрика для создания экземпляров HealthCheckUseCase.
         snapshot_usecase (providers.Factory[SnapShotUseCase]): Фабрика для создания экземпляров SnapShotUseCase.
@@ -36,6 +50,10 @@ class UsecaseContainer(containers.DeclarativeContainer):
     file_helper = providers.Dependency()
     default_policy = providers.Dependency()
     meta_factory = providers.Dependency()
+    streaming_upload = providers.Dependency()
+    upload_max_size = providers.Dependency()
+    upload_grace = providers.Dependency()
+    version_grace = providers.Dependency()
 
     # Фабрики
     upload_usecase: providers.Factory[UploadUseCase] = providers.Factory(
@@ -44,22 +62,43 @@ class UsecaseContainer(containers.DeclarativeContainer):
         helper=file_helper,
         policy=default_policy,
         meta_factory=meta_factory,
+        streaming=streaming_upload,
+        max_size=upload_max_size,
+        upload_grace=upload_grace,
     )
 
     retrieve_usecase: providers.Factory[RetrieveUseCase] = providers.Factory(
         RetrieveUseCase, coordinator=coordination_root
     )
 
+    retrieve_range_usecase: providers.Factory[RetrieveRangeUseCase] = providers.Factory(
+        RetrieveRangeUseCase, coordinator=coordination_root
+    )
+
+    retrieve_meta_usecase: providers.Factory[RetrieveMetaUseCase] = providers.Factory(
+        RetrieveMetaUseCase, coordinator=coordination_root
+    )
+
+    retrieve_meta_batch_usecase: providers.Factory[RetrieveMetaBatchUseCase] = (
+        providers.Factory(RetrieveMetaBatchUseCase, coordinator=coordination_root)
+    )
+
     delete_usecase: providers.Factory[DeleteUseCase] = providers.Factory(
         DeleteUseCase, coordinator=coordination_root
     )
 
+    delete_batch_usecase: providers.Factory[DeleteBatchUseCase] = providers.Factory(
+        DeleteBatchUseCase, coordinator=coordination_root
+    )
+
     update_usecase: providers.Factory[UpdateUseCase] = providers.Factory(
         UpdateUseCase,
         coordinator=coordination_root,
         helper=file_helper,
         policy=default_policy,
         meta_factory=meta_factory,
+        upload_grace=upload_grace,
+        version_grace=version_grace,
     )
     health_usecase: providers.Factory[HealthCheckUseCase] = providers.Factory(
         HealthCheckUseCase, coordinator=coordination_root
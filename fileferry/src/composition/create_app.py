@@ -1,5 +1,6 @@
 import time
-from collections.abc import Sequence
+from collections.abc import AsyncGenerator, Sequence
+from contextlib import asynccontextmanager
 
 from fastapi import APIRouter, FastAPI
 
@@ -15,7 +16,23 @@ def create_app(
 ) -> FastAPI:
     setup_logging()
     container = ApplicationContainer(config_app=settings)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+        bus = container.infrastructure.invalidation_bus()
+        relay = container.infrastructure.outbox_relay()
+        if bus is not None:
+            await bus.start()
+        await relay.start()
+        yield
+        await relay.stop()
+        if bus is not None:
+            await bus.stop()
+        await container.infrastructure.http_pool().close()
+        container.infrastructure.mime_detector().shutdown()
+
     app = FastAPI(
+        lifespan=lifespan,
         root_path=settings.main_route,
         debug=settings.app_debug,
         title="FileFerry Service",
@@ -1,9 +1,13 @@
 from composition.factories.infrastructure.clients import (
+    create_autocommit_engine,
     create_db_engine,
+    create_replica_engine,
     db_session_factory,
     db_sessionmaker,
+    http_session_pool_factory,
     minio_client_factory,
     redis_client_factory,
+    redis_pubsub_client_factory,
 )
 from composition.factories.infrastructure.coordination import (
     sql_minio_coordinator_factory,
@@ -12,36 +16,56 @@ from composition.factories.infrastructure.data_access import (
     cache_aside_factory,
     resolve_data_access,
     sql_filemeta_data_access_factory,
+    sql_filemeta_reader_factory,
+    sql_storage_outbox_factory,
 )
 from composition.factories.infrastructure.storage import (
+    local_cache_factory,
     minio_storage_factory,
     redis_cache_storage_factory,
+    tiered_cache_storage_factory,
 )
 from composition.factories.infrastructure.tasks import (
     cache_invalidator_factory,
+    invalidation_bus_factory,
+    orphan_sweeper_factory,
+    outbox_relay_factory,
     task_fire_n_forget_factory,
     task_manager_factory,
 )
 from composition.factories.infrastructure.transactions import (
     create_transaction_context,
     create_transaction_manager,
+    read_router_factory,
 )
 
 __all__ = (
     "cache_aside_factory",
     "cache_invalidator_factory",
+    "create_autocommit_engine",
     "create_db_engine",
+    "create_replica_engine",
     "create_transaction_context",
     "create_transaction_manager",
     "db_session_factory",
     "db_sessionmaker",
+    "http_session_pool_factory",
+    "invalidation_bus_factory",
+    "local_cache_factory",
     "minio_client_factory",
     "minio_storage_factory",
+    "orphan_sweeper_factory",
+    "outbox_relay_factory",
+    "read_router_factory",
     "redis_cache_storage_factory",
     "redis_client_factory",
+    "redis_pubsub_client_factory",
     "resolve_data_access",
     "sql_filemeta_data_access_factory",
+    "sql_filemeta_reader_factory",
     "sql_minio_coordinator_factory",
+    "sql_storage_outbox_factory",
     "task_fire_n_forget_factory",
     "task_manager_factory",
+    "tiered_cache_storage_factory",
 )
@@ -10,7 +10,10 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from infrastructure.config.minio import MinioConfig
+from infrastructure.config.postgres import PostgresSettings
 from infrastructure.config.redis import RedisConfig
+from infrastructure.data_access.pool import InstrumentedAsyncPool
+from infrastructure.http.session_pool import HttpSessionPool
 
 
 def redis_client_factory(config: RedisConfig, with_cache: bool) -> Redis | None:
@@ -25,8 +28,57 @@ def redis_client_factory(config: RedisConfig, with_cache: bool) -> Redis | None:
     )
 
 
-def create_db_engine(url: str, echo: bool = False) -> AsyncEngine:
-    return create_async_engine(url=url, echo=echo)
+def redis_pubsub_client_factory(config: RedisConfig, with_cache: bool) -> Redis | None:
+    """
+    Отдельный клиент под pub/sub: подписка держит соединение открытым
+    и простаивает, поэтому socket_timeout обычных команд к ней неприменим.
+    """
+    if not with_cache:
+        return None
+    return Redis(
+        host=config.host,
+        port=config.port,
+        socket_connect_timeout=config.socket_connect_timeout,
+        socket_timeout=None,
+        health_check_interval=30,
+    )
+
+
+def create_db_engine(config: PostgresSettings, name: str = "primary") -> AsyncEngine:
+    """name - метка пула в логах и метриках Prometheus."""
+    return _create_engine(config.url, config, name)
+
+
+def create_replica_engine(
+    config: PostgresSettings, primary: AsyncEngine
+) -> AsyncEngine:
+    """Движок реплики для чтений; без replica_url - тот же primary."""
+    if not config.replica_url:
+        return primary
+    return _create_engine(config.replica_url, config, "replica")
+
+
+def _create_engine(url: str, config: PostgresSettings, name: str) -> AsyncEngine:
+    return create_async_engine(
+        url=url,
+        echo=config.echo,
+        poolclass=InstrumentedAsyncPool,
+        pool_logging_name=name,
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        pool_timeout=config.pool_timeout,
+        pool_recycle=config.pool_recycle,
+        pool_pre_ping=config.pool_pre_ping,
+        connect_args={
+            "statement_cache_size": config.statement_cache_size,
+            "prepared_statement_cache_size": config.prepared_statement_cache_size,
+        },
+    )
+
+
+def create_autocommit_engine(engine: AsyncEngine) -> AsyncEngine:
+    """Тот же пул соединений, но без транзакций - для чтений."""
+    return engine.execution_options(isolation_level="AUTOCOMMIT")
 
 
 def db_sessionmaker(
@@ -51,3 +103,11 @@ def minio_client_factory(config: MinioConfig) -> Minio:
         secret_key=config.secret,
         secure=config.secure,
     )
+
+
+def http_session_pool_factory(config: MinioConfig) -> HttpSessionPool:
+    return HttpSessionPool(
+        limit=config.http_pool_size,
+        limit_per_host=config.http_pool_per_host,
+        keepalive_timeout=config.http_keepalive_timeout,
+    )
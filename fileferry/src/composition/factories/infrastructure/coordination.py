@@ -1,6 +1,7 @@
 from contracts.infrastructure import (
     FileMetaDataAccessContract,
     StorageAccessContract,
+    StorageOutboxContract,
     TransactionManagerContract,
 )
 from infrastructure.coordination.minio_sqla import SqlAlchemyMinioCoordinator
@@ -10,7 +11,11 @@ def sql_minio_coordinator_factory(
     transaction: TransactionManagerContract,
     storage: StorageAccessContract,
     data_access: FileMetaDataAccessContract,
+    outbox: StorageOutboxContract,
 ) -> SqlAlchemyMinioCoordinator:
     return SqlAlchemyMinioCoordinator(
-        transaction=transaction, storage=storage, data_access=data_access
+        transaction=transaction,
+        storage=storage,
+        data_access=data_access,
+        outbox=outbox,
     )
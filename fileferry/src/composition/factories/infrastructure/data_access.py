@@ -1,12 +1,22 @@
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
 from contracts.infrastructure import (
     CacheInvalidatorContract,
     FileMetaCacheStorageContract,
     FileMetaDataAccessContract,
+    FileMetaReaderContract,
     FireAndForgetTasksContract,
+    InvalidationBusContract,
     TransactionContextContract,
 )
-from infrastructure.data_access.alchemy import SQLAlchemyFileMetaDataAccess
+from domain.models import FileMeta
+from infrastructure.data_access.alchemy import (
+    SQLAlchemyFileMetaDataAccess,
+    SQLAlchemyFileMetaReader,
+)
+from infrastructure.data_access.outbox import SQLAlchemyStorageOutbox
 from infrastructure.data_access.redis import CachedFileMetaDataAccess
+from infrastructure.utils.single_flight import SingleFlight
 
 
 def cache_aside_factory(
@@ -15,6 +25,11 @@ def cache_aside_factory(
     invalidator: CacheInvalidatorContract,
     sql_data_access: FileMetaDataAccessContract,
     ttl: int = 300,
+    negative_ttl: int = 30,
+    bus: InvalidationBusContract | None = None,
+    flight: SingleFlight[FileMeta] | None = None,
+    stale_ttl: int = 0,
+    refresher: FileMetaReaderContract | None = None,
 ) -> CachedFileMetaDataAccess:
     return CachedFileMetaDataAccess(
         scheduler=scheduler,
@@ -22,6 +37,11 @@ def cache_aside_factory(
         storage=redis_storage,
         invalidator=invalidator,
         ttl=ttl,
+        negative_ttl=negative_ttl,
+        bus=bus,
+        flight=flight,
+        stale_ttl=stale_ttl,
+        refresher=refresher,
     )
 
 
@@ -31,6 +51,18 @@ def sql_filemeta_data_access_factory(
     return SQLAlchemyFileMetaDataAccess(context)
 
 
+def sql_storage_outbox_factory(
+    context: TransactionContextContract,
+) -> SQLAlchemyStorageOutbox:
+    return SQLAlchemyStorageOutbox(context)
+
+
+def sql_filemeta_reader_factory(
+    sessionmaker: async_sessionmaker[AsyncSession],
+) -> SQLAlchemyFileMetaReader:
+    return SQLAlchemyFileMetaReader(sessionmaker)
+
+
 def resolve_data_access(
     with_cache: bool,
     scheduler: FireAndForgetTasksContract | None,
@@ -38,6 +70,11 @@ def resolve_data_access(
     invalidator: CacheInvalidatorContract | None,
     sql_data_access: SQLAlchemyFileMetaDataAccess,
     ttl: int = 300,
+    negative_ttl: int = 30,
+    bus: InvalidationBusContract | None = None,
+    flight: SingleFlight[FileMeta] | None = None,
+    stale_ttl: int = 0,
+    refresher: FileMetaReaderContract | None = None,
 ) -> CachedFileMetaDataAccess | SQLAlchemyFileMetaDataAccess:
     if not invalidator or not redis_storage or not with_cache or not scheduler:
         return sql_data_access
@@ -47,4 +84,9 @@ def resolve_data_access(
         redis_storage=redis_storage,
         invalidator=invalidator,
         ttl=ttl,
+        negative_ttl=negative_ttl,
+        bus=bus,
+        flight=flight,
+        stale_ttl=stale_ttl,
+        refresher=refresher,
     )
@@ -1,17 +1,55 @@
 from miniopy_async import Minio
 from redis.asyncio import Redis
 
+from infrastructure.http.session_pool import HttpSessionPool
+from infrastructure.storage.codecs import resolve_codec
+from infrastructure.storage.memory import (
+    LocalFileMetaCache,
+    TieredFileMetaCacheStorage,
+)
 from infrastructure.storage.minio import MiniOStorage
 from infrastructure.storage.redis import RedisFileMetaCacheStorage
 
 
-def minio_storage_factory(client: Minio) -> MiniOStorage:
-    return MiniOStorage(client=client)
+def minio_storage_factory(
+    client: Minio, part_size: int, parts_in_flight: int, http_pool: HttpSessionPool
+) -> MiniOStorage:
+    return MiniOStorage(
+        client=client,
+        part_size=part_size,
+        parts_in_flight=parts_in_flight,
+        http_pool=http_pool,
+    )
 
 
 def redis_cache_storage_factory(
-    with_cache: bool, client: Redis, prefix: str = "file:meta:"
+    with_cache: bool,
+    client: Redis,
+    prefix: str = "file:meta:",
+    codec: str = "binary",
+    ttl_jitter: float = 0.0,
+    early_refresh: float = 0.0,
 ) -> RedisFileMetaCacheStorage | None:
     if not with_cache:
         return None
-    return RedisFileMetaCacheStorage(client=client, prefix=prefix)
+    return RedisFileMetaCacheStorage(
+        client=client,
+        prefix=prefix,
+        codec=resolve_codec(codec),
+        ttl_jitter=ttl_jitter,
+        early_refresh=early_refresh,
+    )
+
+
+def local_cache_factory(max_entries: int, ttl: float) -> LocalFileMetaCache:
+    return LocalFileMetaCache(max_entries=max_entries, ttl=ttl)
+
+
+def tiered_cache_storage_factory(
+    local: LocalFileMetaCache, remote: RedisFileMetaCacheStorage | None
+) -> TieredFileMetaCacheStorage | RedisFileMetaCacheStorage | None:
+    if remote is None:
+        return None
+    if not local.enabled:
+        return remote
+    return TieredFileMetaCacheStorage(local=local, remote=remote)
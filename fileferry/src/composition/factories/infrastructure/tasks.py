@@ -1,10 +1,25 @@
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Optional
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
 from contracts.infrastructure import (
     FileMetaCacheStorageContract,
+    FileMetaReaderContract,
     ImportantTaskManagerContract,
+    StorageAccessContract,
 )
+from infrastructure.config.minio import MinioConfig
+from infrastructure.storage.memory import LocalFileMetaCache
 from infrastructure.tasks.consistence import CacheInvalidator
+from infrastructure.tasks.invalidation_bus import RedisInvalidationBus
 from infrastructure.tasks.manager import ImportantTaskManager, NoOpImportantTaskManager
+from infrastructure.tasks.orphan_sweeper import OrphanSweeper, SweepCheckpoint
+from infrastructure.tasks.outbox_relay import StorageOutboxRelay
 from infrastructure.tasks.scheduler import AsyncioFireAndForget
+from shared.enums import Buckets
 
 
 def task_manager_factory(
@@ -31,3 +46,45 @@ def cache_invalidator_factory(
     return CacheInvalidator(
         cache_storage=storage, task_manager=manager, retry_interval=retry_interval
     )
+
+
+def invalidation_bus_factory(
+    client: Redis | None, local: LocalFileMetaCache, channel: str
+) -> RedisInvalidationBus | None:
+    if client is None or not local.enabled:
+        return None
+    return RedisInvalidationBus(client=client, local=local, channel=channel)
+
+
+def outbox_relay_factory(
+    sessionmaker: async_sessionmaker[AsyncSession],
+    storage: StorageAccessContract,
+    config: MinioConfig,
+) -> StorageOutboxRelay:
+    return StorageOutboxRelay(
+        sessionmaker=sessionmaker,
+        storage=storage,
+        interval=config.outbox_relay_interval,
+        batch_size=config.outbox_batch_size,
+        upload_grace=config.outbox_upload_grace,
+    )
+
+
+def orphan_sweeper_factory(
+    storage: StorageAccessContract,
+    reader: FileMetaReaderContract,
+    buckets: Sequence[Buckets] = tuple(Buckets),
+    remove: bool = False,
+    grace: float = 86400.0,
+    rate: float = 5000.0,
+    checkpoint: Optional[Path] = None,
+) -> OrphanSweeper:
+    return OrphanSweeper(
+        storage=storage,
+        reader=reader,
+        buckets=buckets,
+        remove=remove,
+        grace=grace,
+        rate=rate,
+        checkpoint=SweepCheckpoint(checkpoint) if checkpoint else None,
+    )
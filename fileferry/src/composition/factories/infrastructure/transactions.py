@@ -1,14 +1,30 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from composition.factories.infrastructure.clients import create_autocommit_engine
 from contracts.infrastructure import TransactionContextContract
 from infrastructure.tx.context import SqlAlchemyTransactionContext
 from infrastructure.tx.manager import TransactionManager
+from infrastructure.tx.routing import ReadRouter
 
 
 def create_transaction_context(
     session_factory: AsyncSession,
+    router: Optional[ReadRouter] = None,
 ) -> SqlAlchemyTransactionContext:
-    return SqlAlchemyTransactionContext(session=session_factory)
+    return SqlAlchemyTransactionContext(session=session_factory, router=router)
+
+
+def read_router_factory(
+    primary: AsyncEngine, replica: AsyncEngine, sticky_seconds: float = 5.0
+) -> ReadRouter:
+    """replica - движок из create_replica_engine: тот же primary, если реплики нет."""
+    return ReadRouter(
+        primary=create_autocommit_engine(primary),
+        replica=None if replica is primary else create_autocommit_engine(replica),
+        sticky_seconds=sticky_seconds,
+    )
 
 
 def create_transaction_manager(
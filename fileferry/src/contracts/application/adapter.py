@@ -1,8 +1,9 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from typing import Optional, Protocol
 
 from domain.models import FileId, FileMeta, FileName
-from shared.enums import Buckets
+from shared.enums import BatchDeleteStatus, Buckets
+from shared.io.byte_range import ByteRange, RangeSpec
 
 
 class ApplicationAdapterContract(Protocol):
@@ -14,6 +15,7 @@ class ApplicationAdapterContract(Protocol):
         name: FileName,
         stream: AsyncIterator[bytes],
         bucket: Buckets,
+        size: Optional[int] = None,
     ) -> FileMeta: ...
 
     async def retrieve(
@@ -23,6 +25,20 @@ class ApplicationAdapterContract(Protocol):
         bucket: Buckets,
     ) -> tuple[FileMeta, AsyncIterator[bytes]]: ...
 
+    async def retrieve_meta(self, *, file_id: FileId) -> FileMeta: ...
+
+    async def retrieve_meta_batch(
+        self, *, file_ids: Sequence[FileId]
+    ) -> list[FileMeta]: ...
+
+    async def retrieve_range(
+        self,
+        *,
+        file_id: FileId,
+        bucket: Buckets,
+        ranges: Sequence[RangeSpec],
+    ) -> tuple[FileMeta, list[tuple[ByteRange, AsyncIterator[bytes]]]]: ...
+
     async def delete(
         self,
         *,
@@ -30,6 +46,13 @@ class ApplicationAdapterContract(Protocol):
         bucket: Buckets,
     ) -> None: ...
 
+    async def delete_batch(
+        self,
+        *,
+        file_ids: Sequence[FileId],
+        bucket: Buckets,
+    ) -> dict[str, BatchDeleteStatus]: ...
+
     async def update(
         self,
         *,
@@ -37,4 +60,5 @@ class ApplicationAdapterContract(Protocol):
         file_id: FileId,
         name: FileName,
         stream: Optional[AsyncIterator[bytes]] = None,
+        size: Optional[int] = None,
     ) -> FileMeta: ...
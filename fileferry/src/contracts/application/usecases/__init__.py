@@ -1,13 +1,25 @@
 from contracts.application.usecases.delete import DeleteUseCaseContract
+from contracts.application.usecases.delete_batch import DeleteBatchUseCaseContract
 from contracts.application.usecases.healthcheck import HealthCheckUseCaseContract
 from contracts.application.usecases.retrieve import RetrieveUseCaseContract
+from contracts.application.usecases.retrieve_meta import RetrieveMetaUseCaseContract
+from contracts.application.usecases.retrieve_meta_batch import (
+    RetrieveMetaBatchUseCaseContract,
+)
+from contracts.application.usecases.retrieve_range import (
+    RetrieveRangeUseCaseContract,
+)
 from contracts.application.usecases.snapshot import SnapshotUseCaseContract
 from contracts.application.usecases.update import UpdateUseCaseContract
 from contracts.application.usecases.upload import UploadUseCaseContract
 
 __all__ = (
+    "DeleteBatchUseCaseContract",
     "DeleteUseCaseContract",
     "HealthCheckUseCaseContract",
+    "RetrieveMetaBatchUseCaseContract",
+    "RetrieveMetaUseCaseContract",
+    "RetrieveRangeUseCaseContract",
     "RetrieveUseCaseContract",
     "SnapshotUseCaseContract",
     "UpdateUseCaseContract",
@@ -0,0 +1,11 @@
+from collections.abc import Sequence
+from typing import Protocol
+
+from domain.models import FileId
+from shared.enums import BatchDeleteStatus, Buckets
+
+
+class DeleteBatchUseCaseContract(Protocol):
+    async def execute(
+        self, file_ids: Sequence[FileId], bucket: Buckets
+    ) -> dict[str, BatchDeleteStatus]: ...
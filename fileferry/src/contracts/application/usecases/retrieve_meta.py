@@ -0,0 +1,7 @@
+from typing import Protocol
+
+from domain.models import FileId, FileMeta
+
+
+class RetrieveMetaUseCaseContract(Protocol):
+    async def execute(self, file_id: FileId) -> FileMeta: ...
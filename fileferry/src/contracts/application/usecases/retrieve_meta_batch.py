@@ -0,0 +1,8 @@
+from collections.abc import Sequence
+from typing import Protocol
+
+from domain.models import FileId, FileMeta
+
+
+class RetrieveMetaBatchUseCaseContract(Protocol):
+    async def execute(self, file_ids: Sequence[FileId]) -> list[FileMeta]: ...
@@ -0,0 +1,12 @@
+from collections.abc import AsyncIterator, Sequence
+from typing import Protocol
+
+from domain.models import FileId, FileMeta
+from shared.enums import Buckets
+from shared.io.byte_range import ByteRange, RangeSpec
+
+
+class RetrieveRangeUseCaseContract(Protocol):
+    async def execute(
+        self, file_id: FileId, bucket: Buckets, ranges: Sequence[RangeSpec]
+    ) -> tuple[FileMeta, list[tuple[ByteRange, AsyncIterator[bytes]]]]: ...
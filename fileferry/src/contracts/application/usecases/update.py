@@ -12,4 +12,5 @@ class UpdateUseCaseContract(Protocol):
         name: FileName,
         stream: Optional[AsyncIterator[bytes]],
         bucket: Buckets,
+        size: Optional[int] = None,
     ) -> FileMeta: ...
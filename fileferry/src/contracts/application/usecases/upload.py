@@ -1,5 +1,5 @@
 from collections.abc import AsyncIterator
-from typing import Protocol
+from typing import Optional, Protocol
 
 from domain.models import FileMeta, FileName
 from shared.enums import Buckets
@@ -7,5 +7,9 @@ from shared.enums import Buckets
 
 class UploadUseCaseContract(Protocol):
     async def execute(
-        self, name: FileName, stream: AsyncIterator[bytes], bucket: Buckets
+        self,
+        name: FileName,
+        stream: AsyncIterator[bytes],
+        bucket: Buckets,
+        size: Optional[int] = None,
     ) -> FileMeta: ...
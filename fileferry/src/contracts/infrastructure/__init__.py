@@ -3,14 +3,18 @@ from contracts.infrastructure.coordination import (
 )
 from contracts.infrastructure.data.data_access import (
     FileMetaDataAccessContract,
+    FileMetaReaderContract,
 )
+from contracts.infrastructure.data.outbox import StorageOutboxContract
 from contracts.infrastructure.data.storage import (
     FileMetaCacheStorageContract,
     StorageAccessContract,
 )
 from contracts.infrastructure.helper import FileHelperContract
 from contracts.infrastructure.tasks.consistence import CacheInvalidatorContract
+from contracts.infrastructure.tasks.invalidation import InvalidationBusContract
 from contracts.infrastructure.tasks.manager import ImportantTaskManagerContract
+from contracts.infrastructure.tasks.outbox import OutboxRelayContract
 from contracts.infrastructure.tasks.scheduler import FireAndForgetTasksContract
 from contracts.infrastructure.tx.transaction import TransactionContextContract
 from contracts.infrastructure.tx.transaction_manager import TransactionManagerContract
@@ -20,10 +24,14 @@ __all__ = (
     "FileHelperContract",
     "FileMetaCacheStorageContract",
     "FileMetaDataAccessContract",
+    "FileMetaReaderContract",
     "FireAndForgetTasksContract",
     "ImportantTaskManagerContract",
+    "InvalidationBusContract",
     "OperationCoordinationContract",
+    "OutboxRelayContract",
     "StorageAccessContract",
+    "StorageOutboxContract",
     "TransactionContextContract",
     "TransactionManagerContract",
 )
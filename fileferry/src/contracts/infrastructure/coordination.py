@@ -3,6 +3,7 @@ from typing import Optional, Protocol
 from contracts.infrastructure.data.data_access import (
     FileMetaDataAccessContract,
 )
+from contracts.infrastructure.data.outbox import StorageOutboxContract
 from contracts.infrastructure.data.storage import StorageAccessContract
 
 
@@ -10,12 +11,19 @@ class OperationCoordinationContract(Protocol):
     """
     Координатор действий для контроля Application слоя
     над работой с базой и хранилищем.
-    Проксирует data_access и file_storage наружу.
+    Проксирует data_access, file_storage и outbox наружу.
     Реализует интерфейсы подтверждения изменений и их отката.
+    file_storage можно использовать и вне атомарной операции: передача
+    файла не должна держать открытой транзакцию БД.
     """
 
     data_access: FileMetaDataAccessContract
     file_storage: StorageAccessContract
+    outbox: StorageOutboxContract
+
+    def read(self) -> "OperationCoordinationContract":
+        """Следующая операция - только чтение, без явной транзакции."""
+        ...
 
     async def __aenter__(self) -> "OperationCoordinationContract":
         """Начинает атомарную операцию."""
@@ -1,4 +1,5 @@
 # contracts/infrastructure/data_access.py
+from collections.abc import AsyncIterator, Sequence
 from typing import Any, Protocol
 
 from domain.models import FileMeta
@@ -38,14 +39,64 @@ class FileMetaDataAccessContract(DataAccessContract, Protocol):
         """Получить FileMeta по ID."""
         ...
 
+    async def get_many(self, file_ids: Sequence[str]) -> list[FileMeta]:
+        """
+        Получить FileMeta пачкой. Возвращает только найденные записи
+        в порядке file_ids, без повторов.
+        """
+        ...
+
     async def save(self, file_meta: FileMeta) -> FileMeta:
         """Сохранить FileMeta."""
         ...
 
-    async def delete(self, file_id: str) -> None:
-        """Удалить FileMeta по ID."""
+    async def delete(self, file_id: str) -> str:
+        """Удалить FileMeta по ID, возвращает ключ объекта удалённой записи."""
+        ...
+
+    async def delete_many(self, file_ids: Sequence[str]) -> dict[str, str]:
+        """
+        Удалить FileMeta пачкой. Возвращает id реально удалённых записей
+        с ключами их объектов.
+        """
         ...
 
     async def update(self, meta: FileMeta) -> FileMeta:
-        """Обновить FileMeta"""
+        """Обновить FileMeta (ключ объекта не меняется)."""
+        ...
+
+    async def rename(self, file_id: str, name: str) -> FileMeta:
+        """
+        Сменить только имя файла, возвращает запись из БД.
+        Размер, тип и контрольная сумма не переписываются.
+        """
+        ...
+
+    async def set_object_key(self, file_id: str, object_key: str) -> str:
+        """
+        Перевести запись на объект object_key, возвращает прежний ключ.
+        Строка блокируется до конца транзакции, так что прежний ключ
+        у параллельных замен не совпадёт.
+        """
+        ...
+
+
+class FileMetaReaderContract(Protocol):
+    """
+    Чтение FileMeta вне транзакции запроса, в собственной сессии.
+    Нужно фоновым задачам, которым нельзя делить сессию с запросом.
+    """
+
+    async def get(self, file_id: str) -> FileMeta:
+        """Получить FileMeta по ID."""
+        ...
+
+    def iter_keys(
+        self, *, after: str = "", page_size: int = 1000
+    ) -> AsyncIterator[str]:
+        """
+        Ключи объектов всех файлов после after в байтовом порядке
+        (как ключи S3), keyset-пагинацией по page_size, каждая страница
+        в своей сессии.
+        """
         ...
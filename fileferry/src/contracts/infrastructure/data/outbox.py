@@ -0,0 +1,44 @@
+from collections.abc import Sequence
+from typing import Protocol
+
+from shared.enums import Buckets, OutboxOperation
+
+
+class StorageOutboxContract(Protocol):
+    """
+    Outbox операций над объектами хранилища.
+    Записи делаются в текущей транзакции БД: вместе с изменением files
+    они либо фиксируются, либо откатываются.
+    """
+
+    async def add(
+        self,
+        *,
+        operation: OutboxOperation,
+        object_keys: Sequence[str],
+        bucket: Buckets,
+        delay: float = 0.0,
+    ) -> None:
+        """
+        Записывает отложенную операцию по каждому ключу.
+        delay - сколько секунд relay не берёт записи.
+        """
+        ...
+
+    async def resolve(
+        self, *, operation: OutboxOperation, object_key: str, bucket: Buckets
+    ) -> None:
+        """
+        Снимает запись: операция завершена самим запросом.
+        Если запись уже забрал relay - OperationalError.
+        """
+        ...
+
+    async def touch(
+        self, *, operation: OutboxOperation, object_key: str, bucket: Buckets
+    ) -> None:
+        """
+        Продлевает запись: операция ещё идёт, relay не должен счесть
+        её брошенной. Если запись уже забрал relay - OperationalError.
+        """
+        ...
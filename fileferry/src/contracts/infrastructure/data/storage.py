@@ -1,9 +1,11 @@
 # contracts/infrastructure/storage_access.py
-from collections.abc import AsyncIterator
-from typing import Any, Protocol
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, Optional, Protocol
 
 from domain.models import FileMeta
+from infrastructure.types.cache import CachedFileMeta
 from infrastructure.types.health import ComponentStatus
+from infrastructure.types.storage import StoredObject
 from shared.enums import Buckets
 
 
@@ -16,14 +18,65 @@ class StorageAccessContract(Protocol):
         """Загружает файл в хранилище."""
         ...
 
-    async def retrieve(self, *, file_id: str, bucket: Buckets) -> AsyncIterator[bytes]:
-        """Извлекает файл из хранилища."""
+    def version_key(self, file_id: str) -> str:
+        """Новый уникальный ключ объекта для очередной версии содержимого file_id."""
+        ...
+
+    async def stage(
+        self,
+        *,
+        file_meta: FileMeta,
+        stream: AsyncIterator[bytes],
+        bucket: Buckets,
+        object_key: str,
+    ) -> None:
+        """
+        Загружает новое содержимое файла в отдельный объект object_key.
+        Текущий объект file_meta не затрагивается.
+        """
+        ...
+
+    async def upload_stream(
+        self,
+        *,
+        file_id: str,
+        content_type: str,
+        stream: AsyncIterator[bytes],
+        bucket: Buckets,
+        max_size: Optional[int] = None,
+    ) -> int:
+        """
+        Загружает поток неизвестной длины, возвращает число записанных байт.
+        Поток длиннее max_size обрывается с EntityTooLargeError, уже
+        записанное при этом удаляется.
+        """
+        ...
+
+    async def retrieve(
+        self, *, file_id: str, bucket: Buckets, offset: int = 0, length: int = 0
+    ) -> AsyncIterator[bytes]:
+        """Извлекает файл (или length байт начиная с offset) из хранилища."""
         ...
 
     async def delete(self, *, file_id: str, bucket: Buckets) -> None:
         """Удаляет файл из хранилища."""
         ...
 
+    async def delete_many(
+        self, *, file_ids: Sequence[str], bucket: Buckets
+    ) -> dict[str, str]:
+        """
+        Удаляет файлы одним запросом, возвращает {id: код ошибки}
+        для объектов, которые удалить не удалось.
+        """
+        ...
+
+    def list_objects(
+        self, *, bucket: Buckets, start_after: str = ""
+    ) -> AsyncIterator[StoredObject]:
+        """Все объекты бакета после start_after в порядке ключей (байтовом)."""
+        ...
+
     async def healthcheck(self) -> ComponentStatus:
         """Проверка состояния."""
         ...
@@ -51,13 +104,43 @@ class FileMetaCacheStorageContract(CacheStorageContract, Protocol):
     """Конракт для работы с FileMeta кэш-хранилищем."""
 
     async def get(self, file_id: str) -> FileMeta | None:
-        """Получить FileMeta кэш по ID"""
+        """
+        Получить FileMeta кэш по ID.
+        Для id, закэшированного как отсутствующий, - NoResultFoundError.
+        """
+        ...
+
+    async def get_entry(self, file_id: str) -> CachedFileMeta | None:
+        """
+        Получить FileMeta кэш по ID вместе с остатком ttl записи
+        (одним обращением к хранилищу).
+        """
+        ...
+
+    async def get_many(self, file_ids: Sequence[str]) -> dict[str, FileMeta | None]:
+        """
+        Получить FileMeta кэш пачкой (одним обращением к хранилищу).
+        В ответе только попадания: FileMeta или None для id, закэшированных
+        как несуществующие. Отсутствующий в ответе id - промах.
+        """
         ...
 
     async def set(self, meta: FileMeta, ttl: int) -> None:
         """Установить FileMeta в кэш"""
         ...
 
+    async def set_many(self, metas: Sequence[FileMeta], ttl: int) -> None:
+        """Установить пачку FileMeta в кэш (одним обращением к хранилищу)."""
+        ...
+
     async def delete(self, file_id: str) -> None:
         """Удалить кэш FileMeta по ID"""
         ...
+
+    async def delete_many(self, file_ids: Sequence[str]) -> None:
+        """Удалить кэш FileMeta пачкой (одним обращением к хранилищу)."""
+        ...
+
+    async def set_missing(self, file_id: str, ttl: int) -> None:
+        """Запомнить, что FileMeta с таким ID нет (негативный кэш)"""
+        ...
@@ -1,9 +1,24 @@
 from collections.abc import AsyncIterator
-from typing import Protocol
+from typing import Optional, Protocol
+
+from shared.io.peekable_stream import ClosableStream
 
 
 class FileHelperContract(Protocol):
-    @staticmethod
     async def analyze(
+        self,
+        stream: AsyncIterator[bytes],
+        size: Optional[int] = None,
+    ) -> tuple[ClosableStream, str, int]:
+        """
+        Определяет mime и размер. Возвращённый поток нужно дочитать
+        или закрыть (aclose): он держит спул прочитанных наперёд данных.
+        """
+        ...
+
+    async def sniff(
+        self,
         stream: AsyncIterator[bytes],
-    ) -> tuple[AsyncIterator[bytes], str, int]: ...
+    ) -> tuple[ClosableStream, str]:
+        """Определяет только mime; поток, как и в analyze, нужно закрыть."""
+        ...
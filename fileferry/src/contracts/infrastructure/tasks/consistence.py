@@ -1,4 +1,5 @@
 import asyncio
+from collections.abc import Sequence
 from typing import Protocol
 
 
@@ -8,3 +9,7 @@ class CacheInvalidatorContract(Protocol):
     async def invalidate(
         self, file_id: str, max_retry_seconds: int
     ) -> asyncio.Event: ...
+
+    async def invalidate_many(
+        self, file_ids: Sequence[str], max_retry_seconds: int
+    ) -> asyncio.Event: ...
@@ -0,0 +1,9 @@
+from typing import Protocol
+
+
+class InvalidationBusContract(Protocol):
+    """Контракт шины инвалидации локальных кэшей между воркерами."""
+
+    def publish(self, file_id: str) -> None: ...
+    async def start(self) -> None: ...
+    async def stop(self) -> None: ...
@@ -0,0 +1,9 @@
+from typing import Protocol
+
+
+class OutboxRelayContract(Protocol):
+    """Контракт фонового исполнителя outbox-операций хранилища."""
+
+    async def relay_once(self) -> int: ...
+    async def start(self) -> None: ...
+    async def stop(self) -> None: ...
@@ -6,7 +6,7 @@ class TransactionContextContract(Protocol):
 
     _session: Any  # тип сессии не задан явно, здесь может быть что угодно.
 
-    async def begin(self) -> None: ...
+    async def begin(self, read_only: bool = False) -> None: ...
     async def commit(self) -> None: ...
     async def rollback(self) -> None: ...
     async def close(self) -> None: ...
@@ -11,9 +11,7 @@ class TransactionManagerContract(Protocol):
 
     _context: TransactionContextContract
 
-    async def start(
-        self,
-    ) -> None: ...
+    async def start(self, read_only: bool = False) -> None: ...
 
     async def end(self) -> None: ...
 
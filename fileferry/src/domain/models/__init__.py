@@ -1,7 +1,14 @@
 from domain.models.dataclasses import FileMeta
-from domain.models.value_objects import ContentType, FileId, FileName, FileSize
+from domain.models.value_objects import (
+    Checksum,
+    ContentType,
+    FileId,
+    FileName,
+    FileSize,
+)
 
 __all__ = (
+    "Checksum",
     "ContentType",
     "FileId",
     "FileMeta",
@@ -6,12 +6,20 @@ from shared.exceptions.application import InvalidFileParameters
 
 
 def create_filemeta(
-    file_id: Optional[str], name: str, size: int, content_type: str
+    file_id: Optional[str],
+    name: str,
+    size: int,
+    content_type: str,
+    checksum: Optional[str] = None,
 ) -> FileMeta:
     try:
         file_id = file_id or FileId.new().value
         return FileMeta.from_raw(
-            id=file_id, name=name, size=size, content_type=content_type
+            id=file_id,
+            name=name,
+            size=size,
+            content_type=content_type,
+            checksum=checksum,
         )
     except ValueError as exc:
         raise InvalidFileParameters("Unprocessable entity") from exc
@@ -1,6 +1,14 @@
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
 
-from domain.models.value_objects import ContentType, FileId, FileName, FileSize
+from domain.models.value_objects import (
+    Checksum,
+    ContentType,
+    FileId,
+    FileName,
+    FileSize,
+)
 
 
 @dataclass(slots=True, frozen=True)
@@ -9,6 +17,9 @@ class FileMeta:
     _name: FileName
     _content_type: ContentType
     _size: FileSize
+    _checksum: Optional[Checksum] = None
+    _updated_at: Optional[datetime] = None
+    _object_key: Optional[str] = None  # None - объект лежит под id
 
     def get_id(self) -> str:
         return self._id.value
@@ -22,11 +33,32 @@ class FileMeta:
     def get_size(self) -> int:
         return self._size.value
 
+    def get_checksum(self) -> Optional[str]:
+        return self._checksum.value if self._checksum else None
+
+    def get_updated_at(self) -> Optional[datetime]:
+        return self._updated_at
+
+    def get_object_key(self) -> str:
+        return self._object_key or self._id.value
+
     @classmethod
-    def from_raw(cls, id: str, name: str, content_type: str, size: int) -> "FileMeta":
+    def from_raw(
+        cls,
+        id: str,
+        name: str,
+        content_type: str,
+        size: int,
+        checksum: Optional[str] = None,
+        updated_at: Optional[datetime] = None,
+        object_key: Optional[str] = None,
+    ) -> "FileMeta":
         return cls(
             _id=FileId(id),
             _name=FileName(name),
             _content_type=ContentType(content_type),
             _size=FileSize(size),
+            _checksum=Checksum(checksum) if checksum else None,
+            _updated_at=updated_at,
+            _object_key=object_key,
         )
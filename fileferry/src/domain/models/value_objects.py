@@ -1,10 +1,13 @@
+import re
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import Generic, Self, TypeVar
 
 T = TypeVar("T")
 
+_SHA256_HEX = re.compile(r"[0-9a-f]{64}")  # hexdigest(): только нижний регистр
+
 
 @dataclass(frozen=True)
 class DomainValueObject(ABC, Generic[T]):
@@ -14,6 +17,16 @@ class DomainValueObject(ABC, Generic[T]):
     def value(self) -> T:
         return self._value
 
+    @classmethod
+    def unchecked(cls, value: T) -> Self:
+        """
+        Создание без __post_init__. Только для данных, которые сервис
+        сам провалидировал и записал (например, собственный кэш).
+        """
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "_value", value)
+        return instance
+
     @abstractmethod
     def __post_init__(self) -> None:  # pragma: no cover
         pass
@@ -67,3 +80,16 @@ class FileSize(DomainValueObject[int]):
             raise ValueError("File size must be an integer")
         if self._value <= 0:
             raise ValueError("File size must be positive")
+
+
+@dataclass(frozen=True)
+class Checksum(DomainValueObject[str]):
+    """SHA-256 содержимого файла в hex-представлении."""
+
+    _value: str
+
+    def __post_init__(self) -> None:
+        if not isinstance(self._value, str) or not _SHA256_HEX.fullmatch(  # type: ignore
+            self._value
+        ):
+            raise ValueError("Checksum must be a 64-char hex string")
@@ -1,3 +1,4 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
@@ -10,6 +11,20 @@ class MinioConfig(BaseSettings):
     secret: str
     endpoint: str
     secure: bool
+    # размер части потоковой загрузки; compose_object отвергает части
+    # меньше 5 MiB (кроме последней), и ошибка всплыла бы лишь после передачи
+    multipart_part_size: int = Field(default=16 * 1024 * 1024, ge=5 * 1024 * 1024)
+    multipart_parts_in_flight: int = 4  # сколько частей грузим параллельно
+    http_pool_size: int = 100  # соединений в общей сессии скачивания
+    http_pool_per_host: int = 0  # 0 - без ограничения на хост
+    http_keepalive_timeout: float = 30.0  # секунд держим простаивающее соединение
+    outbox_relay_interval: float = 1.0  # секунд между проходами outbox relay
+    outbox_batch_size: int = 500  # записей outbox за один проход
+    # через сколько секунд без продления загрузка брошена
+    outbox_upload_grace: float = 3600.0
+    # сколько секунд прежняя версия живёт после замены содержимого: не меньше
+    # local_cache_ttl плюс самое долгое скачивание
+    outbox_version_grace: float = 3600.0
 
     class Config:
         env_file = "minio.env"
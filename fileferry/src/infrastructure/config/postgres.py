@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 
@@ -19,9 +21,29 @@ class DBSettings(BaseSettings):
 
 class PostgresSettings(DBSettings):
     """
-    Подкласс конфига DB для PostgreSQL
+    Подкласс конфига DB для PostgreSQL.
+    Пул на процесс: pool_size постоянных соединений и до max_overflow
+    сверх них; запрос ждёт свободное соединение не дольше pool_timeout
+    секунд. pool_recycle - через сколько секунд соединение переоткрывается
+    (-1 - никогда), pool_pre_ping - проверка соединения перед выдачей.
+    statement_cache_size - кэш prepared statements самого asyncpg,
+    prepared_statement_cache_size - кэш SQLAlchemy поверх него;
+    за pgbouncer в transaction-режиме оба должны быть 0.
+    replica_url - DSN реплики для чтений (postgresql+asyncpg://...), пусто -
+    всё читается с primary. replica_sticky_seconds - сколько секунд после
+    записи клиент читает с primary, пока реплика догоняет.
     """
 
+    pool_size: int = 10
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_cache_size: int = 100
+    prepared_statement_cache_size: int = 100
+    replica_url: Optional[str] = None
+    replica_sticky_seconds: float = 5.0
+
     class Config:
         env_prefix = "POSTGRES_"
         env_file = "postgres.env"
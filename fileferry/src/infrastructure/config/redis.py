@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -16,6 +18,14 @@ class RedisConfig(BaseSettings):
     )
     cache_prefix: str  # по этому префикс будет лежать кэш
     cache_ttl: int  # ttl кэша в секундах
+    cache_codec: Literal["json", "binary"] = "binary"  # формат записей FileMeta
+    cache_ttl_jitter: float = 0.1  # до какой доли ttl случайно укорачивать записи
+    cache_early_refresh: float = 0.0  # XFetch delta, секунды; 0 - выключено
+    negative_cache_ttl: int = 30  # сколько помнить несуществующие id, 0 - не помнить
+    cache_stale_ttl: int = 0  # stale-while-revalidate поверх cache_ttl, 0 - выключен
+    local_cache_size: int = 10_000  # записей в L1-кэше воркера, 0 - без L1
+    local_cache_ttl: float = 5.0  # сколько L1 может отставать от Redis, секунды
+    invalidation_channel: str = "fileferry:invalidate"  # канал шины инвалидации L1
 
     class Config:
         env_prefix = "REDIS_"
@@ -4,6 +4,7 @@ from contracts.infrastructure import (
     FileMetaDataAccessContract,
     OperationCoordinationContract,
     StorageAccessContract,
+    StorageOutboxContract,
     TransactionManagerContract,
 )
 
@@ -15,6 +16,11 @@ class SqlAlchemyMinioCoordinator(OperationCoordinationContract):
     любым SQLAlchemy DataAccess.
     В силу особенностей SQLAlchemy также инкапсулирует работу с сессией,
     начиная и завершая её в контексте.
+    read() - режим чтения: следующий вход в контекст идёт без явной транзакции
+    (autocommit). file_storage доступен и вне контекста: долгие передачи в
+    хранилище не должны держать соединение с БД.
+    Откат транзакции хранилище не трогает: что делать с объектом после
+    сбоя, решают записи outbox, зафиксированные вместе с данными.
     """
 
     def __init__(
@@ -23,13 +29,21 @@ class SqlAlchemyMinioCoordinator(OperationCoordinationContract):
         transaction: TransactionManagerContract,
         storage: StorageAccessContract,
         data_access: FileMetaDataAccessContract,
+        outbox: StorageOutboxContract,
     ) -> None:
         self._transaction = transaction
         self.file_storage = storage
         self.data_access = data_access
+        self.outbox = outbox
+        self._read_only = False
+
+    def read(self) -> "SqlAlchemyMinioCoordinator":
+        self._read_only = True
+        return self
 
     async def __aenter__(self) -> "SqlAlchemyMinioCoordinator":
-        await self._transaction.start()
+        read_only, self._read_only = self._read_only, False
+        await self._transaction.start(read_only=read_only)
         return self
 
     async def __aexit__(
@@ -45,11 +59,11 @@ class SqlAlchemyMinioCoordinator(OperationCoordinationContract):
         await self._transaction.end()
 
     async def commit(self) -> None:
-        """Фиксация базы данных и staged файлов."""
+        """Фиксация базы данных вместе с записями outbox."""
         if self._transaction:
             await self._transaction.apply()
 
     async def rollback(self) -> None:
-        """Откат базы данных и удаление staged файлов."""
+        """Откат базы данных, объекты доводит до конца outbox relay."""
         if self._transaction:
             await self._transaction.reject()
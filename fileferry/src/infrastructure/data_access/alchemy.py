@@ -1,18 +1,27 @@
 import time
+from collections.abc import AsyncIterator, Sequence
 
-from sqlalchemy import select, text
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import String, any_, bindparam, delete, select, text, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.sql.expression import BindParameter
 
 from contracts.infrastructure import (
     FileMetaDataAccessContract,
+    FileMetaReaderContract,
     TransactionContextContract,
 )
 from domain.models import FileMeta
 from infrastructure.exceptions.handlers.alchemy_handler import wrap_sqlalchemy_failure
-from infrastructure.models.sqlalchemy.file import File
+from infrastructure.models.sqlalchemy.file import File, object_key_expr
 from infrastructure.types.health import ComponentState, ComponentStatus
 
 
+def _id_array(file_ids: list[str]) -> BindParameter[Sequence[str]]:
+    # = ANY(:ids) - один параметр-массив вместо IN на len(ids) параметров
+    return bindparam("ids", value=file_ids, type_=ARRAY(String))
+
+
 class SQLAlchemyFileMetaDataAccess(FileMetaDataAccessContract):
     def __init__(self, context: TransactionContextContract) -> None:
         self._context = context
@@ -26,7 +35,7 @@ class SQLAlchemyFileMetaDataAccess(FileMetaDataAccessContract):
         model = File.from_domain(file_meta)
         self.session.add(model)
         await self.session.flush()
-        return file_meta
+        return model.to_domain()
 
     @wrap_sqlalchemy_failure
     async def get(self, file_id: str) -> FileMeta:
@@ -35,25 +44,73 @@ class SQLAlchemyFileMetaDataAccess(FileMetaDataAccessContract):
         return model.to_domain()
 
     @wrap_sqlalchemy_failure
-    async def delete(self, file_id: str) -> None:
-        query = await self.session.execute(select(File).where(File.id == file_id))
-        model = query.scalar_one()
-        await self.session.delete(model)
-        await self.session.flush()
-        return
+    async def get_many(self, file_ids: Sequence[str]) -> list[FileMeta]:
+        unique = list(dict.fromkeys(file_ids))
+        if not unique:
+            return []
+        # = ANY(:ids) - один параметр-массив вместо IN на len(ids) параметров
+        query = await self.session.execute(
+            select(File).where(File.id == any_(_id_array(unique)))
+        )
+        found = {model.id: model.to_domain() for model in query.scalars()}
+        return [found[file_id] for file_id in unique if file_id in found]
 
     @wrap_sqlalchemy_failure
-    async def update(self, meta: FileMeta) -> FileMeta:
-        query = await self.session.execute(select(File).where(File.id == meta.get_id()))
-        model = query.scalar_one()
+    async def delete(self, file_id: str) -> str:
+        # один DELETE ... RETURNING: нет строки - scalar_one даёт NoResultFound
+        query = await self.session.execute(
+            delete(File).where(File.id == file_id).returning(object_key_expr)
+        )
+        return query.scalar_one()
 
-        model.name = meta.get_name()
-        model.size = meta.get_size()
-        model.mime_type = meta.get_content_type()
+    @wrap_sqlalchemy_failure
+    async def delete_many(self, file_ids: Sequence[str]) -> dict[str, str]:
+        if not file_ids:
+            return {}
+        query = await self.session.execute(
+            delete(File)
+            .where(File.id == any_(_id_array(list(dict.fromkeys(file_ids)))))
+            .returning(File.id, object_key_expr),
+            execution_options={"synchronize_session": False},
+        )
+        return dict(query.tuples().all())
 
-        await self.session.flush()
+    @wrap_sqlalchemy_failure
+    async def update(self, meta: FileMeta) -> FileMeta:
+        # один UPDATE ... RETURNING вместо SELECT + flush; updated_at
+        # проставляет onupdate колонки
+        query = await self.session.execute(
+            update(File)
+            .where(File.id == meta.get_id())
+            .values(
+                name=meta.get_name(),
+                size=meta.get_size(),
+                mime_type=meta.get_content_type(),
+                checksum=meta.get_checksum(),
+            )
+            .returning(File)
+        )
+        return query.scalar_one().to_domain()
 
-        return model.to_domain()
+    @wrap_sqlalchemy_failure
+    async def rename(self, file_id: str, name: str) -> FileMeta:
+        # остальные поля берёт RETURNING из самой строки, а не из кэша
+        query = await self.session.execute(
+            update(File).where(File.id == file_id).values(name=name).returning(File)
+        )
+        return query.scalar_one().to_domain()
+
+    @wrap_sqlalchemy_failure
+    async def set_object_key(self, file_id: str, object_key: str) -> str:
+        # FOR UPDATE: параллельная замена ждёт коммита и увидит уже наш ключ
+        query = await self.session.execute(
+            select(object_key_expr).where(File.id == file_id).with_for_update()
+        )
+        previous = query.scalar_one()
+        await self.session.execute(
+            update(File).where(File.id == file_id).values(object_key=object_key)
+        )
+        return previous
 
     async def healthcheck(self) -> ComponentStatus:
         start = time.perf_counter()
@@ -75,3 +132,42 @@ class SQLAlchemyFileMetaDataAccess(FileMetaDataAccessContract):
             return ComponentStatus(
                 status="down", error=str(exc), details={"version": "unknown"}
             )
+
+
+class SQLAlchemyFileMetaReader(FileMetaReaderContract):
+    """
+    Чтение FileMeta в собственной короткой сессии.
+    Сессия запроса живёт в контексте и не допускает конкурентного
+    использования, поэтому фоновые задачи (обновление кэша) читают здесь.
+    """
+
+    def __init__(self, sessionmaker: async_sessionmaker[AsyncSession]) -> None:
+        self._sessionmaker = sessionmaker
+
+    @wrap_sqlalchemy_failure
+    async def get(self, file_id: str) -> FileMeta:
+        async with self._sessionmaker() as session:
+            query = await session.execute(select(File).where(File.id == file_id))
+            return query.scalar_one().to_domain()
+
+    async def iter_keys(
+        self, *, after: str = "", page_size: int = 1000
+    ) -> AsyncIterator[str]:
+        while True:
+            page = await self._keys_page(after=after, limit=page_size)
+            for object_key in page:
+                yield object_key
+            if len(page) < page_size:
+                return
+            after = page[-1]
+
+    @wrap_sqlalchemy_failure
+    async def _keys_page(self, *, after: str, limit: int) -> list[str]:
+        # COLLATE "C" - байтовый порядок, как у листинга S3;
+        # выражение покрыто индексом ix_files_object_key_c
+        key = object_key_expr.collate("C")
+        async with self._sessionmaker() as session:
+            query = await session.scalars(
+                select(object_key_expr).where(key > after).order_by(key).limit(limit)
+            )
+            return list(query)
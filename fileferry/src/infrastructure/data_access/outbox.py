@@ -0,0 +1,84 @@
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import ColumnElement, delete, func, insert, literal, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from contracts.infrastructure import StorageOutboxContract, TransactionContextContract
+from infrastructure.exceptions.handlers.alchemy_handler import wrap_sqlalchemy_failure
+from infrastructure.models.sqlalchemy.outbox import StorageOutbox
+from shared.enums import Buckets, OutboxOperation
+from shared.exceptions.infrastructure import OperationalError
+
+
+class SQLAlchemyStorageOutbox(StorageOutboxContract):
+    """Outbox операций хранилища в транзакции текущего запроса."""
+
+    def __init__(self, context: TransactionContextContract) -> None:
+        self._context = context
+
+    @property
+    def session(self) -> AsyncSession:
+        return self._context.session
+
+    @wrap_sqlalchemy_failure
+    async def add(
+        self,
+        *,
+        operation: OutboxOperation,
+        object_keys: Sequence[str],
+        bucket: Buckets,
+        delay: float = 0.0,
+    ) -> None:
+        if not object_keys:
+            return
+        row: dict[str, object] = {"operation": operation, "bucket": bucket.value}
+        if delay > 0:
+            row["not_before"] = datetime.now(UTC) + timedelta(seconds=delay)
+        # один INSERT на всю пачку, без ORM-объектов в сессии
+        await self.session.execute(
+            insert(StorageOutbox),
+            [{**row, "object_key": key} for key in object_keys],
+        )
+
+    @wrap_sqlalchemy_failure
+    async def resolve(
+        self, *, operation: OutboxOperation, object_key: str, bucket: Buckets
+    ) -> None:
+        query = await self.session.execute(
+            delete(StorageOutbox)
+            # забранную relay запись снимать уже поздно: объект он удалит
+            .where(*self._unclaimed(operation, object_key, bucket)).returning(
+                StorageOutbox.id
+            )
+        )
+        if query.scalar_one_or_none() is None:
+            # relay уже счёл операцию брошенной и убрал объект
+            raise OperationalError(f"Outbox entry for {object_key} already reclaimed")
+
+    @wrap_sqlalchemy_failure
+    async def touch(
+        self, *, operation: OutboxOperation, object_key: str, bucket: Buckets
+    ) -> None:
+        query = await self.session.execute(
+            update(StorageOutbox)
+            .where(*self._unclaimed(operation, object_key, bucket))
+            .values(touched_at=func.now())
+            .returning(StorageOutbox.id)
+        )
+        if query.scalar_one_or_none() is None:
+            raise OperationalError(f"Outbox entry for {object_key} already reclaimed")
+
+    @staticmethod
+    def _unclaimed(
+        operation: OutboxOperation, object_key: str, bucket: Buckets
+    ) -> tuple[ColumnElement[bool], ...]:
+        """Условие на незабранную relay запись операции по ключу."""
+        return (
+            StorageOutbox.object_key == object_key,
+            StorageOutbox.bucket == bucket.value,
+            # операция - литералом, а не параметром: иначе обобщённый план
+            # подготовленного запроса не сможет взять частичный индекс
+            StorageOutbox.operation == literal(operation.value, literal_execute=True),
+            StorageOutbox.claimed_until.is_(None),
+        )
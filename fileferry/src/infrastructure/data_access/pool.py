@@ -0,0 +1,52 @@
+import time
+from typing import Any
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from monitoring.db_pool import (
+    db_pool_capacity,
+    db_pool_checkout_wait_seconds,
+    db_pool_idle,
+    db_pool_in_use,
+    db_pool_waiting,
+)
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool с метриками Prometheus: занятые и свободные
+    соединения, ожидающие получения запросы и время ожидания.
+    Метка pool - pool_logging_name движка, она же переживает recreate()
+    при dispose движка. Рост waiting и checkout_wait при in_use == capacity
+    означает, что пул упёрся в лимит раньше, чем запросы начнут падать
+    по pool_timeout.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._label = self._orig_logging_name or "default"
+        db_pool_capacity.labels(pool=self._label).set(
+            self.size() + max(self._max_overflow, 0)
+        )
+        self._report()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        waiting = db_pool_waiting.labels(pool=self._label)
+        waiting.inc()
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waiting.dec()
+            db_pool_checkout_wait_seconds.labels(pool=self._label).observe(
+                time.perf_counter() - start
+            )
+            self._report()
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        super()._do_return_conn(record)
+        self._report()
+
+    def _report(self) -> None:
+        db_pool_in_use.labels(pool=self._label).set(self.checkedout())
+        db_pool_idle.labels(pool=self._label).set(self.checkedin())
@@ -1,11 +1,23 @@
+import asyncio
+from collections.abc import Sequence
+from typing import Optional
+
+from loguru import logger
+
 from contracts.infrastructure import (
     CacheInvalidatorContract,
     FileMetaCacheStorageContract,
     FileMetaDataAccessContract,
+    FileMetaReaderContract,
     FireAndForgetTasksContract,
+    InvalidationBusContract,
 )
 from domain.models import FileMeta
+from infrastructure.tx.routing import reading_replica
+from infrastructure.types.cache import CachedFileMeta
 from infrastructure.types.health import ComponentStatus
+from infrastructure.utils.single_flight import SingleFlight
+from shared.exceptions.infrastructure import NoResultFoundError
 
 
 class CachedFileMetaDataAccess(FileMetaDataAccessContract):
@@ -15,7 +27,23 @@ class CachedFileMetaDataAccess(FileMetaDataAccessContract):
     _cache_storage - класс, инкапсулирующий работу с хранилищем кэша.
     _delegate - класс - источник истины, который оборачивает данный класс.
     _cache_ttl - время кэширования
+    _negative_ttl - сколько помнить, что id не существует (0 - не помнить);
+    save() затирает негативную запись, кладя в кэш сохранённую.
     _scheduler - класс, уводящий задачи в background, чтобы не задерживать бизнес-операцию.
+    _bus - шина инвалидации L1-кэшей остальных воркеров (опционально).
+    _flight - общий на процесс SingleFlight: при промахе по одному id в БД
+    идёт один запрос, остальные ждут его результат. Чтения с реплики
+    и с primary схлопываются раздельно.
+    _stale_ttl - режим stale-while-revalidate (0 - выключен). Запись живёт в
+    кэше ttl + stale_ttl секунд; после ttl она отдаётся сразу, а обновление
+    из БД уходит в фон (одно на id). После ttl + stale_ttl запись - промах.
+    _refresher - чтение для фонового обновления в собственной сессии:
+    сессия _delegate принадлежит запросу и переживать его не должна.
+    get_many - один MGET в кэш и один запрос в БД на все промахи; дозапись
+    в кэш уходит в фон одним pipeline. SWR и SingleFlight пачка не использует.
+    Промахи, прочитанные с реплики, в кэш не пишутся (ни найденные, ни
+    негативные): отстающая реплика вернула бы в кэш обновлённую или
+    удалённую строку на весь ttl. Кэш заполняют только чтения с primary.
     """
 
     def __init__(
@@ -25,29 +53,128 @@ class CachedFileMetaDataAccess(FileMetaDataAccessContract):
         scheduler: FireAndForgetTasksContract,
         delegate: FileMetaDataAccessContract,
         ttl: int = 300,
+        negative_ttl: int = 30,
+        bus: Optional[InvalidationBusContract] = None,
+        flight: Optional[SingleFlight[FileMeta]] = None,
+        stale_ttl: int = 0,
+        refresher: Optional[FileMetaReaderContract] = None,
     ) -> None:
         self._delegate = delegate
         self._cache_ttl = ttl
+        self._stale_ttl = stale_ttl if refresher is not None else 0
+        self._refresher = refresher
+        self._negative_ttl = negative_ttl
         self._cache_invalidator = invalidator
         self._cache_storage = storage
         self._scheduler = scheduler
+        self._bus = bus
+        self._flight = flight or SingleFlight()
 
     async def save(self, file_meta: FileMeta) -> FileMeta:
         result = await self._delegate.save(file_meta)
         if result:
             self._scheduler.schedule(
-                self._cache_storage.set(file_meta, ttl=self._cache_ttl)
+                self._cache_storage.set(result, ttl=self._hard_ttl)
             )
+            if self._negative_ttl > 0:
+                # негативная запись могла осесть в L1 других воркеров
+                self._broadcast(result.get_id())
         return result
 
+    @property
+    def _hard_ttl(self) -> int:
+        return self._cache_ttl + self._stale_ttl
+
     async def get(self, file_id: str) -> FileMeta:
+        if self._stale_ttl > 0:
+            return await self._get_or_revalidate(file_id)
         cached = await self._cache_storage.get(file_id)
         if cached:
             return cached
-        result = await self._delegate.get(file_id)
-        if result:
+        return await self._load_once(file_id)
+
+    async def _get_or_revalidate(self, file_id: str) -> FileMeta:
+        entry = await self._cache_storage.get_entry(file_id)
+        if entry is None:
+            return await self._load_once(file_id)
+        if self._is_stale(entry) and not self._flight.running(("refresh", file_id)):
+            self._scheduler.schedule(self._revalidate(file_id))
+        return entry.meta
+
+    def _is_stale(self, entry: CachedFileMeta) -> bool:
+        return entry.expires_in is not None and entry.expires_in <= self._stale_ttl
+
+    async def _revalidate(self, file_id: str) -> None:
+        refresher = self._refresher
+        if refresher is None:
+            return
+        try:
+            await self._flight.do(
+                ("refresh", file_id), lambda: self._refresh(refresher, file_id)
+            )
+        except Exception as exc:
+            logger.warning(f"[CACHE] Revalidation failed for {file_id}: {exc}")
+
+    async def _refresh(
+        self, refresher: FileMetaReaderContract, file_id: str
+    ) -> FileMeta:
+        try:
+            result = await refresher.get(file_id)
+        except NoResultFoundError:
+            # set_missing не перезаписывает ключ, поэтому устаревшую запись удаляем
+            await self._cache_storage.delete(file_id)
+            if self._negative_ttl > 0:
+                await self._cache_storage.set_missing(file_id, ttl=self._negative_ttl)
+            raise
+        await self._cache_storage.set(result, ttl=self._hard_ttl)
+        return result
+
+    async def get_many(self, file_ids: Sequence[str]) -> list[FileMeta]:
+        unique = list(dict.fromkeys(file_ids))
+        cached = await self._cache_storage.get_many(unique) or {}
+        misses = [file_id for file_id in unique if file_id not in cached]
+        loaded = await self._delegate.get_many(misses) if misses else []
+        fill = not reading_replica()
+
+        if loaded and fill:
             self._scheduler.schedule(
-                self._cache_storage.set(result, ttl=self._cache_ttl)
+                self._cache_storage.set_many(loaded, ttl=self._hard_ttl)
+            )
+        found = {meta.get_id(): meta for meta in loaded}
+        absent = [file_id for file_id in misses if file_id not in found]
+        if absent and fill and self._negative_ttl > 0:
+            self._scheduler.schedule(self._remember_missing(absent))
+
+        found.update((k, v) for k, v in cached.items() if v is not None)
+        return [found[file_id] for file_id in unique if file_id in found]
+
+    async def _remember_missing(self, file_ids: Sequence[str]) -> None:
+        await asyncio.gather(
+            *(
+                self._cache_storage.set_missing(file_id, ttl=self._negative_ttl)
+                for file_id in file_ids
+            )
+        )
+
+    async def _load_once(self, file_id: str) -> FileMeta:
+        # маршрут чтения - часть ключа: читающий с primary (после записи)
+        # не должен получить строку, прочитанную ведущим с отстающей реплики
+        return await self._flight.do(
+            (reading_replica(), file_id), lambda: self._load(file_id)
+        )
+
+    async def _load(self, file_id: str) -> FileMeta:
+        try:
+            result = await self._delegate.get(file_id)
+        except NoResultFoundError:
+            if self._negative_ttl > 0 and not reading_replica():
+                self._scheduler.schedule(
+                    self._cache_storage.set_missing(file_id, ttl=self._negative_ttl)
+                )
+            raise
+        if result and not reading_replica():
+            self._scheduler.schedule(
+                self._cache_storage.set(result, ttl=self._hard_ttl)
             )
 
         return result
@@ -56,17 +183,52 @@ class CachedFileMetaDataAccess(FileMetaDataAccessContract):
         result = await self._delegate.update(meta)
         if result:
             await self._cache_invalidator.invalidate(
-                meta.get_id(), max_retry_seconds=self._cache_ttl
+                meta.get_id(), max_retry_seconds=self._hard_ttl
             )
+            self._broadcast(meta.get_id())
 
         return result
 
-    async def delete(self, file_id: str) -> None:
-        await self._delegate.delete(file_id)
+    async def rename(self, file_id: str, name: str) -> FileMeta:
+        result = await self._delegate.rename(file_id, name)
+
+        await self._cache_invalidator.invalidate(
+            file_id, max_retry_seconds=self._hard_ttl
+        )
+        self._broadcast(file_id)
+        return result
+
+    async def set_object_key(self, file_id: str, object_key: str) -> str:
+        previous = await self._delegate.set_object_key(file_id, object_key)
+
+        await self._cache_invalidator.invalidate(
+            file_id, max_retry_seconds=self._hard_ttl
+        )
+        self._broadcast(file_id)
+        return previous
+
+    async def delete(self, file_id: str) -> str:
+        object_key = await self._delegate.delete(file_id)
 
         await self._cache_invalidator.invalidate(
-            file_id, max_retry_seconds=self._cache_ttl
+            file_id, max_retry_seconds=self._hard_ttl
         )
+        self._broadcast(file_id)
+        return object_key
+
+    async def delete_many(self, file_ids: Sequence[str]) -> dict[str, str]:
+        deleted = await self._delegate.delete_many(file_ids)
+        if deleted:
+            await self._cache_invalidator.invalidate_many(
+                list(deleted), max_retry_seconds=self._hard_ttl
+            )
+            for file_id in deleted:
+                self._broadcast(file_id)
+        return deleted
+
+    def _broadcast(self, file_id: str) -> None:
+        if self._bus is not None:
+            self._bus.publish(file_id)
 
     async def healthcheck(self) -> ComponentStatus:
         db = await self._delegate.healthcheck()
@@ -31,6 +31,9 @@ def wrap_s3_failure(func: F) -> F:
             )
             logger.info(f"ERR CODE: {exc.code} - {code}")
             raise InfraErrorMapper.map_code_to_error(code) from exc
+        except StorageError as exc:
+            logger.warning(f"[S3][ERR] Error in {func.__qualname__}: {exc!s}")
+            raise
         except Exception as exc:
             logger.exception(f"[S3][ERR] Error in {func.__qualname__}: {exc!s}")
             raise StorageError(f"Unexpected storage error: {exc!s}") from exc
@@ -8,6 +8,7 @@ from shared.exceptions.infrastructure import (
     DataAccessError,
     DisconnectedError,
     EntityTooLargeError,
+    IncompleteBodyError,
     IntegrityError,
     InternalError,
     InvalidAccessKeyIdError,
@@ -44,6 +45,7 @@ class InfraErrorMapper:
         InvalidRangeError: S3ErrorCode.InvalidRange,
         MalformedXMLStorageError: S3ErrorCode.MalformedXML,
         MissingContentLengthError: S3ErrorCode.MissingContentLength,
+        IncompleteBodyError: S3ErrorCode.IncompleteBody,
         PreconditionFailedError: S3ErrorCode.PreconditionFailed,
         BucketNotEmptyError: S3ErrorCode.BucketNotEmpty,
         #       #       #       #       #       #       #       #
@@ -67,6 +69,7 @@ class InfraErrorMapper:
         "InvalidRangeError": S3ErrorCode.InvalidRange,
         "MalformedXMLStorageError": S3ErrorCode.MalformedXML,
         "MissingContentLengthError": S3ErrorCode.MissingContentLength,
+        "IncompleteBodyError": S3ErrorCode.IncompleteBody,
         "PreconditionFailedError": S3ErrorCode.PreconditionFailed,
         "BucketNotEmptyError": S3ErrorCode.BucketNotEmpty,
         #       #       #       #       #       #       #       #
@@ -91,6 +94,7 @@ class InfraErrorMapper:
         S3ErrorCode.InvalidRange: InvalidRangeError,
         S3ErrorCode.MalformedXML: MalformedXMLStorageError,
         S3ErrorCode.MissingContentLength: MissingContentLengthError,
+        S3ErrorCode.IncompleteBody: IncompleteBodyError,
         S3ErrorCode.PreconditionFailed: PreconditionFailedError,
         S3ErrorCode.BucketNotEmpty: BucketNotEmptyError,
         #       #       #       #       #       #       #       #
@@ -114,6 +118,7 @@ class InfraErrorMapper:
         S3ErrorCode.InvalidRange: "Неверный диапазон для объекта.",
         S3ErrorCode.MalformedXML: "Неправильный формат XML.",
         S3ErrorCode.MissingContentLength: "Отсутствует длина содержимого.",
+        S3ErrorCode.IncompleteBody: "Размер тела запроса не совпадает с заявленным.",
         S3ErrorCode.PreconditionFailed: "Не выполнено условие предварительной проверки.",
         S3ErrorCode.BucketNotEmpty: "Бакет не пуст, невозможно выполнить операцию.",
         #       #       #       #       #       #       #       #       #       #       #
@@ -139,6 +144,7 @@ class InfraErrorMapper:
         S3ErrorCode.InvalidRange: status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,  # 416 для InvalidRange
         S3ErrorCode.MalformedXML: status.HTTP_400_BAD_REQUEST,  # 400 для MalformedXML
         S3ErrorCode.MissingContentLength: status.HTTP_400_BAD_REQUEST,  # 400 для MissingContentLength
+        S3ErrorCode.IncompleteBody: status.HTTP_400_BAD_REQUEST,  # 400 для IncompleteBody
         S3ErrorCode.PreconditionFailed: status.HTTP_412_PRECONDITION_FAILED,  # 412 для PreconditionFailed
         S3ErrorCode.BucketNotEmpty: status.HTTP_409_CONFLICT,  # 409 для BucketNotEmpty
         #       #       #       #       #       #       #       #       #       #       #       #       #
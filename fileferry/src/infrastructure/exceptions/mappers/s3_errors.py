@@ -14,6 +14,7 @@ class S3ErrorCode(StrEnum):
     InvalidRange = "InvalidRange"
     MalformedXML = "MalformedXML"
     MissingContentLength = "MissingContentLength"
+    IncompleteBody = "IncompleteBody"
     PreconditionFailed = "PreconditionFailed"
     BucketNotEmpty = "BucketNotEmpty"
     Unknown = "Unknown"
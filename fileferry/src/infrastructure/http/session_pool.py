@@ -0,0 +1,53 @@
+import aiohttp
+from aiohttp import ClientSession, TCPConnector
+from aiohttp_retry import ExponentialRetry, RetryClient
+
+
+class HttpSessionPool:
+    """
+    Долгоживущая aiohttp-сессия на процесс для скачивания объектов из MiniO.
+    Соединения переиспользуются между запросами (keep-alive), вместо
+    открытия нового TCPConnector на каждый GET.
+    Сессия создаётся лениво внутри работающего event loop и закрывается
+    явно через close() при остановке приложения.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        total_timeout: float = 60.0,
+        retry_attempts: int = 3,
+    ) -> None:
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._total_timeout = total_timeout
+        self._retry_attempts = retry_attempts
+        self._session: RetryClient | None = None
+        self._client: ClientSession | None = None
+
+    def session(self) -> RetryClient:
+        if self._session is None or self._client is None or self._client.closed:
+            self._client = ClientSession(
+                connector=TCPConnector(
+                    limit=self._limit,
+                    limit_per_host=self._limit_per_host,
+                    keepalive_timeout=self._keepalive_timeout,
+                    ssl=False,
+                ),
+                timeout=aiohttp.ClientTimeout(total=self._total_timeout),
+            )
+            self._session = RetryClient(
+                self._client,
+                retry_options=ExponentialRetry(attempts=self._retry_attempts),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+        self._session = None
+        self._client = None
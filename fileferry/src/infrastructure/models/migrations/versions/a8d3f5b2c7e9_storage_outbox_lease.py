@@ -0,0 +1,42 @@
+"""storage outbox lease
+
+Revision ID: a8d3f5b2c7e9
+Revises: f6c9e2a4b1d7
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a8d3f5b2c7e9"
+down_revision: Union[str, None] = "f6c9e2a4b1d7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "storage_outbox",
+        sa.Column(
+            "touched_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "storage_outbox",
+        sa.Column("claimed_until", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("storage_outbox", "claimed_until")
+    op.drop_column("storage_outbox", "touched_at")
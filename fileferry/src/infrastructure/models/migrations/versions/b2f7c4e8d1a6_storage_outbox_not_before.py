@@ -0,0 +1,37 @@
+"""storage outbox not before
+
+Revision ID: b2f7c4e8d1a6
+Revises: a8d3f5b2c7e9
+Create Date: 2026-10-18 23:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b2f7c4e8d1a6"
+down_revision: Union[str, None] = "a8d3f5b2c7e9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "storage_outbox",
+        sa.Column(
+            "not_before",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("storage_outbox", "not_before")
@@ -0,0 +1,29 @@
+"""file checksum
+
+Revision ID: b7d1e4c2a9f3
+Revises: 943204aae8f2
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d1e4c2a9f3"
+down_revision: Union[str, None] = "943204aae8f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("files", sa.Column("checksum", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("files", "checksum")
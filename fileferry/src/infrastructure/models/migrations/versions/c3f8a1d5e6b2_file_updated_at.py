@@ -0,0 +1,32 @@
+"""file updated_at
+
+Revision ID: c3f8a1d5e6b2
+Revises: b7d1e4c2a9f3
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f8a1d5e6b2"
+down_revision: Union[str, None] = "b7d1e4c2a9f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "files",
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("files", "updated_at")
@@ -0,0 +1,34 @@
+"""storage outbox upload key index
+
+Revision ID: c5a9e3d7f2b8
+Revises: b2f7c4e8d1a6
+Create Date: 2026-10-18 23:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5a9e3d7f2b8"
+down_revision: Union[str, None] = "b2f7c4e8d1a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_storage_outbox_upload_key",
+        "storage_outbox",
+        ["object_key", "bucket", "operation"],
+        postgresql_where=sa.text("operation = 'upload'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_storage_outbox_upload_key", table_name="storage_outbox")
@@ -0,0 +1,43 @@
+"""storage outbox
+
+Revision ID: d4a7c9e1f2b3
+Revises: c3f8a1d5e6b2
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4a7c9e1f2b3"
+down_revision: Union[str, None] = "c3f8a1d5e6b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "storage_outbox",
+        sa.Column("id", sa.BigInteger(), sa.Identity(), nullable=False),
+        sa.Column("operation", sa.String(length=16), nullable=False),
+        sa.Column("bucket", sa.String(length=63), nullable=False),
+        sa.Column("object_key", sa.String(length=255), nullable=False),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("storage_outbox")
@@ -0,0 +1,29 @@
+"""files id index in C collation
+
+Revision ID: e5b8d0f3a2c4
+Revises: d4a7c9e1f2b3
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b8d0f3a2c4"
+down_revision: Union[str, None] = "d4a7c9e1f2b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_files_id_c", "files", [sa.text('id COLLATE "C"')])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_files_id_c", table_name="files")
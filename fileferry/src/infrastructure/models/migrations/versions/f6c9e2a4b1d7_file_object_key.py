@@ -0,0 +1,40 @@
+"""file object key
+
+Revision ID: f6c9e2a4b1d7
+Revises: e5b8d0f3a2c4
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f6c9e2a4b1d7"
+down_revision: Union[str, None] = "e5b8d0f3a2c4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "files",
+        sa.Column("object_key", sa.String(length=128), nullable=True),
+    )
+    op.create_index(
+        "ix_files_object_key_c",
+        "files",
+        [sa.text('(COALESCE(object_key, id) COLLATE "C")')],
+    )
+    op.drop_index("ix_files_id_c", table_name="files")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_files_id_c", "files", [sa.text('id COLLATE "C"')])
+    op.drop_index("ix_files_object_key_c", table_name="files")
+    op.drop_column("files", "object_key")
@@ -1,4 +1,5 @@
 from infrastructure.models.sqlalchemy.base import Base
 from infrastructure.models.sqlalchemy.file import File
+from infrastructure.models.sqlalchemy.outbox import StorageOutbox
 
-__all__ = ("Base", "File")
+__all__ = ("Base", "File", "StorageOutbox")
@@ -1,8 +1,11 @@
+from datetime import UTC, datetime
+from typing import Optional
+
 from domain.models.dataclasses import FileMeta
 from infrastructure.models.sqlalchemy.base import Base
 from infrastructure.types.filemeta import ORMFileMeta
 from shared.object_mapping.filemeta import FileMetaMapper
-from sqlalchemy import BigInteger, String
+from sqlalchemy import BigInteger, DateTime, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -16,14 +19,36 @@ class File(Base):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     mime_type: Mapped[str] = mapped_column(String(100), nullable=False)
     size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    checksum: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+    )
+    # ключ объекта в хранилище; NULL - объект лежит под id
+    object_key: Mapped[Optional[str]] = mapped_column(String(128), nullable=True)
 
     def to_domain(self) -> FileMeta:
         return FileMetaMapper.filemeta_from_orm(
             ORMFileMeta(
-                id=self.id, name=self.name, size=self.size, mime_type=self.mime_type
+                id=self.id,
+                name=self.name,
+                size=self.size,
+                mime_type=self.mime_type,
+                checksum=self.checksum,
+                updated_at=self.updated_at,
+                object_key=self.object_key,
             )
         )
 
     @classmethod
     def from_domain(cls, file_meta: FileMeta) -> "File":
         return cls(**FileMetaMapper.filemeta_to_orm(file_meta))
+
+
+# ключ объекта строки: свой object_key или id
+object_key_expr = func.coalesce(File.object_key, File.id)
+
+# keyset-обход ключей объектов в байтовом порядке (сверка с листингом S3)
+Index("ix_files_object_key_c", object_key_expr.collate("C"))
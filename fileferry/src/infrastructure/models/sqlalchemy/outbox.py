@@ -0,0 +1,52 @@
+from datetime import datetime
+from typing import Optional
+
+from infrastructure.models.sqlalchemy.base import Base
+from shared.enums import OutboxOperation
+from sqlalchemy import BigInteger, DateTime, Identity, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class StorageOutbox(Base):
+    """
+    Отложенная операция над объектом хранилища.
+    Пишется в той же транзакции, что и изменение files, и доводится
+    до конца фоновым StorageOutboxRelay.
+    touched_at - последний признак жизни операции: загрузка продлевает его,
+    пока идёт передача. claimed_until - аренда записи relay: пока она
+    не истекла, запись занята и снять её самим запросом уже нельзя.
+    not_before - раньше этого времени relay запись не берёт: прежнюю версию
+    содержимого ещё могут дочитывать.
+    """
+
+    __tablename__ = "storage_outbox"
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    operation: Mapped[str] = mapped_column(String(16), nullable=False)
+    bucket: Mapped[str] = mapped_column(String(63), nullable=False)
+    object_key: Mapped[str] = mapped_column(String(255), nullable=False)
+    attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    touched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    not_before: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    claimed_until: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+
+# resolve()/touch() ищут запись загрузки по ключу на каждой загрузке
+# и каждом продлении; delete-записи по ключу не ищутся
+Index(
+    "ix_storage_outbox_upload_key",
+    StorageOutbox.object_key,
+    StorageOutbox.bucket,
+    StorageOutbox.operation,
+    postgresql_where=StorageOutbox.operation == OutboxOperation.UPLOAD.value,
+)
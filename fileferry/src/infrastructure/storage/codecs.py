@@ -0,0 +1,162 @@
+import json
+import struct
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Optional, Protocol
+
+from domain.models import FileMeta
+from domain.models.value_objects import (
+    Checksum,
+    ContentType,
+    FileId,
+    FileName,
+    FileSize,
+)
+from shared.object_mapping.filemeta import DTOFileMeta, FileMetaMapper
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+class FileMetaCodec(Protocol):
+    """Формат FileMeta в кэше. decode -> None: запись не распознана, это промах."""
+
+    def encode(self, meta: FileMeta) -> bytes: ...
+    def decode(self, raw: bytes) -> Optional[FileMeta]: ...
+
+
+class JsonFileMetaCodec(FileMetaCodec):
+    """Исходный формат: JSON от DTOFileMeta с полной валидацией при чтении."""
+
+    def encode(self, meta: FileMeta) -> bytes:
+        return json.dumps(FileMetaMapper.serialize_filemeta(meta)).encode("utf-8")
+
+    def decode(self, raw: bytes) -> Optional[FileMeta]:
+        serialized_meta = DTOFileMeta(**json.loads(raw.decode("utf-8")))
+        return FileMetaMapper.deserialize_filemeta(serialized_meta)
+
+
+class BinaryFileMetaCodec(FileMetaCodec):
+    """
+    Компактный формат FileMeta с байтом версии в начале.
+
+    v1: version:u8 | id:16 байт UUID | size:u64 | flags:u8 | updated_at:i64 мкс
+        | [checksum:32 байта, если flags & 1] | name_len:u16 | name
+        | ctype_len:u16 | content_type  (little-endian, строки в UTF-8)
+    v2: v1 | key_len:u16 | object_key - только для записей, чей объект
+        лежит не под id; старые читатели видят незнакомую версию и
+        идут в БД, а не к объекту по id.
+
+    Чтение распознаёт и JSON (записи до перехода и id не в hex-форме),
+    неизвестная версия - промах: так кэш переживает rolling upgrade
+    в обе стороны. trusted=True пропускает валидацию value objects:
+    кэш пишет только сам сервис, и всё записанное уже проходило проверку.
+    """
+
+    VERSION = 1
+    VERSION_WITH_KEY = 2
+    _HEADER = struct.Struct("<B16sQBq")
+    _LENGTH = struct.Struct("<H")
+    _HAS_CHECKSUM = 0b01
+    _HAS_UPDATED_AT = 0b10
+
+    def __init__(self, trusted: bool = True) -> None:
+        self._trusted = trusted
+        self._json = JsonFileMetaCodec()
+
+    def encode(self, meta: FileMeta) -> bytes:
+        file_id = uuid.UUID(meta.get_id())
+        if file_id.hex != meta.get_id():
+            # сырые 16 байт не вернут исходное написание id
+            return self._json.encode(meta)
+
+        flags = 0
+        checksum = meta.get_checksum()
+        if checksum:
+            flags |= self._HAS_CHECKSUM
+        updated_at = meta.get_updated_at()
+        micros = 0
+        if updated_at is not None:
+            flags |= self._HAS_UPDATED_AT
+            if updated_at.tzinfo is None:
+                updated_at = updated_at.replace(tzinfo=UTC)
+            micros = (updated_at - _EPOCH) // timedelta(microseconds=1)
+
+        name = meta.get_name().encode("utf-8")
+        content_type = meta.get_content_type().encode("utf-8")
+        object_key = meta.get_object_key()
+        version = self.VERSION
+        tail = b""
+        if object_key != meta.get_id():
+            version = self.VERSION_WITH_KEY
+            key = object_key.encode("utf-8")
+            tail = self._LENGTH.pack(len(key)) + key
+        return b"".join(
+            (
+                self._HEADER.pack(
+                    version, file_id.bytes, meta.get_size(), flags, micros
+                ),
+                bytes.fromhex(checksum) if checksum else b"",
+                self._LENGTH.pack(len(name)),
+                name,
+                self._LENGTH.pack(len(content_type)),
+                content_type,
+                tail,
+            )
+        )
+
+    def decode(self, raw: bytes) -> Optional[FileMeta]:
+        if raw[:1] == b"{":
+            return self._json.decode(raw)
+        if raw[:1] not in (bytes((self.VERSION,)), bytes((self.VERSION_WITH_KEY,))):
+            return None
+
+        version, id_bytes, size, flags, micros = self._HEADER.unpack_from(raw)
+        offset = self._HEADER.size
+        checksum = None
+        if flags & self._HAS_CHECKSUM:
+            checksum = raw[offset : offset + 32].hex()
+            offset += 32
+        name, offset = self._read_str(raw, offset)
+        content_type, offset = self._read_str(raw, offset)
+        object_key = None
+        if version == self.VERSION_WITH_KEY:
+            object_key, _ = self._read_str(raw, offset)
+        updated_at = (
+            _EPOCH + timedelta(microseconds=micros)
+            if flags & self._HAS_UPDATED_AT
+            else None
+        )
+        file_id = uuid.UUID(bytes=id_bytes).hex
+
+        if not self._trusted:
+            return FileMeta.from_raw(
+                id=file_id,
+                name=name,
+                content_type=content_type,
+                size=size,
+                checksum=checksum,
+                updated_at=updated_at,
+                object_key=object_key,
+            )
+        return FileMeta(
+            _id=FileId.unchecked(file_id),
+            _name=FileName.unchecked(name),
+            _content_type=ContentType.unchecked(content_type),
+            _size=FileSize.unchecked(size),
+            _checksum=Checksum.unchecked(checksum) if checksum else None,
+            _updated_at=updated_at,
+            _object_key=object_key,
+        )
+
+    def _read_str(self, raw: bytes, offset: int) -> tuple[str, int]:
+        (length,) = self._LENGTH.unpack_from(raw, offset)
+        offset += self._LENGTH.size
+        return raw[offset : offset + length].decode("utf-8"), offset + length
+
+
+def resolve_codec(name: str) -> FileMetaCodec:
+    if name == "json":
+        return JsonFileMetaCodec()
+    if name == "binary":
+        return BinaryFileMetaCodec()
+    raise ValueError(f"Unknown cache codec: {name}")
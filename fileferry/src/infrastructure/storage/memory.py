@@ -0,0 +1,173 @@
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Final, Optional, Union
+
+from contracts.infrastructure import FileMetaCacheStorageContract
+from domain.models import FileMeta
+from infrastructure.types.cache import CachedFileMeta
+from infrastructure.types.health.component_health import ComponentStatus
+from shared.exceptions.infrastructure import NoResultFoundError
+
+
+class _Missing:
+    """Маркер id, закэшированного как отсутствующий."""
+
+
+_MISSING: Final = _Missing()
+
+
+class LocalFileMetaCache:
+    """
+    Ограниченный LRU-кэш FileMeta внутри процесса (L1).
+    Хранит готовые доменные объекты: попадание не требует ни сети,
+    ни десериализации. Каждая запись живёт не дольше ttl секунд -
+    это верхняя граница рассинхронизации между воркерами.
+    Отсутствующие id хранятся маркером: get() для них бросает
+    NoResultFoundError, как и источник истины.
+    Не потокобезопасен: рассчитан на один event loop.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: float = 5.0) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Union[FileMeta, _Missing]]] = (
+            OrderedDict()
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0 and self._ttl > 0
+
+    def get(self, file_id: str) -> Optional[FileMeta]:
+        entry = self._entries.get(file_id)
+        if entry is None:
+            return None
+        expires_at, meta = entry
+        if expires_at <= time.monotonic():
+            del self._entries[file_id]
+            return None
+        self._entries.move_to_end(file_id)
+        if isinstance(meta, _Missing):
+            raise NoResultFoundError(f"File {file_id} is cached as missing")
+        return meta
+
+    def set(self, meta: FileMeta, ttl: Optional[float] = None) -> None:
+        self._put(meta.get_id(), meta, ttl)
+
+    def set_missing(self, file_id: str, ttl: Optional[float] = None) -> None:
+        self._put(file_id, _MISSING, ttl)
+
+    def _put(
+        self, file_id: str, value: Union[FileMeta, _Missing], ttl: Optional[float]
+    ) -> None:
+        if not self.enabled:
+            return
+        ttl = self._ttl if ttl is None else min(ttl, self._ttl)
+        self._entries[file_id] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(file_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def evict(self, file_id: str) -> None:
+        self._entries.pop(file_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TieredFileMetaCacheStorage(FileMetaCacheStorageContract):
+    """
+    Двухуровневое кэш-хранилище FileMeta: L1 в памяти процесса поверх
+    общего для всех воркеров L2 (Redis).
+    get сначала смотрит в L1, промах идёт в L2 и прогревает L1.
+    Попадание в L1 считается свежим: его ttl заведомо короче мягкого ttl L2.
+    Негативный ответ L2 (NoResultFoundError) тоже запоминается в L1.
+    delete вычищает L1 немедленно и только затем идёт в L2, поэтому
+    инвалидация через CacheInvalidator снимает запись и с этого воркера.
+    """
+
+    def __init__(
+        self, local: LocalFileMetaCache, remote: FileMetaCacheStorageContract
+    ) -> None:
+        self._local = local
+        self._remote = remote
+
+    async def get(self, file_id: str) -> Optional[FileMeta]:
+        meta = self._local.get(file_id)
+        if meta is not None:
+            return meta
+        try:
+            meta = await self._remote.get(file_id)
+        except NoResultFoundError:
+            self._local.set_missing(file_id)
+            raise
+        if meta is not None:
+            self._local.set(meta)
+        return meta
+
+    async def get_entry(self, file_id: str) -> Optional[CachedFileMeta]:
+        meta = self._local.get(file_id)
+        if meta is not None:
+            return CachedFileMeta(meta)
+        try:
+            entry = await self._remote.get_entry(file_id)
+        except NoResultFoundError:
+            self._local.set_missing(file_id)
+            raise
+        if entry is not None:
+            self._local.set(entry.meta, ttl=entry.expires_in)
+        return entry
+
+    async def get_many(self, file_ids: Sequence[str]) -> dict[str, Optional[FileMeta]]:
+        found: dict[str, Optional[FileMeta]] = {}
+        remote_ids: list[str] = []
+        for file_id in file_ids:
+            try:
+                meta = self._local.get(file_id)
+            except NoResultFoundError:
+                found[file_id] = None
+                continue
+            if meta is None:
+                remote_ids.append(file_id)
+            else:
+                found[file_id] = meta
+        if not remote_ids:
+            return found
+
+        remote = await self._remote.get_many(remote_ids) or {}
+        for file_id, meta in remote.items():
+            if meta is None:
+                self._local.set_missing(file_id)
+            else:
+                self._local.set(meta)
+        found.update(remote)
+        return found
+
+    async def set_many(self, metas: Sequence[FileMeta], ttl: int) -> None:
+        for meta in metas:
+            self._local.set(meta, ttl=ttl)
+        await self._remote.set_many(metas, ttl=ttl)
+
+    async def set_missing(self, file_id: str, ttl: int) -> None:
+        self._local.set_missing(file_id, ttl=ttl)
+        await self._remote.set_missing(file_id, ttl=ttl)
+
+    async def set(self, meta: FileMeta, ttl: int) -> None:
+        self._local.set(meta, ttl=ttl)
+        await self._remote.set(meta, ttl=ttl)
+
+    async def delete(self, file_id: str) -> None:
+        self._local.evict(file_id)
+        await self._remote.delete(file_id)
+
+    async def delete_many(self, file_ids: Sequence[str]) -> None:
+        for file_id in file_ids:
+            self._local.evict(file_id)
+        await self._remote.delete_many(file_ids)
+
+    async def healthcheck(self) -> ComponentStatus:
+        return await self._remote.healthcheck()
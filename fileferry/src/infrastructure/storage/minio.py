@@ -1,42 +1,228 @@
+import asyncio
+import contextlib
+import io
 import time
-from collections.abc import AsyncIterator
+import uuid
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from typing import Optional
 
+from aiohttp_retry import RetryClient
 from miniopy_async import Minio
+from miniopy_async.commonconfig import ComposeSource
+from miniopy_async.deleteobjects import DeleteObject
 from miniopy_async.error import S3Error
 
 from contracts.infrastructure import StorageAccessContract
 from domain.models import FileMeta
 from infrastructure.exceptions.handlers.s3_handler import wrap_s3_failure
 from infrastructure.http.create_clientsession import create_client_session
+from infrastructure.http.session_pool import HttpSessionPool
 from infrastructure.types.health.component_health import ComponentStatus
+from infrastructure.types.storage import StoredObject
 from infrastructure.utils.stream_reader import AsyncStreamReader
 from shared.enums import Buckets
+from shared.exceptions.infrastructure import EntityTooLargeError
+
+DEFAULT_PART_SIZE = 16 * 1024 * 1024  # S3 требует минимум 5 MiB на часть
+DEFAULT_PARTS_IN_FLIGHT = 4
+MAX_PARTS = 10000  # предел частей multipart-загрузки и источников compose
+LIST_PAGE_SIZE = 1000  # столько ключей S3 отдаёт за один ListObjectsV2
+STAGING_PREFIX = "staging/"  # временные объекты, ещё не привязанные к метаданным
 
 
 class MiniOStorage(StorageAccessContract):
-    def __init__(self, client: Minio) -> None:
+    """
+    Хранилище файлов поверх MiniO.
+    part_size и parts_in_flight задают потоковую загрузку: размер одной части
+    и сколько частей одновременно держим в памяти и в сети. Части уходят
+    временными объектами и собираются в итоговый через compose_object.
+    Публичного multipart API у клиента нет, и за это платим: compose
+    копирует каждый байт на сервере второй раз (UploadPartCopy), так что
+    дисковый ввод-вывод хранилища вдвое больше, чем у multipart-загрузки.
+    Части, кроме последней, должны быть не меньше 5 MiB - иначе compose
+    отвергнет их уже после передачи (см. MinioConfig.multipart_part_size).
+    http_pool - общая на процесс сессия для скачивания; без неё на каждый
+    retrieve открывается и закрывается отдельная сессия.
+    """
+
+    def __init__(
+        self,
+        client: Minio,
+        part_size: int = DEFAULT_PART_SIZE,
+        parts_in_flight: int = DEFAULT_PARTS_IN_FLIGHT,
+        http_pool: Optional[HttpSessionPool] = None,
+    ) -> None:
         self._client = client
+        self._part_size = part_size
+        self._parts_in_flight = parts_in_flight
+        self._http_pool = http_pool
 
     @wrap_s3_failure
     async def upload(
         self, *, file_meta: FileMeta, stream: AsyncIterator[bytes], bucket: Buckets
     ) -> None:
-        stream_reader = AsyncStreamReader(stream)
+        await self._put(
+            object_name=file_meta.get_id(),
+            file_meta=file_meta,
+            stream=stream,
+            bucket=bucket,
+        )
+
+    def version_key(self, file_id: str) -> str:
+        return f"{file_id}.{uuid.uuid4().hex}"
+
+    def _staging_prefix(self, file_id: str) -> str:
+        return f"{STAGING_PREFIX}{file_id}/{uuid.uuid4().hex}"
+
+    @wrap_s3_failure
+    async def stage(
+        self,
+        *,
+        file_meta: FileMeta,
+        stream: AsyncIterator[bytes],
+        bucket: Buckets,
+        object_key: str,
+    ) -> None:
+        await self._put(
+            object_name=object_key, file_meta=file_meta, stream=stream, bucket=bucket
+        )
+
+    async def _put(
+        self,
+        *,
+        object_name: str,
+        file_meta: FileMeta,
+        stream: AsyncIterator[bytes],
+        bucket: Buckets,
+    ) -> None:
+        stream_reader = AsyncStreamReader(stream, expected_size=file_meta.get_size())
         await self._client.put_object(
             bucket_name=bucket.value,
-            object_name=file_meta.get_id(),
+            object_name=object_name,
             length=file_meta.get_size(),
             content_type=file_meta.get_content_type(),
             data=stream_reader,  # type: ignore
         )
-        return
 
     @wrap_s3_failure
-    async def retrieve(self, *, file_id: str, bucket: Buckets) -> AsyncIterator[bytes]:
+    async def upload_stream(
+        self,
+        *,
+        file_id: str,
+        content_type: str,
+        stream: AsyncIterator[bytes],
+        bucket: Buckets,
+        max_size: Optional[int] = None,
+    ) -> int:
+        reader = AsyncStreamReader(stream, max_size=max_size)
+        data = await reader.read(self._part_size)
+        if len(data) < self._part_size:
+            # поток уместился в одну часть - multipart не нужен
+            await self._client.put_object(
+                bucket_name=bucket.value,
+                object_name=file_id,
+                length=len(data),
+                content_type=content_type,
+                data=io.BytesIO(data),
+            )
+            return len(data)
+
+        keys: list[str] = []
+        try:
+            size = await self._upload_parts(
+                reader=reader,
+                first_part=data,
+                prefix=self._staging_prefix(file_id),
+                keys=keys,
+                bucket=bucket,
+            )
+            # сборка на стороне сервера: UploadPartCopy по каждой части
+            await self._client.compose_object(
+                bucket.value,
+                file_id,
+                [ComposeSource(bucket.value, key) for key in keys],
+                metadata={"Content-Type": content_type},
+            )
+        finally:
+            # не удалось убрать - части лежат под staging/, их снимет свипер
+            if keys:
+                with contextlib.suppress(S3Error, OSError):
+                    await self._client.remove_objects(
+                        bucket.value, [DeleteObject(key) for key in keys]
+                    )
+        return size
+
+    async def _upload_parts(
+        self,
+        *,
+        reader: AsyncStreamReader,
+        first_part: bytes,
+        prefix: str,
+        keys: list[str],
+        bucket: Buckets,
+    ) -> int:
+        """
+        Читает поток частями по part_size и отправляет их параллельно
+        отдельными временными объектами prefix/NNNNN, ключи копит в keys.
+        Слот занимается до чтения следующей части, поэтому в памяти
+        одновременно не больше parts_in_flight частей. Лимит размера
+        проверяет reader по мере чтения.
+        """
+        slots = asyncio.Semaphore(self._parts_in_flight)
+        tasks: list[asyncio.Task[None]] = []
+
+        async def send(key: str, data: bytes) -> None:
+            try:
+                await self._client.put_object(
+                    bucket_name=bucket.value,
+                    object_name=key,
+                    length=len(data),
+                    data=io.BytesIO(data),
+                )
+            finally:
+                slots.release()
+
+        size = 0
+        data = first_part
+        await slots.acquire()
+        try:
+            while data:
+                if len(keys) == MAX_PARTS:
+                    raise EntityTooLargeError(
+                        f"Stream exceeds {MAX_PARTS} parts of {self._part_size} bytes"
+                    )
+                size += len(data)
+                keys.append(f"{prefix}/{len(keys) + 1:05d}")
+                tasks.append(asyncio.create_task(send(keys[-1], data)))
+                await slots.acquire()
+                if any(task.done() and task.exception() for task in tasks):
+                    slots.release()
+                    break
+                data = await reader.read(self._part_size)
+                if not data:
+                    slots.release()
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return size
+
+    @wrap_s3_failure
+    async def retrieve(
+        self, *, file_id: str, bucket: Buckets, offset: int = 0, length: int = 0
+    ) -> AsyncIterator[bytes]:
         async def stream() -> AsyncIterator[bytes]:
-            async with create_client_session() as session:
+            async with self._session() as session:
                 response = await self._client.get_object(
-                    bucket_name=bucket, object_name=file_id, session=session
+                    bucket_name=bucket,
+                    object_name=file_id,
+                    session=session,
+                    offset=offset,
+                    length=length,
                 )
                 async with response:
                     async for chunk in response.content.iter_chunked(4096):
@@ -44,10 +230,66 @@ class MiniOStorage(StorageAccessContract):
 
         return stream()
 
+    @asynccontextmanager
+    async def _session(self) -> AsyncGenerator[RetryClient, None]:
+        if self._http_pool is not None:
+            yield self._http_pool.session()
+            return
+        async with create_client_session() as session:
+            yield session
+
     @wrap_s3_failure
     async def delete(self, *, file_id: str, bucket: Buckets) -> None:
         await self._client.remove_object(bucket.value, file_id)
 
+    @wrap_s3_failure
+    async def delete_many(
+        self, *, file_ids: Sequence[str], bucket: Buckets
+    ) -> dict[str, str]:
+        if not file_ids:
+            return {}
+        # remove_objects сам режет список на запросы по 1000 ключей
+        errors = await self._client.remove_objects(
+            bucket.value, [DeleteObject(file_id) for file_id in file_ids]
+        )
+        # ошибка без ключа не привязать к объекту - такой ответ S3 не даёт
+        return {error.name: error.code for error in errors if error.name is not None}
+
+    async def list_objects(
+        self, *, bucket: Buckets, start_after: str = ""
+    ) -> AsyncIterator[StoredObject]:
+        # постранично: ошибка листинга всплывает из _list_page уже
+        # смапленной, а не посреди итерации клиента
+        while True:
+            page = await self._list_page(bucket=bucket, start_after=start_after)
+            for obj in page:
+                yield obj
+            if len(page) < LIST_PAGE_SIZE:
+                return
+            start_after = page[-1].key
+
+    @wrap_s3_failure
+    async def _list_page(
+        self, *, bucket: Buckets, start_after: str
+    ) -> list[StoredObject]:
+        page: list[StoredObject] = []
+        async for obj in self._client.list_objects(
+            bucket.value, recursive=True, start_after=start_after or None
+        ):
+            if obj.object_name is None:
+                continue  # в рекурсивном листинге префиксов нет
+            page.append(
+                StoredObject(
+                    obj.object_name,
+                    obj.size or 0,
+                    # без даты считаем объект свежим: свипер его не тронет
+                    obj.last_modified or datetime.now(UTC),
+                )
+            )
+            if len(page) == LIST_PAGE_SIZE:
+                break
+        return page
+
     async def healthcheck(self) -> ComponentStatus:
         start = time.perf_counter()
         try:
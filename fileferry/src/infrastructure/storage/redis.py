@@ -1,5 +1,7 @@
-import json
+import math
+import random
 import time
+from collections.abc import Sequence
 from typing import Any, Optional
 
 from redis.asyncio import Redis
@@ -7,49 +9,150 @@ from redis.asyncio import Redis
 from contracts.infrastructure import FileMetaCacheStorageContract
 from domain.models import FileMeta
 from infrastructure.exceptions.handlers.redis_handler import wrap_redis_failure
+from infrastructure.storage.codecs import BinaryFileMetaCodec, FileMetaCodec
+from infrastructure.types.cache import CachedFileMeta
 from infrastructure.types.health.component_health import ComponentStatus
-from shared.object_mapping.filemeta import DTOFileMeta, FileMetaMapper
+from shared.exceptions.infrastructure import NoResultFoundError
+
+MISSING_MARKER = b"!missing"  # ни один из форматов codecs так не начинается
 
 
 class RedisFileMetaCacheStorage(FileMetaCacheStorageContract):
     """
     Кэш-хранилище FileMeta в реализации через Redis.
     Инкапсулирует работу с Redis клиентом, реализует FileMetaCacheStorageContract.
+    Отсутствующие id хранятся под тем же ключом маркером MISSING_MARKER,
+    поэтому set() сохранённой записи сам затирает негативный кэш.
+    Формат значения задаёт codec (см. infrastructure.storage.codecs).
+    ttl_jitter - доля ttl, на которую случайно укорачивается каждая запись,
+    чтобы прогретые одной волной ключи не истекали одновременно.
+    early_refresh - оценка времени пересчёта записи в секундах (delta из
+    XFetch, 0 - выключено): чем ближе запись к истечению, тем вероятнее get
+    ответит промахом заранее, и пересчёт размажется по времени.
     """
 
-    def __init__(self, client: Redis, prefix: str) -> None:
+    def __init__(
+        self,
+        client: Redis,
+        prefix: str,
+        codec: Optional[FileMetaCodec] = None,
+        ttl_jitter: float = 0.0,
+        early_refresh: float = 0.0,
+    ) -> None:
         self._client = client
         self._prefix = prefix
+        self._codec = codec or BinaryFileMetaCodec()
+        self._ttl_jitter = min(max(ttl_jitter, 0.0), 1.0)
+        self._early_refresh = max(early_refresh, 0.0)
 
     def key(self, file_id: str) -> str:
         return f"{self._prefix}:{file_id}"
 
     @wrap_redis_failure("get")
     async def get(self, file_id: str) -> Optional[FileMeta]:
+        if self._early_refresh > 0:
+            entry = await self._get_entry(file_id)
+            if entry is None or self._refresh_early(entry.expires_in):
+                return None
+            return entry.meta
+
         key = self.key(file_id)
         raw = await self._client.get(key)
+        if raw == MISSING_MARKER:
+            raise NoResultFoundError(f"File {file_id} is cached as missing")
         if raw:
             return self.deserialize_meta(raw)
 
+    @wrap_redis_failure("get")
+    async def get_entry(self, file_id: str) -> Optional[CachedFileMeta]:
+        entry = await self._get_entry(file_id)
+        if entry is not None and self._refresh_early(entry.expires_in):
+            # запись ещё жива: вызывающий отдаст её и обновит в фоне
+            return CachedFileMeta(entry.meta, expires_in=0.0)
+        return entry
+
+    async def _get_entry(self, file_id: str) -> Optional[CachedFileMeta]:
+        key = self.key(file_id)
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.pttl(key)
+            raw, pttl = await pipe.execute()
+        if raw == MISSING_MARKER:
+            raise NoResultFoundError(f"File {file_id} is cached as missing")
+        if not raw:
+            return None
+        meta = self.deserialize_meta(raw)
+        if meta is None:
+            return None
+        return CachedFileMeta(meta, expires_in=pttl / 1000 if pttl > 0 else None)
+
+    @wrap_redis_failure("get_many")
+    async def get_many(self, file_ids: Sequence[str]) -> dict[str, Optional[FileMeta]]:
+        if not file_ids:
+            return {}
+        raws = await self._client.mget([self.key(file_id) for file_id in file_ids])
+        found: dict[str, Optional[FileMeta]] = {}
+        for file_id, raw in zip(file_ids, raws, strict=True):
+            if raw == MISSING_MARKER:
+                found[file_id] = None
+            elif raw and (meta := self.deserialize_meta(raw)) is not None:
+                found[file_id] = meta
+        return found
+
+    def _refresh_early(self, expires_in: Optional[float]) -> bool:
+        """XFetch: пересчитать, если delta * -ln(U) дотягивается до истечения."""
+        if self._early_refresh <= 0 or expires_in is None:
+            return False
+        u = 1.0 - random.random()  # noqa: S311
+        return self._early_refresh * -math.log(u) >= expires_in
+
+    def _jittered(self, ttl: int) -> int:
+        if self._ttl_jitter <= 0:
+            return ttl
+        cut = random.random() * self._ttl_jitter  # noqa: S311
+        return max(1, round(ttl * (1.0 - cut)))
+
     @wrap_redis_failure("set")
     async def set(self, meta: FileMeta, ttl: int) -> None:
         key = self.key(meta.get_id())
         value = self.serialize_meta(meta)
-        await self._client.set(name=key, value=value, ex=ttl)
+        await self._client.set(name=key, value=value, ex=self._jittered(ttl))
+
+    @wrap_redis_failure("set_many")
+    async def set_many(self, metas: Sequence[FileMeta], ttl: int) -> None:
+        if not metas:
+            return
+        async with self._client.pipeline(transaction=False) as pipe:
+            for meta in metas:
+                pipe.set(
+                    name=self.key(meta.get_id()),
+                    value=self.serialize_meta(meta),
+                    ex=self._jittered(ttl),
+                )
+            await pipe.execute()
+
+    @wrap_redis_failure("set_missing")
+    async def set_missing(self, file_id: str, ttl: int) -> None:
+        # nx: не затираем запись, которую успел положить параллельный save
+        await self._client.set(
+            name=self.key(file_id), value=MISSING_MARKER, ex=ttl, nx=True
+        )
 
     @wrap_redis_failure("delete", raising=True)
     async def delete(self, file_id: str) -> None:
         key = self.key(file_id)
         await self._client.delete(key)
 
-    @staticmethod
-    def deserialize_meta(raw: bytes) -> FileMeta:
-        serialized_meta = DTOFileMeta(**json.loads(raw.decode("utf-8")))
-        return FileMetaMapper.deserialize_filemeta(serialized_meta)
+    @wrap_redis_failure("delete_many", raising=True)
+    async def delete_many(self, file_ids: Sequence[str]) -> None:
+        if file_ids:
+            await self._client.delete(*(self.key(file_id) for file_id in file_ids))
+
+    def deserialize_meta(self, raw: bytes) -> Optional[FileMeta]:
+        return self._codec.decode(raw)
 
-    @staticmethod
-    def serialize_meta(meta: FileMeta) -> str:
-        return json.dumps(FileMetaMapper.serialize_filemeta(meta))
+    def serialize_meta(self, meta: FileMeta) -> bytes:
+        return self._codec.encode(meta)
 
     async def healthcheck(self) -> ComponentStatus:
         start = time.perf_counter()
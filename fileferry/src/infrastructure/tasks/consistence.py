@@ -1,4 +1,5 @@
 import asyncio
+from collections.abc import Awaitable, Callable, Sequence
 
 from loguru import logger
 from redis.asyncio import RedisError
@@ -30,6 +31,33 @@ class CacheInvalidator(CacheInvalidatorContract):
 
     async def invalidate(
         self, file_id: str, max_retry_seconds: int | float
+    ) -> asyncio.Event:
+        return await self._run(
+            file_id, lambda: self._storage.delete(file_id), max_retry_seconds
+        )
+
+    async def invalidate_many(
+        self, file_ids: Sequence[str], max_retry_seconds: int | float
+    ) -> asyncio.Event:
+        """
+        Одна задача на всю пачку: менеджер ограничивает число задач,
+        и поштучная инвалидация большой пачки в него бы не влезла.
+        """
+        if not file_ids:
+            done = asyncio.Event()
+            done.set()
+            return done
+        ids = list(file_ids)
+        key = f"batch:{ids[0]}+{len(ids) - 1}"
+        return await self._run(
+            key, lambda: self._storage.delete_many(ids), max_retry_seconds
+        )
+
+    async def _run(
+        self,
+        key: str,
+        delete: Callable[[], Awaitable[None]],
+        max_retry_seconds: int | float,
     ) -> asyncio.Event:
         done = asyncio.Event()
         deadline = asyncio.get_running_loop().time() + max_retry_seconds
@@ -38,18 +66,18 @@ class CacheInvalidator(CacheInvalidatorContract):
             try:
                 while True:
                     try:
-                        await self._storage.delete(file_id)
+                        await delete()
                         return
                     except RedisError:
                         if asyncio.get_running_loop().time() >= deadline:
                             logger.info(
-                                f"[INAVLIDATE] Finished for {file_id} due to timeout"
+                                f"[INAVLIDATE] Finished for {key} due to timeout"
                             )
                             return
                         await asyncio.sleep(self._retry_interval)
             finally:
-                logger.info(f"[INAVLIDATE] Finished for {file_id}")
+                logger.info(f"[INAVLIDATE] Finished for {key}")
                 done.set()
 
-        await self._manager.schedule(file_id, lambda: task())
+        await self._manager.schedule(key, lambda: task())
         return done
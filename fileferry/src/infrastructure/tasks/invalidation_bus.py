@@ -0,0 +1,122 @@
+import asyncio
+import contextlib
+import json
+from typing import Any
+
+from loguru import logger
+from redis.asyncio import Redis, RedisError
+
+from contracts.infrastructure import InvalidationBusContract
+from infrastructure.storage.memory import LocalFileMetaCache
+
+
+class RedisInvalidationBus(InvalidationBusContract):
+    """
+    Шина инвалидации L1-кэшей воркеров поверх Redis pub/sub.
+
+    publish() ничего не ждёт: id копятся и раз в flush_interval уходят
+    одним сообщением в канал. К моменту отправки ключ в Redis, как правило,
+    уже удалён CacheInvalidator, так что соседи не успеют прогреть L1
+    устаревшей записью; остаточное окно закрывает TTL L1.
+
+    Подписчик вычищает полученные id из LocalFileMetaCache. Pub/sub
+    не доставляет сообщения, пропущенные во время разрыва, поэтому после
+    переподключения L1 сбрасывается целиком.
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        local: LocalFileMetaCache,
+        channel: str,
+        flush_interval: float = 0.05,
+        reconnect_interval: float = 1.0,
+    ) -> None:
+        self._client = client
+        self._local = local
+        self._channel = channel
+        self._flush_interval = flush_interval
+        self._reconnect_interval = reconnect_interval
+        self._pending: set[str] = set()
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task[Any]] = []
+
+    def publish(self, file_id: str) -> None:
+        self._pending.add(file_id)
+        self._wakeup.set()
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._listen()),
+            asyncio.create_task(self._flush_loop()),
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        with contextlib.suppress(RedisError, OSError):
+            await self._flush()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(self._flush_interval)
+            self._wakeup.clear()
+            try:
+                await self._flush()
+            except (RedisError, OSError) as exc:
+                logger.warning(f"[INVALIDATION] Publish failed: {exc}")
+                await asyncio.sleep(self._reconnect_interval)
+                self._wakeup.set()
+
+    async def _flush(self) -> None:
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, set()
+        try:
+            await self._client.publish(  # type: ignore redis-py has not fully annotated
+                self._channel, json.dumps(sorted(batch))
+            )
+        except BaseException:
+            self._pending |= batch
+            raise
+
+    async def _listen(self) -> None:
+        resync = False
+        while True:
+            pubsub = self._client.pubsub(  # type: ignore redis-py has not fully annotated
+                ignore_subscribe_messages=True
+            )
+            try:
+                await pubsub.subscribe(self._channel)  # type: ignore
+                if resync:
+                    # всё, что пришло за время разрыва, потеряно
+                    self._local.clear()
+                    logger.info("[INVALIDATION] Resubscribed, local cache reset")
+                    resync = False
+                while True:
+                    message: dict[str, Any] | None = await pubsub.get_message(  # type: ignore
+                        timeout=1.0
+                    )
+                    if message is not None:
+                        self.handle(message.get("data"))
+            except (RedisError, OSError) as exc:
+                logger.warning(f"[INVALIDATION] Subscription lost: {exc}")
+                resync = True
+                await asyncio.sleep(self._reconnect_interval)
+            finally:
+                with contextlib.suppress(RedisError, OSError):
+                    await pubsub.aclose()
+
+    def handle(self, data: Any) -> None:
+        try:
+            file_ids = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning("[INVALIDATION] Malformed message skipped")
+            return
+        for file_id in file_ids:
+            self._local.evict(file_id)
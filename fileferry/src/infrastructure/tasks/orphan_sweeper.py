@@ -0,0 +1,225 @@
+import asyncio
+import heapq
+import json
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+from contracts.infrastructure import FileMetaReaderContract, StorageAccessContract
+from infrastructure.types.storage import StoredObject
+from shared.enums import Buckets
+
+
+@dataclass(slots=True)
+class SweepReport:
+    """Итог сверки: сколько просмотрено и сколько расхождений найдено."""
+
+    objects: int = 0
+    rows: int = 0
+    orphans: int = 0  # объекты без строки в files
+    orphan_bytes: int = 0
+    missing: int = 0  # строки files без объекта ни в одном бакете
+    removed: int = 0
+    failed: int = 0
+
+
+class SweepCheckpoint:
+    """
+    Прогресс сверки в JSON-файле: последний полностью обработанный ключ.
+    Ключи обоих потоков идут в одном порядке, поэтому одного ключа
+    достаточно, чтобы продолжить с того же места после перезапуска.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    def load(self) -> tuple[str, SweepReport]:
+        if not self._path.exists():
+            return "", SweepReport()
+        state = json.loads(self._path.read_text())
+        return str(state["after"]), SweepReport(**state["report"])
+
+    def save(self, after: str, report: SweepReport) -> None:
+        tmp = self._path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"after": after, "report": asdict(report)}))
+        tmp.replace(self._path)
+
+    def clear(self) -> None:
+        self._path.unlink(missing_ok=True)
+
+
+class _Throttle:
+    """Не больше rate элементов в секунду в среднем, 0 - без ограничения."""
+
+    def __init__(self, rate: float) -> None:
+        self._rate = rate
+        self._started = time.monotonic()
+        self._taken = 0
+
+    async def take(self, count: int = 1) -> None:
+        if self._rate <= 0:
+            return
+        self._taken += count
+        ahead = self._taken / self._rate - (time.monotonic() - self._started)
+        if ahead > 0:
+            await asyncio.sleep(ahead)
+
+
+async def _merge(
+    streams: dict[Buckets, AsyncIterator[StoredObject]],
+) -> AsyncIterator[tuple[Buckets, StoredObject]]:
+    """Слияние отсортированных листингов бакетов, по одному объекту на бакет в памяти."""
+    heap: list[tuple[str, int, Buckets, StoredObject]] = []
+    order = list(streams)
+    for index, bucket in enumerate(order):
+        obj = await anext(streams[bucket], None)
+        if obj is not None:
+            heap.append((obj.key, index, bucket, obj))
+    heapq.heapify(heap)
+    while heap:
+        _, index, bucket, obj = heap[0]
+        yield bucket, obj
+        following = await anext(streams[bucket], None)
+        if following is None:
+            heapq.heappop(heap)
+        else:
+            heapq.heapreplace(heap, (following.key, index, bucket, following))
+
+
+class OrphanSweeper:
+    """
+    Сверка таблицы files с бакетами хранилища.
+
+    Листинги всех бакетов сливаются в один поток по ключу и merge-join'ом
+    сопоставляются с keyset-обходом ключей объектов из files (object_key
+    или id) - оба потока в байтовом порядке, в памяти только текущие
+    элементы и буфер удаления.
+    Объект без строки считается сиротой, только если он старше grace:
+    свежий объект может принадлежать идущей загрузке или новой версии
+    при обновлении. Строки без объекта только попадают в отчёт - метаданные
+    сверка не удаляет.
+
+    remove=False - только отчёт; remove=True - сироты удаляются пачками
+    по page_size через multi-object delete.
+    rate - сколько элементов (объектов и строк) в секунду просматривать,
+    чтобы не нагружать хранилище и БД. checkpoint позволяет продолжить
+    прерванную сверку: прогресс сохраняется каждые page_size элементов.
+    """
+
+    def __init__(
+        self,
+        storage: StorageAccessContract,
+        reader: FileMetaReaderContract,
+        buckets: Sequence[Buckets] = tuple(Buckets),
+        remove: bool = False,
+        grace: float = 86400.0,
+        rate: float = 5000.0,
+        page_size: int = 1000,
+        checkpoint: Optional[SweepCheckpoint] = None,
+    ) -> None:
+        self._storage = storage
+        self._reader = reader
+        self._buckets = list(buckets)
+        self._remove = remove
+        self._grace = grace
+        self._rate = rate
+        self._page_size = page_size
+        self._checkpoint = checkpoint
+        self._doomed: dict[Buckets, list[str]] = defaultdict(list)
+
+    async def run(self) -> SweepReport:
+        after, report = self._resume()
+        cutoff = datetime.now(UTC) - timedelta(seconds=self._grace)
+        throttle = _Throttle(self._rate)
+
+        objects = _merge(
+            {
+                bucket: self._storage.list_objects(bucket=bucket, start_after=after)
+                for bucket in self._buckets
+            }
+        )
+        rows = self._reader.iter_keys(after=after, page_size=self._page_size)
+        current = await anext(objects, None)
+        row = await anext(rows, None)
+        key = after
+        since_checkpoint = 0
+
+        while current is not None or row is not None:
+            if current is not None and (row is None or current[1].key < row):
+                bucket, obj = current
+                key = obj.key
+                report.objects += 1
+                if obj.last_modified < cutoff:
+                    await self._orphan(bucket, obj, report)
+                current = await anext(objects, None)
+            elif row is not None and (current is None or row < current[1].key):
+                key = row
+                report.rows += 1
+                report.missing += 1
+                logger.warning(f"[SWEEP] No object {row} for its file row")
+                row = await anext(rows, None)
+            elif row is not None:
+                # объект может лежать в нескольких бакетах - все под одной строкой
+                key = row
+                report.rows += 1
+                while current is not None and current[1].key == row:
+                    report.objects += 1
+                    current = await anext(objects, None)
+                row = await anext(rows, None)
+
+            since_checkpoint += 1
+            # тот же ключ может ждать в другом бакете - сохраняемся между ключами
+            next_key = current[1].key if current is not None else None
+            if since_checkpoint >= self._page_size and next_key != key:
+                await self._save(key, report)
+                await throttle.take(since_checkpoint)
+                since_checkpoint = 0
+
+        await self._flush(report)
+        if self._checkpoint:
+            self._checkpoint.clear()
+        logger.info(f"[SWEEP] Done: {report}")
+        return report
+
+    def _resume(self) -> tuple[str, SweepReport]:
+        if self._checkpoint is None:
+            return "", SweepReport()
+        after, report = self._checkpoint.load()
+        if after:
+            logger.info(f"[SWEEP] Resuming after {after}")
+        return after, report
+
+    async def _save(self, key: str, report: SweepReport) -> None:
+        await self._flush(report)
+        if self._checkpoint:
+            self._checkpoint.save(key, report)
+
+    async def _orphan(
+        self, bucket: Buckets, obj: StoredObject, report: SweepReport
+    ) -> None:
+        report.orphans += 1
+        report.orphan_bytes += obj.size
+        logger.warning(
+            f"[SWEEP] Orphan {bucket.value}/{obj.key} "
+            f"({obj.size} bytes, {obj.last_modified.isoformat()})"
+        )
+        if not self._remove:
+            return
+        self._doomed[bucket].append(obj.key)
+        if len(self._doomed[bucket]) >= self._page_size:
+            await self._flush(report)
+
+    async def _flush(self, report: SweepReport) -> None:
+        doomed, self._doomed = self._doomed, defaultdict(list)
+        for bucket, keys in doomed.items():
+            failed = await self._storage.delete_many(file_ids=keys, bucket=bucket)
+            report.removed += len(keys) - len(failed)
+            report.failed += len(failed)
+            if failed:
+                logger.warning(f"[SWEEP] Not removed from {bucket.value}: {failed}")
@@ -0,0 +1,161 @@
+import asyncio
+from collections import defaultdict
+from datetime import timedelta
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from contracts.infrastructure import OutboxRelayContract, StorageAccessContract
+from infrastructure.models.sqlalchemy import StorageOutbox
+from infrastructure.models.sqlalchemy.file import object_key_expr
+from shared.enums import Buckets, OutboxOperation
+
+
+class StorageOutboxRelay(OutboxRelayContract):
+    """
+    Фоновый исполнитель outbox-операций хранилища.
+
+    Раз в interval берёт в аренду на lease секунд до batch_size записей
+    (FOR UPDATE SKIP LOCKED в короткой транзакции, поэтому воркеры не мешают
+    друг другу) и уже без транзакции доводит их до конца:
+    - delete, у которой наступил not_before: объект удаляется одним
+      multi-object delete на бакет;
+    - upload, не продлённый дольше upload_grace: загрузка брошена (процесс
+      упал между записью объекта и строки files). Объект, на который
+      не ссылается строка files, удаляется, иначе запись просто снимается.
+    Запись снимается только после успеха в хранилище, отказ по отдельному
+    объекту увеличивает attempts и освобождает её до следующего прохода.
+    Если relay упал посередине, записи вернутся по истечении аренды.
+    Если записей набралось на полный batch, следующий проход идёт сразу.
+    """
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        storage: StorageAccessContract,
+        interval: float = 1.0,
+        batch_size: int = 500,
+        upload_grace: float = 3600.0,
+        lease: float = 300.0,
+    ) -> None:
+        self._sessionmaker = sessionmaker
+        self._storage = storage
+        self._interval = interval
+        self._batch_size = batch_size
+        self._upload_grace = upload_grace
+        self._lease = lease
+        self._task: asyncio.Task[Any] | None = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                handled = await self.relay_once()
+            except Exception as exc:
+                logger.warning(f"[OUTBOX] Relay pass failed: {exc}")
+                handled = 0
+            if handled < self._batch_size:
+                await asyncio.sleep(self._interval)
+
+    async def relay_once(self) -> int:
+        # блокировки строк живут только на время захвата: аренда фиксируется
+        # отдельной транзакцией, запросы в хранилище идут уже без неё
+        entries, committed = await self._claim()
+        if not entries:
+            return 0
+
+        doomed: dict[str, list[str]] = defaultdict(list)
+        for entry in entries:
+            if entry.object_key not in committed:
+                doomed[entry.bucket].append(entry.object_key)
+
+        # при сбое хранилища записи остаются занятыми до конца аренды
+        failed: set[tuple[str, str]] = set()
+        for bucket, keys in doomed.items():
+            errors = await self._storage.delete_many(
+                file_ids=keys, bucket=Buckets(bucket)
+            )
+            failed |= {(bucket, key) for key in errors}
+        if failed:
+            logger.warning(f"[OUTBOX] {len(failed)} objects not removed: {failed}")
+
+        done = [e.id for e in entries if (e.bucket, e.object_key) not in failed]
+        retry = [e.id for e in entries if (e.bucket, e.object_key) in failed]
+        async with self._sessionmaker() as session, session.begin():
+            if done:
+                await session.execute(
+                    delete(StorageOutbox).where(StorageOutbox.id.in_(done)),
+                    execution_options={"synchronize_session": False},
+                )
+            if retry:
+                await session.execute(
+                    update(StorageOutbox)
+                    .where(StorageOutbox.id.in_(retry))
+                    .values(attempts=StorageOutbox.attempts + 1, claimed_until=None),
+                    execution_options={"synchronize_session": False},
+                )
+        return len(entries)
+
+    async def _claim(self) -> tuple[list[StorageOutbox], set[str]]:
+        """
+        Берёт в аренду до batch_size свободных записей и фиксирует её.
+        Возвращает записи и ключи брошенных загрузок, строка files которых есть.
+        """
+        claimable = (
+            select(StorageOutbox.id)
+            .where(
+                or_(
+                    StorageOutbox.claimed_until.is_(None),
+                    StorageOutbox.claimed_until < func.now(),
+                ),
+                StorageOutbox.not_before <= func.now(),
+                or_(
+                    StorageOutbox.operation == OutboxOperation.DELETE,
+                    StorageOutbox.touched_at
+                    < func.now() - timedelta(seconds=self._upload_grace),
+                ),
+            )
+            .order_by(StorageOutbox.id)
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        async with self._sessionmaker() as session, session.begin():
+            entries = sorted(
+                await session.scalars(
+                    update(StorageOutbox)
+                    .where(StorageOutbox.id.in_(claimable))
+                    .values(claimed_until=func.now() + timedelta(seconds=self._lease))
+                    .returning(StorageOutbox),
+                    execution_options={"synchronize_session": False},
+                ),
+                key=lambda entry: entry.id,
+            )
+            if not entries:
+                return [], set()
+            return entries, await self._committed_uploads(session, entries)
+
+    @staticmethod
+    async def _committed_uploads(
+        session: AsyncSession, entries: list[StorageOutbox]
+    ) -> set[str]:
+        """Ключи брошенных загрузок, на которые всё же ссылается строка files."""
+        keys = [e.object_key for e in entries if e.operation == OutboxOperation.UPLOAD]
+        if not keys:
+            return set()
+        return set(
+            await session.scalars(
+                select(object_key_expr).where(object_key_expr.collate("C").in_(keys))
+            )
+        )
@@ -1,9 +1,10 @@
 from typing import Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, AsyncSessionTransaction
 
 from contracts.infrastructure import TransactionContextContract
 from infrastructure.exceptions.handlers.alchemy_handler import wrap_sqlalchemy_failure
+from infrastructure.tx.routing import ReadRouter
 
 
 class SqlAlchemyTransactionContext(TransactionContextContract):
@@ -13,26 +14,52 @@ class SqlAlchemyTransactionContext(TransactionContextContract):
     Вынесен в отдельный класс, как адаптер для отделения ответственности
     остальных классов за состояние сессии.
     Используется в контексте AtomicOperation для управления сессией внутри DataAccess классов.
+    autocommit_bind - движок с isolation_level=AUTOCOMMIT поверх того же пула.
+    begin(read_only=True) переключает на него сессию и не открывает транзакцию:
+    чтения идут без BEGIN/COMMIT, а соединение берётся лишь на первом запросе.
+    router - вместо autocommit_bind выбирает движок чтения (реплика или
+    primary) и узнаёт о каждом коммите записи для read-your-writes.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        autocommit_bind: Optional[AsyncEngine] = None,
+        router: Optional[ReadRouter] = None,
+    ) -> None:
         self._session: AsyncSession = session
         self._transaction: Optional[AsyncSessionTransaction] = None
+        self._autocommit_bind = autocommit_bind
+        self._router = router
+        self._bind = session.sync_session.bind
+        self._read_only = False
 
     @property
     def session(self) -> AsyncSession:
-        if self._transaction is None:
+        if self._transaction is None and not self._read_only:
             raise RuntimeError("Attempt to access session before transaction started")
         return self._session
 
     @wrap_sqlalchemy_failure
-    async def begin(self) -> None:
+    async def begin(self, read_only: bool = False) -> None:
+        bind = self._read_bind() if read_only else None
+        if bind is not None:
+            self._session.sync_session.bind = bind.sync_engine
+            self._read_only = True
+            return
         self._transaction = await self._session.begin()
 
+    def _read_bind(self) -> Optional[AsyncEngine]:
+        if self._router is not None:
+            return self._router.read_bind()
+        return self._autocommit_bind
+
     @wrap_sqlalchemy_failure
     async def commit(self) -> None:
         if self._transaction is not None:
             await self._transaction.commit()
+            if self._router is not None:
+                self._router.mark_write()
 
     @wrap_sqlalchemy_failure
     async def rollback(self) -> None:
@@ -43,3 +70,8 @@ class SqlAlchemyTransactionContext(TransactionContextContract):
     async def close(self) -> None:
         await self._session.close()
         self._transaction = None
+        if self._read_only:
+            self._session.sync_session.bind = self._bind
+            self._read_only = False
+            if self._router is not None:
+                self._router.end_read()
@@ -14,10 +14,10 @@ class TransactionManager(TransactionManagerContract):
         self._context = context
         self._started = False
 
-    async def start(self) -> None:
+    async def start(self, read_only: bool = False) -> None:
         if self._started:
             raise RuntimeError("Transaction has already been started")
-        await self._context.begin()
+        await self._context.begin(read_only=read_only)
         self._started = True
 
     async def end(self) -> None:
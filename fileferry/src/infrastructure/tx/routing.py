@@ -0,0 +1,75 @@
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from shared.logging.context import get_client
+
+_wrote_in_context: ContextVar[bool] = ContextVar("wrote_in_context", default=False)
+_reading_replica: ContextVar[bool] = ContextVar("reading_replica", default=False)
+
+
+def reading_replica() -> bool:
+    """Идут ли чтения текущего контекста с реплики (она может отставать)."""
+    return _reading_replica.get()
+
+
+class ReadRouter:
+    """
+    Выбор движка для чтений без транзакции: реплика или primary.
+    Read-your-writes: после коммита записи чтения того же запроса и того же
+    клиента (client_ctx_var) sticky_seconds идут на primary - реплика может
+    ещё не догнать. Клиенты с недавней записью хранятся в памяти процесса,
+    не больше max_clients, старые вытесняются первыми.
+    Без реплики все чтения идут на primary, записи не отслеживаются.
+    Пока открыто чтение с реплики, reading_replica() в том же контексте
+    возвращает True: кэш по таким чтениям не заполняется.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replica: Optional[AsyncEngine] = None,
+        sticky_seconds: float = 5.0,
+        max_clients: int = 10_000,
+    ) -> None:
+        self._primary = primary
+        self._replica = replica
+        self._sticky_seconds = sticky_seconds
+        self._max_clients = max_clients
+        self._recent: OrderedDict[str, float] = OrderedDict()
+
+    def read_bind(self) -> AsyncEngine:
+        if self._replica is None or self._is_sticky():
+            return self._primary
+        _reading_replica.set(True)
+        return self._replica
+
+    def end_read(self) -> None:
+        _reading_replica.set(False)
+
+    def mark_write(self) -> None:
+        if self._replica is None:
+            return
+        _wrote_in_context.set(True)
+        client = get_client()
+        if client == "-":
+            return
+        self._recent[client] = time.monotonic() + self._sticky_seconds
+        self._recent.move_to_end(client)
+        while len(self._recent) > self._max_clients:
+            self._recent.popitem(last=False)
+
+    def _is_sticky(self) -> bool:
+        if _wrote_in_context.get():
+            return True
+        client = get_client()
+        deadline = self._recent.get(client)
+        if deadline is None:
+            return False
+        if deadline > time.monotonic():
+            return True
+        del self._recent[client]
+        return False
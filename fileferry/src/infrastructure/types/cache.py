@@ -0,0 +1,14 @@
+from typing import NamedTuple, Optional
+
+from domain.models import FileMeta
+
+
+class CachedFileMeta(NamedTuple):
+    """
+    Запись кэша вместе с остатком её жизни.
+    expires_in - секунд до истечения в кэше, None - неизвестно
+    (запись без ttl или ответ L1, который всегда считается свежим).
+    """
+
+    meta: FileMeta
+    expires_in: Optional[float] = None
@@ -1,4 +1,5 @@
-from typing import TypedDict
+from datetime import datetime
+from typing import NotRequired, Optional, TypedDict
 
 
 class ORMFileMeta(TypedDict):
@@ -10,3 +11,6 @@ class ORMFileMeta(TypedDict):
     name: str
     mime_type: str
     size: int
+    checksum: Optional[str]
+    updated_at: NotRequired[Optional[datetime]]  # без ключа - проставит ORM
+    object_key: NotRequired[Optional[str]]  # None - объект лежит под id
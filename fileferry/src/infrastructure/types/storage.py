@@ -0,0 +1,10 @@
+from datetime import datetime
+from typing import NamedTuple
+
+
+class StoredObject(NamedTuple):
+    """Объект бакета из листинга хранилища."""
+
+    key: str
+    size: int
+    last_modified: datetime
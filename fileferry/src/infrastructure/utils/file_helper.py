@@ -1,30 +1,64 @@
 from collections.abc import AsyncIterator
-
-from magic import Magic
+from typing import Optional
 
 from contracts.infrastructure import FileHelperContract
-from shared.io.peekable_stream import PeekableAsyncStream
+from infrastructure.utils.mime_detector import MimeDetector
+from shared.io.peekable_stream import (
+    DEFAULT_SPOOL_MAX_SIZE,
+    ClosableStream,
+    PeekableAsyncStream,
+)
 
 
 class FileHelper(FileHelperContract):
-    @staticmethod
+    """
+    Анализ входящего потока: определение mime и размера.
+    spool_max_size - сколько байт потока держим в памяти, прежде чем
+    PeekableAsyncStream начнёт складывать его во временный файл.
+    Если размер заявлен клиентом (size), поток целиком не вычитывается:
+    смотрим только заголовок для mime, а сверку размера делает хранилище.
+    mime_detector - общий на процесс пул libmagic, см. MimeDetector.
+    """
+
+    def __init__(
+        self,
+        spool_max_size: int = DEFAULT_SPOOL_MAX_SIZE,
+        mime_detector: Optional[MimeDetector] = None,
+    ) -> None:
+        self._spool_max_size = spool_max_size
+        self._mime_detector = mime_detector or MimeDetector()
+
     async def analyze(
+        self,
         stream: AsyncIterator[bytes],
-    ) -> tuple[AsyncIterator[bytes], str, int]:
-        peek = FileHelper.iterator_to_peekable_stream(stream)
+        size: Optional[int] = None,
+    ) -> tuple[ClosableStream, str, int]:
+        peek = self.iterator_to_peekable_stream(stream)
 
         header = await FileHelper.get_stream_header(peek)
 
-        mime = FileHelper.detect_mime(header)
-        size = await FileHelper.get_stream_size(peek)
+        mime = await self.detect_mime(header)
+        if size is None:
+            size = await FileHelper.get_stream_size(peek)
 
         return peek.iter(), mime, size
 
-    @staticmethod
+    async def sniff(
+        self,
+        stream: AsyncIterator[bytes],
+    ) -> tuple[ClosableStream, str]:
+        """Определяет только mime по заголовку, размер не считается."""
+        peek = self.iterator_to_peekable_stream(stream)
+        header = await FileHelper.get_stream_header(peek)
+        return peek.iter(), await self.detect_mime(header)
+
     def iterator_to_peekable_stream(
+        self,
         iterator: AsyncIterator[bytes],
     ) -> PeekableAsyncStream:
-        return PeekableAsyncStream(source=iterator)
+        return PeekableAsyncStream(
+            source=iterator, max_memory_size=self._spool_max_size
+        )
 
     @staticmethod
     async def get_stream_header(
@@ -32,9 +66,8 @@ class FileHelper(FileHelperContract):
     ) -> bytes:
         return await stream.peek(2048)
 
-    @staticmethod
-    def detect_mime(header: bytes) -> str:
-        return Magic(mime=True).from_buffer(buf=header)
+    async def detect_mime(self, header: bytes) -> str:
+        return await self._mime_detector.detect(header)
 
     @staticmethod
     async def get_stream_size(stream: PeekableAsyncStream) -> int:
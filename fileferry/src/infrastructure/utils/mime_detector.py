@@ -0,0 +1,35 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from magic import Magic
+
+DEFAULT_MIME_WORKERS = 4
+
+
+class MimeDetector:
+    """
+    Определение mime через libmagic вне event loop.
+    Хендлы Magic не потокобезопасны и дорого создаются (грузят базу magic),
+    поэтому у каждого потока исполнителя свой хендл, созданный один раз
+    при первом обращении и переиспользуемый до конца жизни процесса.
+    """
+
+    def __init__(self, workers: int = DEFAULT_MIME_WORKERS) -> None:
+        self._local = threading.local()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="mime"
+        )
+
+    async def detect(self, header: bytes) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._detect, header)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _detect(self, header: bytes) -> str:
+        magic = getattr(self._local, "magic", None)
+        if magic is None:
+            magic = self._local.magic = Magic(mime=True)
+        return magic.from_buffer(buf=header)
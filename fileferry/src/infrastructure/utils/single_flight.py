@@ -0,0 +1,61 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _LeaderCancelled(Exception):
+    """Ведущий запрос отменён - ожидающие загружают сами."""
+
+
+class SingleFlight(Generic[T]):
+    """
+    Схлопывание одновременных загрузок одного ключа (single-flight).
+
+    Первый вызов do() по ключу становится ведущим и выполняет loader,
+    остальные ждут его результат (или его исключение). Загрузка идёт
+    в задаче ведущего, на его сессии БД, без отдельных фоновых задач.
+    Если ведущий отменён (клиент оборвал запрос), ожидающие не получают
+    CancelledError, а выполняют loader сами.
+    Один экземпляр на процесс: кэш-обёртки создаются на каждый запрос.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def do(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except _LeaderCancelled:
+                return await loader()
+
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await loader()
+        except asyncio.CancelledError:
+            self._fail(future, _LeaderCancelled())
+            raise
+        except BaseException as exc:
+            self._fail(future, exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def running(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    @staticmethod
+    def _fail(future: asyncio.Future[Any], exc: BaseException) -> None:
+        future.set_exception(exc)
+        future.exception()  # ожидающих может не быть - не пишем в лог "never retrieved"
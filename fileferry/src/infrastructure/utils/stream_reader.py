@@ -1,36 +1,104 @@
 from collections.abc import AsyncIterator
+from typing import Optional
+
+from shared.exceptions.infrastructure import EntityTooLargeError, IncompleteBodyError
 
 
 class AsyncStreamReader:
     """
     Класс работы со stream'ами, позволяет не бояться утечки потока.
     Полностью совместим с асинхронной MiniO SDK.
+
+    Если передан expected_size (заявленный клиентом размер), считает байты
+    по мере чтения и бросает IncompleteBodyError, когда поток оказался
+    короче или длиннее заявленного. Если передан max_size, бросает
+    EntityTooLargeError, как только прочитано больше max_size байт, -
+    не дожидаясь конца потока.
+
+    Буфер - bytearray с курсором чтения: чанки дописываются в конец
+    (амортизированно O(1) на байт), прочитанное отдаётся срезом через
+    memoryview, а голова буфера сдвигается, только когда прочитано
+    больше половины. Так read() линеен по объёму потока, даже если
+    MiniO читает его мелкими порциями.
     """
 
-    def __init__(self, stream: AsyncIterator[bytes]) -> None:
+    def __init__(
+        self,
+        stream: AsyncIterator[bytes],
+        expected_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+    ) -> None:
         self._stream = stream.__aiter__()
-        self._buffer = b""
+        self._buffer = bytearray()
+        self._offset = 0
+        self._expected_size = expected_size
+        self._max_size = max_size
+        self._received = 0
 
     def __aiter__(self) -> "AsyncStreamReader":
         return self
 
     async def __anext__(self) -> bytes:
-        try:
-            return await self._stream.__anext__()
-        except StopAsyncIteration:
-            raise StopAsyncIteration from None
+        return await self._pull()
 
     async def read(self, n: int = -1) -> bytes:
-        while len(self._buffer) < n or n == -1:
+        while n == -1 or len(self._buffer) - self._offset < n:
             try:
-                chunk = await self._stream.__anext__()
-                self._buffer += chunk
+                chunk = await self._pull()
             except StopAsyncIteration:
                 break
+            self._buffer += chunk
 
-        if n == -1:
-            result, self._buffer = self._buffer, b""
-        else:
-            result, self._buffer = self._buffer[:n], self._buffer[n:]
+        end = len(self._buffer)
+        if n != -1:
+            end = min(self._offset + n, end)
+
+        with memoryview(self._buffer) as view:
+            result = bytes(view[self._offset : end])
+        self._offset = end
+        self._compact()
 
         return result
+
+    def _compact(self) -> None:
+        if self._offset == len(self._buffer):
+            self._buffer.clear()
+            self._offset = 0
+        elif self._offset > len(self._buffer) // 2:
+            del self._buffer[: self._offset]
+            self._offset = 0
+
+    async def _pull(self) -> bytes:
+        try:
+            chunk = await self._stream.__anext__()
+        except StopAsyncIteration:
+            self._check_complete()
+            raise StopAsyncIteration from None
+
+        self._received += len(chunk)
+        if self._max_size is not None and self._received > self._max_size:
+            raise EntityTooLargeError(f"Body is larger than {self._max_size} bytes")
+        if self._expected_size is not None:
+            if self._received > self._expected_size:
+                raise IncompleteBodyError(
+                    f"Body is longer than declared {self._expected_size} bytes"
+                )
+            if self._received == self._expected_size:
+                # потребитель (MiniO) дочитает ровно length байт и остановится,
+                # поэтому хвост сверх заявленного проверяем сами
+                await self._ensure_exhausted()
+        return chunk
+
+    async def _ensure_exhausted(self) -> None:
+        async for extra in self._stream:
+            if extra:
+                raise IncompleteBodyError(
+                    f"Body is longer than declared {self._expected_size} bytes"
+                )
+
+    def _check_complete(self) -> None:
+        if self._expected_size is not None and self._received < self._expected_size:
+            raise IncompleteBodyError(
+                f"Body ended after {self._received} of "
+                f"{self._expected_size} declared bytes"
+            )
@@ -0,0 +1,33 @@
+from prometheus_client import Gauge, Histogram
+
+# --- Метрики пула соединений PostgreSQL ---
+db_pool_capacity = Gauge(
+    "fileferry_db_pool_capacity",
+    "Максимум соединений пула: pool_size + max_overflow",
+    ["pool"],
+)
+
+db_pool_in_use = Gauge(
+    "fileferry_db_pool_in_use",
+    "Соединений выдано из пула и ещё не возвращено",
+    ["pool"],
+)
+
+db_pool_idle = Gauge(
+    "fileferry_db_pool_idle",
+    "Открытых соединений, простаивающих в пуле",
+    ["pool"],
+)
+
+db_pool_waiting = Gauge(
+    "fileferry_db_pool_waiting",
+    "Запросов, ожидающих соединение из пула",
+    ["pool"],
+)
+
+db_pool_checkout_wait_seconds = Histogram(
+    "fileferry_db_pool_checkout_wait_seconds",
+    "Время получения соединения из пула, включая открытие нового",
+    ["pool"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
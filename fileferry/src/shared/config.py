@@ -7,6 +7,10 @@ class Settings(BaseSettings):
     app_debug: bool
     cache_enabled: bool
     main_route: str
+    upload_spool_max_size: int = 8 * 1024 * 1024  # байт в памяти до сброса на диск
+    upload_streaming: bool = True  # multipart-загрузка потоков без Content-Length
+    upload_max_size: int = 5 * 1024**3  # предел потоковой загрузки, байт
+    mime_workers: int = 4  # потоков с хендлами libmagic
 
     class Config:
         env_file = ".env"
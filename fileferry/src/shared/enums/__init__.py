@@ -1,3 +1,5 @@
+from shared.enums.batch import BatchDeleteStatus
 from shared.enums.buckets import Buckets
+from shared.enums.outbox import OutboxOperation
 
-__all__ = ("Buckets",)
+__all__ = ("BatchDeleteStatus", "Buckets", "OutboxOperation")
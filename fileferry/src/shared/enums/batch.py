@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class BatchDeleteStatus(StrEnum):
+    DELETED = "deleted"
+    NOT_FOUND = "not_found"
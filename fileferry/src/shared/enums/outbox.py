@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class OutboxOperation(StrEnum):
+    UPLOAD = "upload"  # объект пишется, строки в files ещё нет
+    DELETE = "delete"  # строка удалена, объект ждёт удаления из хранилища
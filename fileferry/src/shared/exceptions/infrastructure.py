@@ -137,6 +137,12 @@ class MissingContentLengthError(StorageError):
     pass
 
 
+class IncompleteBodyError(StorageError):
+    """Ошибка, если размер тела не совпал с заявленной длиной содержимого."""
+
+    pass
+
+
 class PreconditionFailedError(StorageError):
     """Ошибка, если условие предварительной проверки не выполнено."""
 
@@ -0,0 +1,89 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Optional
+
+from shared.exceptions.infrastructure import InvalidRangeError
+
+MAX_RANGES = 16  # больше диапазонов в одном запросе не обслуживаем
+
+
+@dataclass(frozen=True, slots=True)
+class ByteRange:
+    """Диапазон байт объекта, границы включительно."""
+
+    start: int
+    end: int
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1
+
+    def content_range(self, total: int) -> str:
+        return f"bytes {self.start}-{self.end}/{total}"
+
+
+@dataclass(frozen=True, slots=True)
+class RangeSpec:
+    """
+    Диапазон из заголовка Range до привязки к размеру файла.
+    first=None - суффиксный диапазон (последние last байт),
+    last=None - открытый диапазон до конца файла.
+    """
+
+    first: Optional[int]
+    last: Optional[int]
+
+    def resolve(self, size: int) -> Optional[ByteRange]:
+        """Привязывает диапазон к размеру файла, None - диапазон невыполним."""
+        if self.first is None:
+            if not self.last or size <= 0:
+                return None
+            return ByteRange(max(size - self.last, 0), size - 1)
+        if self.first >= size:
+            return None
+        end = size - 1 if self.last is None else min(self.last, size - 1)
+        return ByteRange(self.first, end)
+
+
+def parse_range_header(value: str) -> Optional[list[RangeSpec]]:
+    """
+    Разбирает заголовок Range (RFC 9110, только единица bytes).
+    Синтаксически некорректный заголовок игнорируется (None), как того
+    требует RFC: клиент получит файл целиком.
+    """
+    unit, sep, ranges = value.partition("=")
+    if not sep or unit.strip().lower() != "bytes":
+        return None
+
+    specs: list[RangeSpec] = []
+    for raw in ranges.split(","):
+        raw = raw.strip()
+        if not raw:
+            continue
+        first, dash, last = (part.strip() for part in raw.partition("-"))
+        if not dash or not (first or last):
+            return None
+        if not all(_is_number(part) for part in (first, last) if part):
+            return None
+        spec = RangeSpec(
+            first=int(first) if first else None, last=int(last) if last else None
+        )
+        if spec.first is not None and spec.last is not None and spec.last < spec.first:
+            return None
+        specs.append(spec)
+
+    if not specs or len(specs) > MAX_RANGES:
+        return None
+    return specs
+
+
+def resolve_ranges(specs: Sequence[RangeSpec], size: int) -> list[ByteRange]:
+    """Привязывает диапазоны к размеру файла, отбрасывая невыполнимые."""
+    resolved = [byte_range for spec in specs if (byte_range := spec.resolve(size))]
+    if not resolved:
+        raise InvalidRangeError(f"Range not satisfiable for {size} bytes")
+    return resolved
+
+
+def _is_number(value: str) -> bool:
+    return value.isascii() and value.isdigit()
@@ -1,48 +1,131 @@
 import asyncio
-from collections import deque
+import os
+import tempfile
 from collections.abc import AsyncGenerator, AsyncIterator
+from typing import Protocol
+
+DEFAULT_SPOOL_MAX_SIZE = 8 * 1024 * 1024  # 8 MiB держим в памяти, дальше - диск
+DEFAULT_REPLAY_CHUNK_SIZE = 64 * 1024
+
+
+class ClosableStream(Protocol):
+    """Поток байт, который можно закрыть, не дочитав (как async-генератор)."""
+
+    def __aiter__(self) -> "ClosableStream": ...
+
+    async def __anext__(self) -> bytes: ...
+
+    async def aclose(self) -> None: ...
 
 
 class PeekableAsyncStream:
-    def __init__(self, source: AsyncIterator[bytes]) -> None:
+    """
+    Поток, позволяющий заглянуть вперёд (peek) и узнать длину без потери данных.
+    Прочитанные наперёд чанки складываются в SpooledTemporaryFile: пока объём
+    не превысил max_memory_size, данные живут в памяти, после - спул переезжает
+    во временный файл на диске, и запись/чтение спула уходят в поток
+    (asyncio.to_thread), чтобы не блокировать цикл событий.
+    iter() воспроизводит данные из спула, а затем дочитывает исходный поток.
+    Спул закрывается, когда воспроизведение дочитано или закрыто aclose() -
+    в том числе если его так и не начали читать (отказ до передачи).
+    """
+
+    def __init__(
+        self,
+        source: AsyncIterator[bytes],
+        max_memory_size: int = DEFAULT_SPOOL_MAX_SIZE,
+        chunk_size: int = DEFAULT_REPLAY_CHUNK_SIZE,
+    ) -> None:
         self._source = source
-        self._buffer: deque[bytes] = deque()
-        self._cached: list[bytes] = []
+        # спул живёт дольше одного блока кода и закрывается в _stream()/close()
+        self._spool = tempfile.SpooledTemporaryFile(  # noqa: SIM115
+            max_size=max_memory_size
+        )
+        self._max_memory_size = max_memory_size
+        self._spooled = 0
+        self._chunk_size = chunk_size
         self._fully_buffered = False
         self._lock = asyncio.Lock()
 
     async def peek(self, size: int) -> bytes:
         async with self._lock:
-            collected = b"".join(self._buffer)
-            while len(collected) < size and not self._fully_buffered:
-                try:
-                    chunk = await self._source.__anext__()
-                    self._buffer.append(chunk)
-                    self._cached.append(chunk)
-                    collected += chunk
-                except StopAsyncIteration:
-                    self._fully_buffered = True
-                    break
-            return collected[:size]
+            while self._spooled < size and not self._fully_buffered:
+                await self._pull()
+            return await self._read_at(0, size)
 
     async def length(self) -> int:
         async with self._lock:
-            if self._fully_buffered:
-                return sum(len(chunk) for chunk in self._cached)
+            while not self._fully_buffered:
+                await self._pull()
+            return self._spooled
 
-            async for chunk in self._source:
-                self._buffer.append(chunk)
-                self._cached.append(chunk)
-            self._fully_buffered = True
-            return sum(len(chunk) for chunk in self._cached)
+    def iter(self) -> ClosableStream:
+        return _SpoolReplay(self, self._stream())
 
-    def iter(self) -> AsyncIterator[bytes]:
-        return self._stream()
+    def close(self) -> None:
+        self._spool.close()
 
     async def _stream(self) -> AsyncGenerator[bytes, None]:
         async with self._lock:
-            while self._buffer:
-                yield self._buffer.popleft()
-            if not self._fully_buffered:
-                async for chunk in self._source:
+            try:
+                offset = 0
+                while offset < self._spooled:
+                    chunk = await self._read_at(offset, self._chunk_size)
+                    offset += len(chunk)
                     yield chunk
+                if not self._fully_buffered:
+                    async for chunk in self._source:
+                        yield chunk
+            finally:
+                self.close()
+
+    async def _pull(self) -> None:
+        try:
+            chunk = await self._source.__anext__()
+        except StopAsyncIteration:
+            self._fully_buffered = True
+            return
+        # запись, на которой спул переезжает на диск, тоже блокирующая
+        if self._spooled + len(chunk) > self._max_memory_size:
+            await asyncio.to_thread(self._append, chunk)
+        else:
+            self._append(chunk)
+        self._spooled += len(chunk)
+
+    async def _read_at(self, offset: int, size: int) -> bytes:
+        if self._spooled > self._max_memory_size:
+            return await asyncio.to_thread(self._read_sync, offset, size)
+        return self._read_sync(offset, size)
+
+    def _append(self, chunk: bytes) -> None:
+        self._spool.seek(0, os.SEEK_END)
+        self._spool.write(chunk)
+
+    def _read_sync(self, offset: int, size: int) -> bytes:
+        self._spool.seek(offset)
+        return self._spool.read(size)
+
+
+class _SpoolReplay(ClosableStream):
+    """
+    Воспроизведение PeekableAsyncStream. В отличие от голого async-генератора,
+    aclose() освобождает спул и тогда, когда итерация не начиналась.
+    """
+
+    def __init__(
+        self, owner: PeekableAsyncStream, chunks: AsyncGenerator[bytes, None]
+    ) -> None:
+        self._owner = owner
+        self._chunks = chunks
+
+    def __aiter__(self) -> "_SpoolReplay":
+        return self
+
+    async def __anext__(self) -> bytes:
+        return await self._chunks.__anext__()
+
+    async def aclose(self) -> None:
+        try:
+            await self._chunks.aclose()
+        finally:
+            self._owner.close()
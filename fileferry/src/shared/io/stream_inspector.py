@@ -0,0 +1,61 @@
+import hashlib
+from collections.abc import AsyncIterator
+from typing import Optional
+
+DEFAULT_HEADER_SIZE = 2048
+
+
+class StreamInspector:
+    """
+    Прозрачная стадия конвейера загрузки: отдаёт чанки источника как есть
+    и попутно считает размер, запоминает первые header_size байт (для mime)
+    и инкрементально обновляет SHA-256 - единственную сумму, которая
+    сохраняется в метаданных. Результаты доступны после того, как потребитель
+    (хранилище) дочитал поток, второго прохода нет.
+    """
+
+    def __init__(
+        self,
+        source: AsyncIterator[bytes],
+        header_size: int = DEFAULT_HEADER_SIZE,
+    ) -> None:
+        self._source = source.__aiter__()
+        self._header_size = header_size
+        self._header = b""
+        self._size = 0
+        self._exhausted = False
+        self._sha256 = hashlib.sha256()
+
+    def __aiter__(self) -> "StreamInspector":
+        return self
+
+    async def __anext__(self) -> bytes:
+        try:
+            chunk = await self._source.__anext__()
+        except StopAsyncIteration:
+            self._exhausted = True
+            raise
+        self._size += len(chunk)
+        if len(self._header) < self._header_size:
+            self._header += chunk[: self._header_size - len(self._header)]
+        self._sha256.update(chunk)
+        return chunk
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def header(self) -> bytes:
+        return self._header
+
+    @property
+    def exhausted(self) -> bool:
+        return self._exhausted
+
+    def hexdigest(self) -> str:
+        return self._sha256.hexdigest()
+
+    def checksum(self) -> Optional[str]:
+        """Сумма только по дочитанному потоку, иначе None."""
+        return self.hexdigest() if self._exhausted else None
@@ -1,4 +1,4 @@
 from shared.logging.configuration import setup_logging
-from shared.logging.context import request_id_ctx_var, scope_ctx_var
+from shared.logging.context import client_ctx_var, request_id_ctx_var, scope_ctx_var
 
-__all__ = ("request_id_ctx_var", "scope_ctx_var", "setup_logging")
+__all__ = ("client_ctx_var", "request_id_ctx_var", "scope_ctx_var", "setup_logging")
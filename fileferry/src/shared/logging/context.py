@@ -6,6 +6,9 @@ request_id_ctx_var: contextvars.ContextVar[str] = contextvars.ContextVar(
 scope_ctx_var: contextvars.ContextVar[str] = contextvars.ContextVar(
     "scope", default="unknown"
 )
+client_ctx_var: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "client", default="-"
+)
 
 
 def get_request_id() -> str:
@@ -16,9 +19,17 @@ def get_scope() -> str:
     return scope_ctx_var.get()
 
 
+def get_client() -> str:
+    return client_ctx_var.get()
+
+
 def set_request_id(request_id: str) -> None:
     request_id_ctx_var.set(request_id)
 
 
 def set_scope(scope: str) -> None:
     scope_ctx_var.set(scope)
+
+
+def set_client(client: str) -> None:
+    client_ctx_var.set(client)
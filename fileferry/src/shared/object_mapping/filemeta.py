@@ -1,4 +1,5 @@
-from typing import TypedDict
+from datetime import datetime
+from typing import NotRequired, Optional, TypedDict
 
 from domain.models import FileMeta
 from infrastructure.types.filemeta import ORMFileMeta
@@ -15,6 +16,9 @@ class DTOFileMeta(TypedDict):
     name: str
     content_type: str
     size: int
+    checksum: NotRequired[Optional[str]]  # нет в записях до появления поля
+    updated_at: NotRequired[Optional[str]]  # ISO 8601
+    object_key: NotRequired[str]  # ключ объекта в хранилище, нет - совпадает с id
 
 
 class FileMetaMapper:
@@ -26,12 +30,18 @@ class FileMetaMapper:
 
     @staticmethod
     def serialize_filemeta(meta: FileMeta) -> DTOFileMeta:
-        return DTOFileMeta(
+        updated_at = meta.get_updated_at()
+        dto_meta = DTOFileMeta(
             id=meta.get_id(),
             name=meta.get_name(),
             content_type=meta.get_content_type(),
             size=meta.get_size(),
+            checksum=meta.get_checksum(),
+            updated_at=updated_at.isoformat() if updated_at else None,
         )
+        if (object_key := meta.get_object_key()) != meta.get_id():
+            dto_meta["object_key"] = object_key
+        return dto_meta
 
     @staticmethod
     def deserialize_filemeta(dto_meta: DTOFileMeta) -> FileMeta:
@@ -40,16 +50,29 @@ class FileMetaMapper:
             name=dto_meta["name"],
             size=dto_meta["size"],
             content_type=dto_meta["content_type"],
+            checksum=dto_meta.get("checksum"),
+            updated_at=(
+                datetime.fromisoformat(updated_at)
+                if (updated_at := dto_meta.get("updated_at"))
+                else None
+            ),
+            object_key=dto_meta.get("object_key"),
         )
 
     @staticmethod
     def filemeta_to_orm(meta: FileMeta) -> ORMFileMeta:
-        return ORMFileMeta(
+        orm_meta = ORMFileMeta(
             id=meta.get_id(),
             name=meta.get_name(),
             mime_type=meta.get_content_type(),
             size=meta.get_size(),
+            checksum=meta.get_checksum(),
         )
+        if updated_at := meta.get_updated_at():
+            orm_meta["updated_at"] = updated_at
+        if (object_key := meta.get_object_key()) != meta.get_id():
+            orm_meta["object_key"] = object_key
+        return orm_meta
 
     @staticmethod
     def filemeta_from_orm(orm_meta: ORMFileMeta) -> FileMeta:
@@ -58,4 +81,7 @@ class FileMetaMapper:
             name=orm_meta["name"],
             content_type=orm_meta["mime_type"],
             size=orm_meta["size"],
+            checksum=orm_meta["checksum"],
+            updated_at=orm_meta.get("updated_at"),
+            object_key=orm_meta.get("object_key"),
         )
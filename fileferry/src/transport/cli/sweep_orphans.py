@@ -0,0 +1,74 @@
+"""
+Сверка таблицы files с бакетами MiniO.
+
+    python -m transport.cli.sweep_orphans                  # только отчёт
+    python -m transport.cli.sweep_orphans --remove --checkpoint /data/sweep.json
+
+Прерванный прогон с --checkpoint продолжается с сохранённого места.
+Код возврата 1, если найдены расхождения (удобно для CronJob и алертов).
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from composition.containers.application import ApplicationContainer
+from shared.config import settings
+from shared.enums import Buckets
+from shared.logging.configuration import setup_logging
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="sweep_orphans", description=__doc__)
+    parser.add_argument(
+        "--bucket",
+        dest="buckets",
+        action="append",
+        type=Buckets,
+        choices=list(Buckets),
+        help="бакет для сверки (можно несколько), по умолчанию все",
+    )
+    parser.add_argument(
+        "--remove", action="store_true", help="удалять объекты без метаданных"
+    )
+    parser.add_argument(
+        "--grace",
+        type=float,
+        default=86400.0,
+        help="объекты моложе стольких секунд не трогаем (идущие загрузки)",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=5000.0,
+        help="элементов в секунду, 0 - без ограничения",
+    )
+    parser.add_argument(
+        "--checkpoint", type=Path, help="файл прогресса для продолжения прогона"
+    )
+    return parser.parse_args(argv)
+
+
+async def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    setup_logging()
+    container = ApplicationContainer(config_app=settings)
+    sweeper = container.infrastructure.orphan_sweeper(
+        buckets=args.buckets or tuple(Buckets),
+        remove=args.remove,
+        grace=args.grace,
+        rate=args.rate,
+        checkpoint=args.checkpoint,
+    )
+    try:
+        report = await sweeper.run()
+    finally:
+        await container.infrastructure.http_pool().close()
+        await container.infrastructure.engine_replica().dispose()
+        await container.infrastructure.engine_postgres().dispose()
+    return 1 if report.orphans - report.removed or report.missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(sys.argv[1:])))
@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from domain.models import FileMeta
+
+
+@dataclass(frozen=True, slots=True)
+class Preconditions:
+    """Условные заголовки GET-запроса (RFC 9110, 13.1)."""
+
+    if_none_match: Optional[str] = None
+    if_modified_since: Optional[str] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.if_none_match or self.if_modified_since)
+
+    def not_modified(self, meta: FileMeta) -> bool:
+        """
+        True - у клиента актуальная версия, отвечаем 304.
+        If-None-Match имеет приоритет: If-Modified-Since при нём не проверяется.
+        """
+        if self.if_none_match:
+            etag = entity_tag(meta)
+            if etag is None:
+                return False
+            if self.if_none_match.strip() == "*":
+                return True
+            candidates = (tag.strip() for tag in self.if_none_match.split(","))
+            return any(_weak_equal(tag, etag) for tag in candidates)
+
+        updated_at = meta.get_updated_at()
+        if self.if_modified_since and updated_at:
+            since = _parse_http_date(self.if_modified_since)
+            # HTTP-даты с точностью до секунды
+            return since is not None and updated_at.replace(microsecond=0) <= since
+        return False
+
+
+def entity_tag(meta: FileMeta) -> Optional[str]:
+    """
+    Сильный ETag - sha256 содержимого. Для записей без контрольной суммы
+    собирается слабый тег из размера и времени изменения.
+    """
+    if checksum := meta.get_checksum():
+        return f'"{checksum}"'
+    if updated_at := meta.get_updated_at():
+        return f'W/"{meta.get_size():x}-{int(updated_at.timestamp() * 1000):x}"'
+    return None
+
+
+def validator_headers(meta: FileMeta) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if etag := entity_tag(meta):
+        headers["ETag"] = etag
+    if updated_at := meta.get_updated_at():
+        headers["Last-Modified"] = format_datetime(updated_at, usegmt=True)
+    return headers
+
+
+def _weak_equal(left: str, right: str) -> bool:
+    return left.removeprefix("W/") == right.removeprefix("W/")
+
+
+def _parse_http_date(value: str) -> Optional[datetime]:
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else None
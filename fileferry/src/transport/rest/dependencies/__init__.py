@@ -1,15 +1,27 @@
 from transport.rest.dependencies.data import file_to_iterator
-from transport.rest.dependencies.headers import BucketDI
+from transport.rest.dependencies.headers import (
+    BucketDI,
+    ContentLengthDI,
+    PreconditionsDI,
+    RangeDI,
+)
 from transport.rest.dependencies.validation import (
+    BodyDeleteIdsDI,
+    BodyFileIdsDI,
     FormFilenameDI,
     PathFileIdDI,
     QueryFilenameDI,
 )
 
 __all__ = (
+    "BodyDeleteIdsDI",
+    "BodyFileIdsDI",
     "BucketDI",
+    "ContentLengthDI",
     "FormFilenameDI",
     "PathFileIdDI",
+    "PreconditionsDI",
     "QueryFilenameDI",
+    "RangeDI",
     "file_to_iterator",
 )
@@ -1,9 +1,11 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import Depends, Header, HTTPException
 from loguru import logger
 
 from shared.enums import Buckets
+from shared.io.byte_range import RangeSpec, parse_range_header
+from transport.rest.conditional import Preconditions
 
 logger = logger.bind(name="requests")
 
@@ -22,3 +24,61 @@ def extract_bucket_from_headers(
 
 
 BucketDI = Annotated[Buckets, Depends(extract_bucket_from_headers)]
+
+
+def extract_content_length_from_headers(
+    content_length: Optional[int] = Header(
+        None,
+        alias="Content-Length",
+    ),
+) -> Optional[int]:
+    """
+    Заявленная клиентом длина тела для потоковой загрузки.
+    None - длина неизвестна (например, chunked), тогда размер считается по потоку.
+    """
+    if content_length is not None and content_length < 0:
+        logger.trace("[REQUEST] Invalid content length")
+        raise HTTPException(status_code=400, detail="Invalid Content-Length value")
+    return content_length
+
+
+ContentLengthDI = Annotated[Optional[int], Depends(extract_content_length_from_headers)]
+
+
+def extract_range_from_headers(
+    range_header: Optional[str] = Header(
+        None,
+        alias="Range",
+    ),
+) -> Optional[list[RangeSpec]]:
+    """
+    Запрошенные клиентом диапазоны байт.
+    None - заголовка нет или он некорректен: отдаём файл целиком.
+    """
+    if range_header is None:
+        return None
+    ranges = parse_range_header(range_header)
+    if ranges is None:
+        logger.trace("[REQUEST] Ignoring malformed Range header")
+    return ranges
+
+
+RangeDI = Annotated[Optional[list[RangeSpec]], Depends(extract_range_from_headers)]
+
+
+def extract_preconditions_from_headers(
+    if_none_match: Optional[str] = Header(
+        None,
+        alias="If-None-Match",
+    ),
+    if_modified_since: Optional[str] = Header(
+        None,
+        alias="If-Modified-Since",
+    ),
+) -> Preconditions:
+    return Preconditions(
+        if_none_match=if_none_match, if_modified_since=if_modified_since
+    )
+
+
+PreconditionsDI = Annotated[Preconditions, Depends(extract_preconditions_from_headers)]
@@ -4,6 +4,7 @@ from fastapi import Depends, Form, HTTPException, Path, Query, Request
 from loguru import logger
 
 from domain.models import FileId, FileName
+from transport.rest.dto.models import DeleteBatchRequest, MetaBatchRequest
 
 logger = logger.bind(name="requests")
 
@@ -36,6 +37,28 @@ def file_id_from_path(
 PathFileIdDI = Annotated[FileId, Depends(file_id_from_path)]
 
 
+def _file_ids(ids: list[str]) -> list[FileId]:
+    try:
+        return [FileId(file_id) for file_id in ids]
+    except ValueError:
+        logger.trace("[REQUEST] Invalid file id in batch.")
+        raise HTTPException(status_code=400, detail="Invalid id value") from None
+
+
+def file_ids_from_body(body: MetaBatchRequest) -> list[FileId]:
+    return _file_ids(body.ids)
+
+
+BodyFileIdsDI = Annotated[list[FileId], Depends(file_ids_from_body)]
+
+
+def delete_ids_from_body(body: DeleteBatchRequest) -> list[FileId]:
+    return _file_ids(body.ids)
+
+
+BodyDeleteIdsDI = Annotated[list[FileId], Depends(delete_ids_from_body)]
+
+
 def filename_from_query(
     request: Request,
     name: str = Query(
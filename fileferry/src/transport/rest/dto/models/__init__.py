@@ -1,3 +1,19 @@
-from transport.rest.dto.models.files import DeleteFileResponse, UploadFileResponse
+from transport.rest.dto.models.files import (
+    DeleteBatchItem,
+    DeleteBatchRequest,
+    DeleteBatchResponse,
+    DeleteFileResponse,
+    MetaBatchRequest,
+    MetaBatchResponse,
+    UploadFileResponse,
+)
 
-__all__ = ("DeleteFileResponse", "UploadFileResponse")
+__all__ = (
+    "DeleteBatchItem",
+    "DeleteBatchRequest",
+    "DeleteBatchResponse",
+    "DeleteFileResponse",
+    "MetaBatchRequest",
+    "MetaBatchResponse",
+    "UploadFileResponse",
+)
@@ -1,14 +1,23 @@
-from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
 
 from domain.models.dataclasses import FileMeta
+from shared.enums import BatchDeleteStatus
 from shared.object_mapping.filemeta import FileMetaMapper
 
+MAX_META_BATCH = 500  # больше id в одном запросе /files/meta:batch не принимаем
+MAX_DELETE_BATCH = 1000  # столько ключей S3 удаляет за один DeleteObjects
+
 
 class UploadFileResponse(BaseModel):
     id: str
     name: str
     size: int
     content_type: str
+    checksum: Optional[str] = None
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -18,9 +27,54 @@ class UploadFileResponse(BaseModel):
         return cls.model_validate(FileMetaMapper.serialize_filemeta(meta))
 
 
+class MetaBatchRequest(BaseModel):
+    ids: list[str] = Field(..., min_length=1, max_length=MAX_META_BATCH)
+
+
+class MetaBatchResponse(BaseModel):
+    files: list[UploadFileResponse]
+    missing: list[str]
+
+    @classmethod
+    def from_domain(
+        cls, requested: list[str], metas: list[FileMeta]
+    ) -> "MetaBatchResponse":
+        found = {meta.get_id() for meta in metas}
+        return cls(
+            files=[UploadFileResponse.from_domain(meta) for meta in metas],
+            missing=[
+                file_id for file_id in dict.fromkeys(requested) if file_id not in found
+            ],
+        )
+
+
 class DeleteFileResponse(BaseModel):
     msg: str
 
     @classmethod
     def success(cls) -> "DeleteFileResponse":
         return cls(msg="Requested to delete file deleted successfully")
+
+
+class DeleteBatchRequest(BaseModel):
+    ids: list[str] = Field(..., min_length=1, max_length=MAX_DELETE_BATCH)
+
+
+class DeleteBatchItem(BaseModel):
+    id: str
+    status: BatchDeleteStatus
+
+
+class DeleteBatchResponse(BaseModel):
+    results: list[DeleteBatchItem]
+
+    @classmethod
+    def from_outcomes(
+        cls, outcomes: dict[str, BatchDeleteStatus]
+    ) -> "DeleteBatchResponse":
+        return cls(
+            results=[
+                DeleteBatchItem(id=file_id, status=status)
+                for file_id, status in outcomes.items()
+            ]
+        )
@@ -5,7 +5,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
-from shared.logging import request_id_ctx_var, scope_ctx_var
+from shared.logging import client_ctx_var, request_id_ctx_var, scope_ctx_var
 
 
 class LoggingMiddleware(BaseHTTPMiddleware):
@@ -15,6 +15,15 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         request_id = str(uuid.uuid4())
         request_id_ctx_var.set(request_id)
         scope_ctx_var.set(f"{request.method} {request.url.path}")
+        client_ctx_var.set(client_address(request))
         response = await call_next(request)
         response.headers["X-Request-ID"] = request_id
         return response
+
+
+def client_address(request: Request) -> str:
+    """Адрес клиента: первый хоп X-Forwarded-For за прокси, иначе адрес сокета."""
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded:
+        return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "-"
@@ -0,0 +1,63 @@
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
+from uuid import uuid4
+
+from fastapi.responses import StreamingResponse
+
+from domain.models import FileMeta
+from shared.io.byte_range import ByteRange
+
+
+def range_response(
+    meta: FileMeta,
+    parts: Sequence[tuple[ByteRange, AsyncIterator[bytes]]],
+    headers: dict[str, str],
+) -> StreamingResponse:
+    """
+    Ответ 206 на Range-запрос.
+    Один диапазон отдаётся как есть с Content-Range,
+    несколько - телом multipart/byteranges (RFC 9110, 14.6).
+    """
+    total = meta.get_size()
+    if len(parts) == 1:
+        byte_range, stream = parts[0]
+        return StreamingResponse(
+            content=stream,
+            status_code=206,
+            media_type=meta.get_content_type(),
+            headers={
+                **headers,
+                "Content-Range": byte_range.content_range(total),
+                "Content-Length": str(byte_range.length),
+            },
+        )
+
+    boundary = uuid4().hex
+    return StreamingResponse(
+        content=_multipart_body(
+            parts=parts,
+            boundary=boundary,
+            content_type=meta.get_content_type(),
+            total=total,
+        ),
+        status_code=206,
+        media_type=f"multipart/byteranges; boundary={boundary}",
+        headers=headers,
+    )
+
+
+async def _multipart_body(
+    parts: Sequence[tuple[ByteRange, AsyncIterator[bytes]]],
+    boundary: str,
+    content_type: str,
+    total: int,
+) -> AsyncGenerator[bytes, None]:
+    for byte_range, stream in parts:
+        yield (
+            f"--{boundary}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Range: {byte_range.content_range(total)}\r\n\r\n"
+        ).encode()
+        async for chunk in stream:
+            yield chunk
+        yield b"\r\n"
+    yield f"--{boundary}--\r\n".encode()
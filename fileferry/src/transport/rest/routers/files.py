@@ -1,17 +1,31 @@
 from fastapi import APIRouter, File, Request, UploadFile
+from fastapi.responses import Response as PlainResponse
 from fastapi.responses import StreamingResponse
 
 from composition.di import AdapterDI
+from domain.models import FileMeta
+from transport.rest.conditional import validator_headers
 from transport.rest.dependencies import (
+    BodyDeleteIdsDI,
+    BodyFileIdsDI,
     BucketDI,
+    ContentLengthDI,
     FormFilenameDI,
     PathFileIdDI,
+    PreconditionsDI,
     QueryFilenameDI,
+    RangeDI,
     file_to_iterator,
 )
 from transport.rest.docs.generate_docs import ALL_RESPONSES, NON_SPECIFIED_RESPONSES
 from transport.rest.dto.base import Response
-from transport.rest.dto.models import DeleteFileResponse, UploadFileResponse
+from transport.rest.dto.models import (
+    DeleteBatchResponse,
+    DeleteFileResponse,
+    MetaBatchResponse,
+    UploadFileResponse,
+)
+from transport.rest.ranges import range_response
 
 file_router = APIRouter(prefix="/files")
 
@@ -32,7 +46,7 @@ async def upload_file(
     file: UploadFile = File(..., description="Binary file to be uploaded"),
 ) -> Response[UploadFileResponse]:
     stream = file_to_iterator(file=file)
-    meta = await adapter.upload(name=name, stream=stream, bucket=bucket)
+    meta = await adapter.upload(name=name, stream=stream, bucket=bucket, size=file.size)
     data = UploadFileResponse.from_domain(meta)
 
     return Response[UploadFileResponse].success(data)
@@ -42,7 +56,11 @@ async def upload_file(
     "/{file_id}",
     response_class=StreamingResponse,
     summary="Retrieve a file",
-    description="Streams a file from the storage by its ID.",
+    description=(
+        "Streams a file from the storage by its ID. "
+        "Supports single and multiple byte ranges via the Range header "
+        "and conditional requests via If-None-Match / If-Modified-Since."
+    ),
     tags=["rest"],
     responses=ALL_RESPONSES,
 )
@@ -50,19 +68,112 @@ async def retrieve_file(
     adapter: AdapterDI,
     bucket: BucketDI,
     file_id: PathFileIdDI,
-) -> StreamingResponse:
+    ranges: RangeDI,
+    preconditions: PreconditionsDI,
+) -> PlainResponse:
+    # потоки хранилища ленивые: при 304 запрос в MiniO так и не уходит
+    if ranges:
+        # предусловия проверяются до Range (RFC 9110, 13.2.2): иначе
+        # невыполнимый диапазон дал бы 416 вместо 304
+        if preconditions:
+            meta = await adapter.retrieve_meta(file_id=file_id)
+            if preconditions.not_modified(meta):
+                return _not_modified(meta)
+        meta, parts = await adapter.retrieve_range(
+            file_id=file_id, bucket=bucket, ranges=ranges
+        )
+        return range_response(meta, parts, headers=_file_headers(meta))
+
     meta, stream = await adapter.retrieve(file_id=file_id, bucket=bucket)
+    if preconditions and preconditions.not_modified(meta):
+        return _not_modified(meta)
     return StreamingResponse(
         content=stream,
         media_type=meta.get_content_type(),
-        headers={
-            "X-Filename": meta.get_name(),
-            "X-FileSize": str(meta.get_size()),
-            "X-FileID": meta.get_id(),
-        },
+        headers=_file_headers(meta),
     )
 
 
+@file_router.head(
+    "/{file_id}",
+    response_class=PlainResponse,
+    summary="File headers",
+    description=(
+        "Returns the headers of GET /files/{file_id} without the body. "
+        "Served from the metadata cache, the storage is never queried."
+    ),
+    tags=["rest"],
+    responses=ALL_RESPONSES,
+)
+async def head_file(
+    adapter: AdapterDI,
+    file_id: PathFileIdDI,
+    preconditions: PreconditionsDI,
+) -> PlainResponse:
+    meta = await adapter.retrieve_meta(file_id=file_id)
+    if preconditions and preconditions.not_modified(meta):
+        return _not_modified(meta)
+    return PlainResponse(
+        media_type=meta.get_content_type(),
+        headers={**_file_headers(meta), "Content-Length": str(meta.get_size())},
+    )
+
+
+@file_router.get(
+    "/{file_id}/meta",
+    response_model=Response[UploadFileResponse],
+    status_code=200,
+    summary="File metadata",
+    description=(
+        "Returns file metadata by its ID. "
+        "Served from the metadata cache, the storage is never queried."
+    ),
+    tags=["rest"],
+    responses=ALL_RESPONSES,
+)
+async def retrieve_file_meta(
+    adapter: AdapterDI,
+    file_id: PathFileIdDI,
+) -> Response[UploadFileResponse]:
+    meta = await adapter.retrieve_meta(file_id=file_id)
+    return Response[UploadFileResponse].success(UploadFileResponse.from_domain(meta))
+
+
+@file_router.post(
+    "/meta:batch",
+    response_model=Response[MetaBatchResponse],
+    status_code=200,
+    summary="Batch file metadata",
+    description=(
+        "Returns metadata for up to 500 files in one call. "
+        "Unknown IDs are listed in `missing`; the storage is never queried."
+    ),
+    tags=["rest"],
+    responses=NON_SPECIFIED_RESPONSES,
+)
+async def retrieve_file_meta_batch(
+    adapter: AdapterDI,
+    file_ids: BodyFileIdsDI,
+) -> Response[MetaBatchResponse]:
+    metas = await adapter.retrieve_meta_batch(file_ids=file_ids)
+    data = MetaBatchResponse.from_domain([f.value for f in file_ids], metas)
+    return Response[MetaBatchResponse].success(data)
+
+
+def _file_headers(meta: FileMeta) -> dict[str, str]:
+    return {
+        "X-Filename": meta.get_name(),
+        "X-FileSize": str(meta.get_size()),
+        "X-FileID": meta.get_id(),
+        "Accept-Ranges": "bytes",
+        **validator_headers(meta),
+    }
+
+
+def _not_modified(meta: FileMeta) -> PlainResponse:
+    return PlainResponse(status_code=304, headers=validator_headers(meta))
+
+
 @file_router.delete(
     "/{file_id}",
     response_model=Response[DeleteFileResponse],
@@ -81,6 +192,30 @@ async def delete_file(
     return Response[DeleteFileResponse].success(data=DeleteFileResponse.success())
 
 
+@file_router.post(
+    ":batchDelete",
+    response_model=Response[DeleteBatchResponse],
+    status_code=200,
+    summary="Delete files in bulk",
+    description=(
+        "Deletes up to 1000 files in one call: one database statement "
+        "and one cache invalidation. Storage objects are queued in the "
+        "same transaction and removed in the background. "
+        "Reports an outcome per ID: deleted or not_found."
+    ),
+    tags=["rest"],
+    responses=NON_SPECIFIED_RESPONSES,
+)
+async def delete_files_batch(
+    adapter: AdapterDI,
+    bucket: BucketDI,
+    file_ids: BodyDeleteIdsDI,
+) -> Response[DeleteBatchResponse]:
+    outcomes = await adapter.delete_batch(file_ids=file_ids, bucket=bucket)
+    data = DeleteBatchResponse.from_outcomes(outcomes)
+    return Response[DeleteBatchResponse].success(data)
+
+
 @file_router.patch(
     "/{file_id}",
     response_model=Response[UploadFileResponse],
@@ -100,8 +235,9 @@ async def update_file(
     ),
 ) -> Response[UploadFileResponse]:
     stream = file_to_iterator(file) if file else None
+    size = file.size if file else None
     meta = await adapter.update(
-        file_id=file_id, name=name, stream=stream, bucket=bucket
+        file_id=file_id, name=name, stream=stream, bucket=bucket, size=size
     )
     data = UploadFileResponse.from_domain(meta)
     return Response[UploadFileResponse].success(data)
@@ -121,9 +257,12 @@ async def stream_upload(
     adapter: AdapterDI,
     bucket: BucketDI,
     name: QueryFilenameDI,
+    content_length: ContentLengthDI,
 ) -> Response[UploadFileResponse]:
     stream = request.stream()
-    meta = await adapter.upload(name=name, stream=stream, bucket=bucket)
+    meta = await adapter.upload(
+        name=name, stream=stream, bucket=bucket, size=content_length
+    )
     data = UploadFileResponse.from_domain(meta)
     return Response[UploadFileResponse].success(data)
 
@@ -143,10 +282,11 @@ async def stream_update(
     bucket: BucketDI,
     file_id: PathFileIdDI,
     name: QueryFilenameDI,
+    content_length: ContentLengthDI,
 ) -> Response[UploadFileResponse]:
     stream = request.stream()
     meta = await adapter.update(
-        file_id=file_id, name=name, stream=stream, bucket=bucket
+        file_id=file_id, name=name, stream=stream, bucket=bucket, size=content_length
     )
     data = UploadFileResponse.from_domain(meta)
     return Response[UploadFileResponse].success(data)
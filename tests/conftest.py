@@ -9,6 +9,7 @@ pytest_plugins = [
     "fixtures.infrastructure.sqlalchemy",
     "fixtures.infrastructure.redis",
     "fixtures.infrastructure.tasks",
+    "fixtures.transport.app",
     "mocks.infrastructure.coordinator",
     "mocks.infrastructure.sqlalchemy",
     "mocks.infrastructure.tx.context",
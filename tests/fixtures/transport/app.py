@@ -0,0 +1,25 @@
+from collections.abc import Iterator
+from unittest.mock import AsyncMock
+
+import pytest
+from composition.di import provide_crud_adapter
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from transport.rest.middlewares import FinalizeErrorMiddleware
+from transport.rest.routers.files import file_router
+
+
+@pytest.fixture
+def mock_crud_adapter() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def files_client(mock_crud_adapter: AsyncMock) -> Iterator[TestClient]:
+    """Роутер /files с подменённым адаптером, без контейнеров и инфраструктуры."""
+    app = FastAPI()
+    app.add_middleware(FinalizeErrorMiddleware)
+    app.include_router(file_router)
+    app.dependency_overrides[provide_crud_adapter] = lambda: mock_crud_adapter
+    with TestClient(app) as client:
+        yield client
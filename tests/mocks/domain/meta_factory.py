@@ -10,7 +10,7 @@ from shared.exceptions.application import InvalidFileParameters
 @pytest.fixture(scope="function")
 def meta_factory_mock(
     filemeta: FileMeta,
-) -> Callable[[Optional[str], str, int, str], FileMeta]:
+) -> Callable[[Optional[str], str, int, str, Optional[str]], FileMeta]:
     factory = MagicMock()
     factory.return_value = filemeta
     return factory
@@ -18,7 +18,7 @@ def meta_factory_mock(
 
 @pytest.fixture(scope="function")
 def meta_factory_mock_raises_error() -> (
-    Callable[[Optional[str], str, int, str], FileMeta]
+    Callable[[Optional[str], str, int, str, Optional[str]], FileMeta]
 ):
     factory = MagicMock()
     factory.side_effect = InvalidFileParameters("Unprocessable entity")
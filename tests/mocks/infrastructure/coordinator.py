@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from infrastructure.coordination.minio_sqla import SqlAlchemyMinioCoordinator
@@ -8,11 +8,14 @@ from infrastructure.coordination.minio_sqla import SqlAlchemyMinioCoordinator
 def mock_coordinator() -> SqlAlchemyMinioCoordinator:
     coordinator = AsyncMock()
     coordinator.file_storage = AsyncMock()
+    coordinator.file_storage.version_key = MagicMock(return_value="file.v2")
     coordinator.data_access = AsyncMock()
+    coordinator.outbox = AsyncMock()
     coordinator._transaction = AsyncMock()
 
     coordinator.__aenter__ = AsyncMock(return_value=coordinator)
     coordinator.__aexit__ = AsyncMock()
+    coordinator.read = MagicMock(return_value=coordinator)
     coordinator.commit = AsyncMock()
     coordinator.rollback = AsyncMock()
 
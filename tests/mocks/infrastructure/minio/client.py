@@ -44,6 +44,7 @@ async def mock_minio_client(mock_client_response: ClientResponse) -> Minio:
     client.put_object = AsyncMock()
     client.get_object = AsyncMock(return_value=mock_client_response)
     client.remove_object = AsyncMock()
+    client.remove_objects = AsyncMock(return_value=[])
     client.list_buckets = AsyncMock(
         return_value=[Bucket(name="test_bucket", creation_date=None)]
     )
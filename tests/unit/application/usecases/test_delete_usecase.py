@@ -2,8 +2,9 @@ from unittest.mock import AsyncMock
 
 import pytest
 from application.usecases.files.delete import DeleteUseCase
+from application.usecases.files.delete_batch import DeleteBatchUseCase
 from domain.models import FileId
-from shared.enums import Buckets
+from shared.enums import BatchDeleteStatus, Buckets, OutboxOperation
 
 
 @pytest.mark.asyncio
@@ -12,6 +13,7 @@ async def test_delete_ok(
     fileid: FileId,
     mock_coordinator: AsyncMock,
 ):
+    mock_coordinator.data_access.delete.return_value = f"{fileid.value}.v2"
     usecase = DeleteUseCase(coordinator=mock_coordinator)
 
     await usecase.execute(fileid, bucket=Buckets.DEFAULT)
@@ -19,6 +21,42 @@ async def test_delete_ok(
     mock_coordinator.__aenter__.assert_called_once()
     mock_coordinator.__aexit__.assert_called_once_with(None, None, None)
     mock_coordinator.data_access.delete.assert_called_once_with(file_id=fileid.value)
-    mock_coordinator.file_storage.delete.assert_called_once_with(
-        file_id=fileid.value, bucket=Buckets.DEFAULT
+    mock_coordinator.outbox.add.assert_awaited_once_with(
+        operation=OutboxOperation.DELETE,
+        object_keys=[f"{fileid.value}.v2"],
+        bucket=Buckets.DEFAULT,
     )
+    mock_coordinator.file_storage.delete.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_delete_batch_reports_outcome_per_id(
+    mock_coordinator: AsyncMock,
+):
+    deleted, missing, other = FileId.new(), FileId.new(), FileId.new()
+    mock_coordinator.data_access.delete_many.return_value = {
+        deleted.value: deleted.value,
+        other.value: f"{other.value}.v2",
+    }
+    usecase = DeleteBatchUseCase(coordinator=mock_coordinator)
+
+    outcomes = await usecase.execute(
+        [deleted, missing, other, deleted], bucket=Buckets.DEFAULT
+    )
+
+    assert outcomes == {
+        deleted.value: BatchDeleteStatus.DELETED,
+        missing.value: BatchDeleteStatus.NOT_FOUND,
+        other.value: BatchDeleteStatus.DELETED,
+    }
+    mock_coordinator.data_access.delete_many.assert_awaited_once_with(
+        [deleted.value, missing.value, other.value]
+    )
+    mock_coordinator.outbox.add.assert_awaited_once_with(
+        operation=OutboxOperation.DELETE,
+        object_keys=[deleted.value, f"{other.value}.v2"],
+        bucket=Buckets.DEFAULT,
+    )
+    mock_coordinator.file_storage.delete_many.assert_not_called()
+    mock_coordinator.data_access.delete.assert_not_called()
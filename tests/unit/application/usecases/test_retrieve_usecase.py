@@ -1,10 +1,16 @@
 from collections.abc import AsyncIterator
+from dataclasses import replace
 from unittest.mock import AsyncMock
 
 import pytest
 from application.usecases.files.retrieve import RetrieveUseCase
+from application.usecases.files.retrieve_meta import RetrieveMetaUseCase
+from application.usecases.files.retrieve_meta_batch import RetrieveMetaBatchUseCase
+from application.usecases.files.retrieve_range import RetrieveRangeUseCase
 from domain.models import FileId, FileMeta
 from shared.enums import Buckets
+from shared.exceptions.application import FileOperationFailed
+from shared.io.byte_range import ByteRange, RangeSpec
 
 
 @pytest.mark.asyncio
@@ -23,6 +29,7 @@ async def test_retrieve_ok(
 
     meta, returned_stream = await usecase.execute(fileid, bucket=Buckets.DEFAULT)
 
+    cord.read.assert_called_once_with()
     cord.data_access.get.assert_called_once_with(file_id=fileid.value)
     cord.file_storage.retrieve.assert_called_once_with(
         file_id=fileid.value, bucket=Buckets.DEFAULT
@@ -33,3 +40,119 @@ async def test_retrieve_ok(
     assert meta.get_content_type() == filemeta.get_content_type()
 
     assert returned_stream == stream
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_retrieve_reads_object_key_of_row(
+    mock_coordinator: AsyncMock,
+    fileid: FileId,
+    filemeta: FileMeta,
+    stream: AsyncIterator[bytes],
+):
+    versioned = replace(filemeta, _object_key=f"{filemeta.get_id()}.v2")
+    mock_coordinator.data_access.get.return_value = versioned
+    mock_coordinator.file_storage.retrieve.return_value = stream
+
+    usecase = RetrieveUseCase(coordinator=mock_coordinator)
+
+    await usecase.execute(fileid, bucket=Buckets.DEFAULT)
+
+    mock_coordinator.file_storage.retrieve.assert_called_once_with(
+        file_id=f"{filemeta.get_id()}.v2", bucket=Buckets.DEFAULT
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_retrieve_range_opens_stream_per_range(
+    mock_coordinator: AsyncMock,
+    fileid: FileId,
+    filemeta: FileMeta,
+    stream: AsyncIterator[bytes],
+):
+    cord = mock_coordinator
+    cord.data_access.get.return_value = filemeta
+    cord.file_storage.retrieve.return_value = stream
+    size = filemeta.get_size()
+
+    usecase = RetrieveRangeUseCase(coordinator=cord)
+
+    meta, parts = await usecase.execute(
+        fileid,
+        bucket=Buckets.DEFAULT,
+        ranges=[RangeSpec(0, 0), RangeSpec(None, 1), RangeSpec(size, None)],
+    )
+
+    assert meta is filemeta
+    assert [byte_range for byte_range, _ in parts] == [
+        ByteRange(0, 0),
+        ByteRange(size - 1, size - 1),
+    ]
+    cord.file_storage.retrieve.assert_any_await(
+        file_id=fileid.value, bucket=Buckets.DEFAULT, offset=0, length=1
+    )
+    cord.file_storage.retrieve.assert_any_await(
+        file_id=fileid.value, bucket=Buckets.DEFAULT, offset=size - 1, length=1
+    )
+    assert cord.file_storage.retrieve.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_retrieve_range_unsatisfiable(
+    mock_coordinator: AsyncMock,
+    fileid: FileId,
+    filemeta: FileMeta,
+):
+    mock_coordinator.data_access.get.return_value = filemeta
+    mock_coordinator.__aexit__.return_value = False  # не глушим исключение
+    usecase = RetrieveRangeUseCase(coordinator=mock_coordinator)
+
+    with pytest.raises(FileOperationFailed) as exc_info:
+        await usecase.execute(
+            fileid,
+            bucket=Buckets.DEFAULT,
+            ranges=[RangeSpec(filemeta.get_size(), None)],
+        )
+
+    assert exc_info.value.status_code == 416
+    mock_coordinator.file_storage.retrieve.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_retrieve_meta_never_touches_storage(
+    mock_coordinator: AsyncMock,
+    fileid: FileId,
+    filemeta: FileMeta,
+):
+    mock_coordinator.data_access.get.return_value = filemeta
+    usecase = RetrieveMetaUseCase(coordinator=mock_coordinator)
+
+    meta = await usecase.execute(fileid)
+
+    assert meta is filemeta
+    mock_coordinator.data_access.get.assert_awaited_once_with(file_id=fileid.value)
+    mock_coordinator.file_storage.retrieve.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_retrieve_meta_batch_uses_single_data_access_call(
+    mock_coordinator: AsyncMock,
+    fileid: FileId,
+    filemeta: FileMeta,
+):
+    other = FileId.new()
+    mock_coordinator.data_access.get_many.return_value = [filemeta]
+    usecase = RetrieveMetaBatchUseCase(coordinator=mock_coordinator)
+
+    metas = await usecase.execute([fileid, other])
+
+    assert metas == [filemeta]
+    mock_coordinator.data_access.get_many.assert_awaited_once_with(
+        [fileid.value, other.value]
+    )
+    mock_coordinator.data_access.get.assert_not_called()
+    mock_coordinator.file_storage.retrieve.assert_not_called()
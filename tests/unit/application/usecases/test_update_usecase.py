@@ -5,10 +5,13 @@ from unittest.mock import AsyncMock
 import pytest
 from application.usecases.files.update import UpdateUseCase
 from domain.models import FileMeta
-from shared.enums import Buckets
+from shared.enums import Buckets, OutboxOperation
+from shared.io.peekable_stream import PeekableAsyncStream
 from shared.exceptions.application import (
+    ApplicationError,
     DomainRejectedError,
 )
+from shared.exceptions.infrastructure import NoResultFoundError
 
 
 @pytest.mark.asyncio
@@ -45,6 +48,113 @@ async def test_update_with_stream_and_successful_update(
     assert result.get_id() == filemeta.get_id()
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_update_with_stream_stages_then_switches_key(
+    mock_coordinator: AsyncMock,
+    mock_filehelper: AsyncMock,
+    filepolicy_mock_true: AsyncMock,
+    meta_factory_mock: AsyncMock,
+    filemeta: FileMeta,
+    stream: AsyncIterator[bytes],
+):
+    mock_filehelper.analyze.return_value = (
+        stream,
+        filemeta.get_content_type(),
+        filemeta.get_size(),
+    )
+    storage = mock_coordinator.file_storage
+    mock_coordinator.data_access.update.return_value = filemeta
+    mock_coordinator.data_access.set_object_key.return_value = "file.v1"
+    staged_before_tx = []
+    mock_coordinator.__aenter__.side_effect = lambda *_: (
+        staged_before_tx.append(storage.stage.await_count) or mock_coordinator
+    )
+
+    usecase = UpdateUseCase(
+        coordinator=mock_coordinator,
+        helper=mock_filehelper,
+        policy=filepolicy_mock_true,
+        meta_factory=meta_factory_mock,
+        version_grace=600.0,
+    )
+
+    await usecase.execute(
+        file_id=filemeta._id,  # type: ignore
+        name=filemeta._name,  # type: ignore
+        stream=stream,
+        bucket=Buckets.DEFAULT,
+    )
+
+    # запись upload в outbox до передачи, смена ключа - в отдельной транзакции
+    assert staged_before_tx == [0, 1]
+    assert storage.stage.await_args.kwargs["object_key"] == "file.v2"
+    storage.upload.assert_not_called()
+    mock_coordinator.data_access.set_object_key.assert_awaited_once_with(
+        file_id=filemeta.get_id(), object_key="file.v2"
+    )
+    outbox = mock_coordinator.outbox
+    assert [call.kwargs for call in outbox.add.await_args_list] == [
+        {
+            "operation": OutboxOperation.UPLOAD,
+            "object_keys": ["file.v2"],
+            "bucket": Buckets.DEFAULT,
+        },
+        {
+            "operation": OutboxOperation.DELETE,
+            "object_keys": ["file.v1"],
+            "bucket": Buckets.DEFAULT,
+            # прежнюю версию ещё дочитывают - удалять её сразу нельзя
+            "delay": 600.0,
+        },
+    ]
+    outbox.resolve.assert_awaited_once_with(
+        operation=OutboxOperation.UPLOAD,
+        object_key="file.v2",
+        bucket=Buckets.DEFAULT,
+    )
+    # прежнюю версию удаляет relay, не запрос; копирования в хранилище нет
+    storage.delete.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_update_with_stream_drops_staged_object_on_failure(
+    mock_coordinator: AsyncMock,
+    mock_filehelper: AsyncMock,
+    filepolicy_mock_true: AsyncMock,
+    meta_factory_mock: AsyncMock,
+    filemeta: FileMeta,
+    stream: AsyncIterator[bytes],
+):
+    mock_filehelper.analyze.return_value = (
+        stream,
+        filemeta.get_content_type(),
+        filemeta.get_size(),
+    )
+    storage = mock_coordinator.file_storage
+    mock_coordinator.data_access.update.side_effect = NoResultFoundError("gone")
+    mock_coordinator.__aexit__.return_value = False  # не глушим исключение
+
+    usecase = UpdateUseCase(
+        coordinator=mock_coordinator,
+        helper=mock_filehelper,
+        policy=filepolicy_mock_true,
+        meta_factory=meta_factory_mock,
+    )
+
+    with pytest.raises(ApplicationError):
+        await usecase.execute(
+            file_id=filemeta._id,  # type: ignore
+            name=filemeta._name,  # type: ignore
+            stream=stream,
+            bucket=Buckets.DEFAULT,
+        )
+
+    mock_coordinator.outbox.resolve.assert_not_called()
+    storage.delete.assert_awaited_once_with(file_id="file.v2", bucket=Buckets.DEFAULT)
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_update_with_stream_policy_violation(
@@ -55,8 +165,9 @@ async def test_update_with_stream_policy_violation(
     filemeta: FileMeta,
     stream: AsyncIterator[bytes],
 ):
+    peekable = PeekableAsyncStream(stream)
     mock_filehelper.analyze.return_value = (
-        stream,
+        peekable.iter(),
         filemeta.get_content_type(),
         filemeta.get_size(),
     )
@@ -75,6 +186,7 @@ async def test_update_with_stream_policy_violation(
             stream=stream,
             bucket=Buckets.DEFAULT,
         )
+    assert peekable._spool.closed
 
 
 @pytest.mark.asyncio
@@ -86,8 +198,7 @@ async def test_update_without_stream_successful_update(
     meta_factory_mock: AsyncMock,
     filemeta: FileMeta,
 ):
-    mock_coordinator.data_access.get.return_value = filemeta
-    mock_coordinator.data_access.update.return_value = filemeta
+    mock_coordinator.data_access.rename.return_value = filemeta
 
     usecase = UpdateUseCase(
         coordinator=mock_coordinator,
@@ -104,3 +215,9 @@ async def test_update_without_stream_successful_update(
     )
 
     assert result.get_id() == filemeta.get_id()
+    # только имя: ни чтения через кэш, ни перезаписи размера и checksum
+    mock_coordinator.data_access.rename.assert_awaited_once_with(
+        file_id=filemeta.get_id(), name=filemeta.get_name()
+    )
+    mock_coordinator.data_access.get.assert_not_called()
+    mock_coordinator.data_access.update.assert_not_called()
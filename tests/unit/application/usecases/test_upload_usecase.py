@@ -1,3 +1,5 @@
+import asyncio
+import hashlib
 from collections.abc import AsyncIterator
 from typing import Type
 from unittest.mock import AsyncMock
@@ -6,8 +8,11 @@ import pytest
 from application.exceptions.infra_handler import wrap_infrastructure_failures
 from application.usecases.files.upload import UploadUseCase
 from domain.models import FileMeta
-from shared.enums import Buckets
+from domain.models.create_filemeta import create_filemeta
+from shared.enums import Buckets, OutboxOperation
 from shared.exceptions.application import DomainRejectedError, FileOperationFailed
+from shared.io.peekable_stream import PeekableAsyncStream
+from shared.io.stream_inspector import StreamInspector
 from shared.exceptions.infrastructure import (
     AccessDeniedError,
     EntityTooLargeError,
@@ -53,14 +58,25 @@ async def test_upload_ok(
         bucket=Buckets.DEFAULT,
     )
 
-    mock_filehelper.analyze.assert_called_once_with(stream=stream)
+    mock_filehelper.analyze.assert_called_once_with(stream=stream, size=None)
     filepolicy_mock_true.is_allowed.assert_called_once_with(file_meta=filemeta)
-    mock_coordinator.__aenter__.assert_called_once()
-    mock_coordinator.__aexit__.assert_called_once_with(None, None, None)
+    assert mock_coordinator.__aenter__.await_count == 2
+    mock_coordinator.__aexit__.assert_called_with(None, None, None)
     mock_coordinator.data_access.save.assert_awaited_once_with(file_meta=filemeta)
-    mock_coordinator.file_storage.upload.assert_awaited_once_with(
-        file_meta=filemeta, stream=stream, bucket=Buckets.DEFAULT
+    mock_coordinator.outbox.add.assert_awaited_once_with(
+        operation=OutboxOperation.UPLOAD,
+        object_keys=[filemeta.get_id()],
+        bucket=Buckets.DEFAULT,
+    )
+    mock_coordinator.outbox.resolve.assert_awaited_once_with(
+        operation=OutboxOperation.UPLOAD,
+        object_key=filemeta.get_id(),
+        bucket=Buckets.DEFAULT,
     )
+    upload_kwargs = mock_coordinator.file_storage.upload.await_args.kwargs
+    assert upload_kwargs["file_meta"] == filemeta
+    assert upload_kwargs["bucket"] == Buckets.DEFAULT
+    assert isinstance(upload_kwargs["stream"], StreamInspector)
 
     assert result.get_id() == filemeta.get_id()
     assert result.get_content_type() == filemeta.get_content_type()
@@ -68,6 +84,301 @@ async def test_upload_ok(
     assert result.get_size() == filemeta.get_size()
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_upload_keeps_outbox_entry_alive_during_transfer(
+    mock_coordinator: AsyncMock,
+    mock_filehelper: AsyncMock,
+    filepolicy_mock_true: AsyncMock,
+    meta_factory_mock: AsyncMock,
+    filemeta: FileMeta,
+    stream: AsyncIterator[bytes],
+):
+    mock_filehelper.analyze.return_value = (
+        stream,
+        filemeta.get_content_type(),
+        filemeta.get_size(),
+    )
+
+    async def slow_upload(**kwargs: object) -> None:
+        await asyncio.sleep(0.05)
+
+    mock_coordinator.file_storage.upload.side_effect = slow_upload
+    usecase = UploadUseCase(
+        coordinator=mock_coordinator,
+        helper=mock_filehelper,
+        policy=filepolicy_mock_true,
+        meta_factory=meta_factory_mock,
+        upload_grace=0.03,
+    )
+
+    await usecase.execute(
+        name=filemeta._name,  # type: ignore
+        stream=stream,
+        bucket=Buckets.DEFAULT,
+    )
+
+    mock_coordinator.outbox.touch.assert_awaited_with(
+        operation=OutboxOperation.UPLOAD,
+        object_key=filemeta.get_id(),
+        bucket=Buckets.DEFAULT,
+    )
+    touches = mock_coordinator.outbox.touch.await_count
+    await asyncio.sleep(0.03)
+    # после передачи запись больше не продлевается
+    assert mock_coordinator.outbox.touch.await_count == touches
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_upload_passes_declared_size(
+    mock_coordinator: AsyncMock,
+    mock_filehelper: AsyncMock,
+    filepolicy_mock_true: AsyncMock,
+    meta_factory_mock: AsyncMock,
+    filemeta: FileMeta,
+    stream: AsyncIterator[bytes],
+):
+    usecase = UploadUseCase(
+        coordinator=mock_coordinator,
+        helper=mock_filehelper,
+        policy=filepolicy_mock_true,
+        meta_factory=meta_factory_mock,
+    )
+
+    await usecase.execute(
+        name=filemeta._name,  # type: ignore
+        stream=stream,
+        bucket=Buckets.DEFAULT,
+        size=filemeta.get_size(),
+    )
+
+    mock_filehelper.analyze.assert_called_once_with(
+        stream=stream, size=filemeta.get_size()
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_upload_persists_checksum_computed_while_storing(
+    mock_coordinator: AsyncMock,
+    mock_filehelper: AsyncMock,
+    filepolicy_mock_true: AsyncMock,
+    filemeta: FileMeta,
+    stream: AsyncIterator[bytes],
+    chunks: list[bytes],
+):
+    data = b"".join(chunks)
+    mock_filehelper.analyze.return_value = (
+        stream,
+        filemeta.get_content_type(),
+        len(data),
+    )
+
+    async def consume(**kwargs: object) -> None:
+        async for _ in kwargs["stream"]:  # type: ignore
+            pass
+
+    mock_coordinator.file_storage.upload.side_effect = consume
+    usecase = UploadUseCase(
+        coordinator=mock_coordinator,
+        helper=mock_filehelper,
+        policy=filepolicy_mock_true,
+        meta_factory=create_filemeta,
+    )
+
+    result = await usecase.execute(
+        name=filemeta._name,  # type: ignore
+        stream=stream,
+        bucket=Buckets.DEFAULT,
+    )
+
+    assert result.get_checksum() == hashlib.sha256(data).hexdigest()
+    mock_coordinator.data_access.save.assert_awaited_once_with(file_meta=result)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_upload_streaming_uploads_before_save(
+    mock_coordinator: AsyncMock,
+    mock_filehelper: AsyncMock,
+    filepolicy_mock_true: AsyncMock,
+    meta_factory_mock: AsyncMock,
+    filemeta: FileMeta,
+    stream: AsyncIterator[bytes],
+):
+    mock_filehelper.sniff.return_value = (stream, filemeta.get_content_type())
+    mock_coordinator.file_storage.upload_stream.return_value = filemeta.get_size()
+    usecase = UploadUseCase(
+        coordinator=mock_coordinator,
+        helper=mock_filehelper,
+        policy=filepolicy_mock_true,
+        meta_factory=meta_factory_mock,
+        streaming=True,
+    )
+
+    result = await usecase.execute(
+        name=filemeta._name,  # type: ignore
+        stream=stream,
+        bucket=Buckets.DEFAULT,
+    )
+
+    mock_filehelper.analyze.assert_not_called()
+    mock_filehelper.sniff.assert_awaited_once_with(stream=stream)
+    upload_kwargs = mock_coordinator.file_storage.upload_stream.await_args.kwargs
+    file_id, _, size, ctype, _ = meta_factory_mock.call_args.args
+    assert upload_kwargs["file_id"] == file_id
+    assert size == filemeta.get_size()
+    assert ctype == filemeta.get_content_type()
+    mock_coordinator.data_access.save.assert_awaited_once_with(file_meta=filemeta)
+    mock_coordinator.file_storage.delete.assert_not_called()
+    assert result is filemeta
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_upload_streaming_passes_max_size_to_storage(
+    mock_coordinator: AsyncMock,
+    mock_filehelper: AsyncMock,
+    filepolicy_mock_true: AsyncMock,
+    meta_factory_mock: AsyncMock,
+    filemeta: FileMeta,
+    stream: AsyncIterator[bytes],
+):
+    mock_filehelper.sniff.return_value = (stream, filemeta.get_content_type())
+    mock_coordinator.file_storage.upload_stream.return_value = filemeta.get_size()
+    usecase = UploadUseCase(
+        coordinator=mock_coordinator,
+        helper=mock_filehelper,
+        policy=filepolicy_mock_true,
+        meta_factory=meta_factory_mock,
+        streaming=True,
+        max_size=1024,
+    )
+
+    await usecase.execute(
+        name=filemeta._name,  # type: ignore
+        stream=stream,
+        bucket=Buckets.DEFAULT,
+    )
+
+    upload_kwargs = mock_coordinator.file_storage.upload_stream.await_args.kwargs
+    assert upload_kwargs["max_size"] == 1024
+    # до передачи политика видит тип и верхнюю границу размера
+    _, _, size, ctype, _ = meta_factory_mock.call_args_list[0].args
+    assert (size, ctype) == (1024, filemeta.get_content_type())
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_upload_streaming_checks_policy_before_transfer(
+    mock_coordinator: AsyncMock,
+    mock_filehelper: AsyncMock,
+    filepolicy_mock_raises_error: AsyncMock,
+    meta_factory_mock: AsyncMock,
+    filemeta: FileMeta,
+    stream: AsyncIterator[bytes],
+):
+    peekable = PeekableAsyncStream(stream)
+    mock_filehelper.sniff.return_value = (
+        peekable.iter(),
+        filemeta.get_content_type(),
+    )
+    usecase = UploadUseCase(
+        coordinator=mock_coordinator,
+        helper=mock_filehelper,
+        policy=filepolicy_mock_raises_error,
+        meta_factory=meta_factory_mock,
+        streaming=True,
+        max_size=1024,
+    )
+
+    with pytest.raises(DomainRejectedError, match="Policy violation"):
+        await usecase.execute(
+            name=filemeta._name,  # type: ignore
+            stream=stream,
+            bucket=Buckets.DEFAULT,
+        )
+
+    mock_coordinator.outbox.add.assert_not_called()
+    mock_coordinator.file_storage.upload_stream.assert_not_called()
+    # поток так и не читали, но спул анализа закрыт
+    assert peekable._spool.closed
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_upload_stores_object_outside_transaction(
+    mock_coordinator: AsyncMock,
+    mock_filehelper: AsyncMock,
+    filepolicy_mock_true: AsyncMock,
+    meta_factory_mock: AsyncMock,
+    filemeta: FileMeta,
+    stream: AsyncIterator[bytes],
+):
+    mock_filehelper.analyze.return_value = (
+        stream,
+        filemeta.get_content_type(),
+        filemeta.get_size(),
+    )
+    uploaded_before_tx = []
+    mock_coordinator.__aenter__.side_effect = lambda *_: (
+        uploaded_before_tx.append(mock_coordinator.file_storage.upload.await_count)
+        or mock_coordinator
+    )
+    usecase = UploadUseCase(
+        coordinator=mock_coordinator,
+        helper=mock_filehelper,
+        policy=filepolicy_mock_true,
+        meta_factory=meta_factory_mock,
+    )
+
+    await usecase.execute(
+        name=filemeta._name,  # type: ignore
+        stream=stream,
+        bucket=Buckets.DEFAULT,
+    )
+
+    # до передачи - только запись upload в outbox, метаданные - после
+    assert uploaded_before_tx == [0, 1]
+    mock_coordinator.data_access.save.assert_awaited_once_with(file_meta=filemeta)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_upload_streaming_removes_object_on_policy_violation(
+    mock_coordinator: AsyncMock,
+    mock_filehelper: AsyncMock,
+    filepolicy_mock_raises_error: AsyncMock,
+    meta_factory_mock: AsyncMock,
+    filemeta: FileMeta,
+    stream: AsyncIterator[bytes],
+):
+    mock_filehelper.sniff.return_value = (stream, filemeta.get_content_type())
+    mock_coordinator.file_storage.upload_stream.return_value = filemeta.get_size()
+    mock_coordinator.__aexit__.return_value = False  # не глушим исключение
+    usecase = UploadUseCase(
+        coordinator=mock_coordinator,
+        helper=mock_filehelper,
+        policy=filepolicy_mock_raises_error,
+        meta_factory=meta_factory_mock,
+        streaming=True,
+    )
+
+    with pytest.raises(DomainRejectedError, match="Policy violation"):
+        await usecase.execute(
+            name=filemeta._name,  # type: ignore
+            stream=stream,
+            bucket=Buckets.DEFAULT,
+        )
+
+    file_id = mock_coordinator.file_storage.upload_stream.await_args.kwargs["file_id"]
+    mock_coordinator.file_storage.delete.assert_awaited_once_with(
+        file_id=file_id, bucket=Buckets.DEFAULT
+    )
+    mock_coordinator.data_access.save.assert_not_called()
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_upload_raises_domain_rejected_on_policy_violation(
@@ -79,8 +390,9 @@ async def test_upload_raises_domain_rejected_on_policy_violation(
     stream: AsyncIterator[bytes],
 ):
     mock_coordinator.data_access.save.return_value = filemeta
+    peekable = PeekableAsyncStream(stream)
     mock_filehelper.analyze.return_value = (
-        stream,
+        peekable.iter(),
         filemeta.get_content_type(),
         filemeta.get_size(),
     )
@@ -97,7 +409,7 @@ async def test_upload_raises_domain_rejected_on_policy_violation(
             bucket=Buckets.DEFAULT,
         )
 
-        mock_filehelper.analyze.assert_called_once_with(stream=stream)
+        mock_filehelper.analyze.assert_called_once_with(stream=stream, size=None)
         filepolicy_mock_raises_error.is_allowed.assert_called_once_with(
             file_meta=filemeta
         )
@@ -106,6 +418,7 @@ async def test_upload_raises_domain_rejected_on_policy_violation(
         mock_coordinator.__aexit__.assert_not_called()
         mock_coordinator.data_access.save.assert_not_called()
         mock_coordinator.file_storage.upload.assert_not_called()
+    assert peekable._spool.closed
 
 
 @pytest.mark.asyncio
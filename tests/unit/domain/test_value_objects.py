@@ -1,7 +1,7 @@
 import uuid
 
 import pytest
-from domain.models import ContentType, FileId, FileName, FileSize
+from domain.models import Checksum, ContentType, FileId, FileName, FileSize
 
 
 @pytest.mark.unit
@@ -204,3 +204,33 @@ def test_filesize_raises_value_error_on_negative_value(negative_filesize: int):
         vo = FileSize(value)
 
         assert vo is not None
+
+
+@pytest.mark.unit
+def test_checksum_creation():
+    value = "a" * 64
+
+    vo = Checksum(value)
+
+    assert vo.value == value
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value",
+    [
+        "a" * 63,
+        "z" * 64,
+        None,
+        "A" * 64,
+        "0x" + "a" * 62,
+        "+" + "a" * 63,
+        "-" + "a" * 63,
+        "a_" * 32,
+        " " + "a" * 62 + " ",
+        "a" * 64 + "\n",
+    ],
+)
+def test_checksum_raises_value_error_on_invalid_value(value: str):
+    with pytest.raises(ValueError, match="64-char hex"):
+        Checksum(value)
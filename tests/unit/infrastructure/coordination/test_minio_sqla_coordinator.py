@@ -18,6 +18,7 @@ async def test_autocommit_on_success_with_cached(
     async with SqlAlchemyMinioCoordinator(
         transaction=tx_manager,
         storage=mock_minio_storage,
+        outbox=AsyncMock(),
         data_access=cached_dao,
     ):
         # внутри блока никаких исключений
@@ -46,6 +47,7 @@ async def test_autorollback_on_error_with_cached(
         async with SqlAlchemyMinioCoordinator(
             transaction=tx_manager,
             storage=mock_minio_storage,
+            outbox=AsyncMock(),
             data_access=cached_dao,
         ):
             raise DummyError("force rollback")
@@ -64,6 +66,7 @@ async def test_exposes_storage_and_data_access_with_cached(
     coordinator = SqlAlchemyMinioCoordinator(
         transaction=tx_manager,
         storage=mock_minio_storage,
+        outbox=AsyncMock(),
         data_access=cached_dao,
     )
 
@@ -79,6 +82,7 @@ async def test_coordinator_starts_transaction_with_cached(
     coordinator = SqlAlchemyMinioCoordinator(
         transaction=tx_manager,
         storage=mock_minio_storage,
+        outbox=AsyncMock(),
         data_access=cached_dao,
     )
 
@@ -100,6 +104,7 @@ async def test_autocommit_on_success_with_sql(
     async with SqlAlchemyMinioCoordinator(
         transaction=tx_manager,
         storage=mock_minio_storage,
+        outbox=AsyncMock(),
         data_access=sql_dao,
     ):
         pass
@@ -127,6 +132,7 @@ async def test_autorollback_on_error_with_sql(
         async with SqlAlchemyMinioCoordinator(
             transaction=tx_manager,
             storage=mock_minio_storage,
+            outbox=AsyncMock(),
             data_access=sql_dao,
         ):
             raise DummyError("rollback trigger")
@@ -145,6 +151,7 @@ async def test_exposes_storage_and_data_access_with_sql(
     coordinator = SqlAlchemyMinioCoordinator(
         transaction=tx_manager,
         storage=mock_minio_storage,
+        outbox=AsyncMock(),
         data_access=sql_dao,
     )
 
@@ -160,6 +167,7 @@ async def test_coordinator_starts_transaction_with_sql(
     coordinator = SqlAlchemyMinioCoordinator(
         transaction=tx_manager,
         storage=mock_minio_storage,
+        outbox=AsyncMock(),
         data_access=sql_dao,
     )
 
@@ -177,6 +185,7 @@ async def test_commit_exits_gracefully_when_transaction_is_none(
     coordinator = SqlAlchemyMinioCoordinator(
         transaction=None,  # type: ignore
         storage=mock_minio_storage,
+        outbox=AsyncMock(),
         data_access=sql_dao,
     )
 
@@ -193,7 +202,34 @@ async def test_rollback_exits_gracefully_when_transaction_is_none(
     coordinator = SqlAlchemyMinioCoordinator(
         transaction=None,  # type: ignore
         storage=mock_minio_storage,
+        outbox=AsyncMock(),
         data_access=sql_dao,
     )
 
     await coordinator.rollback()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_read_starts_transaction_in_read_only_mode_once(
+    tx_manager: TransactionManager, mock_minio_storage: AsyncMock, sql_dao: AsyncMock
+):
+    tx_manager.start = AsyncMock()
+    tx_manager.apply = AsyncMock()
+    tx_manager.end = AsyncMock()
+    coordinator = SqlAlchemyMinioCoordinator(
+        transaction=tx_manager,
+        storage=mock_minio_storage,
+        outbox=AsyncMock(),
+        data_access=sql_dao,
+    )
+
+    async with coordinator.read():
+        pass
+    async with coordinator:
+        pass
+
+    assert [call.kwargs for call in tx_manager.start.await_args_list] == [
+        {"read_only": True},
+        {"read_only": False},
+    ]
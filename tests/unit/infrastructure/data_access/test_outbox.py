@@ -0,0 +1,93 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from infrastructure.data_access.outbox import SQLAlchemyStorageOutbox
+from infrastructure.tx.context import SqlAlchemyTransactionContext
+from shared.enums import Buckets, OutboxOperation
+from shared.exceptions.infrastructure import OperationalError
+from sqlalchemy.dialects import postgresql
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_outbox_add_inserts_one_row_per_key(mock_session: AsyncMock):
+    tx_context = SqlAlchemyTransactionContext(session=mock_session)
+    tx_context._transaction = AsyncMock()  # type: ignore
+    outbox = SQLAlchemyStorageOutbox(context=tx_context)
+
+    await outbox.add(
+        operation=OutboxOperation.DELETE, object_keys=["a", "b"], bucket=Buckets.DEFAULT
+    )
+    await outbox.add(
+        operation=OutboxOperation.DELETE, object_keys=[], bucket=Buckets.DEFAULT
+    )
+
+    statement, rows = mock_session.execute.await_args.args
+    assert "storage_outbox" in str(statement)
+    assert [row["object_key"] for row in rows] == ["a", "b"]
+    mock_session.execute.assert_awaited_once()
+    assert all("not_before" not in row for row in rows)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_outbox_add_delays_entries(mock_session: AsyncMock):
+    tx_context = SqlAlchemyTransactionContext(session=mock_session)
+    tx_context._transaction = AsyncMock()  # type: ignore
+    outbox = SQLAlchemyStorageOutbox(context=tx_context)
+
+    before = datetime.now(UTC)
+    await outbox.add(
+        operation=OutboxOperation.DELETE,
+        object_keys=["a", "b"],
+        bucket=Buckets.DEFAULT,
+        delay=60.0,
+    )
+
+    _, rows = mock_session.execute.await_args.args
+    assert {row["not_before"] for row in rows} == {rows[0]["not_before"]}
+    assert rows[0]["not_before"] >= before + timedelta(seconds=60)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_outbox_resolve_fails_when_entry_reclaimed(mock_session: AsyncMock):
+    tx_context = SqlAlchemyTransactionContext(session=mock_session)
+    tx_context._transaction = AsyncMock()  # type: ignore
+    mock_session.execute.return_value = MagicMock(
+        scalar_one_or_none=MagicMock(return_value=None)
+    )
+    outbox = SQLAlchemyStorageOutbox(context=tx_context)
+
+    with pytest.raises(OperationalError):
+        await outbox.resolve(
+            operation=OutboxOperation.UPLOAD, object_key="a", bucket=Buckets.DEFAULT
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_outbox_touch_skips_claimed_entry(mock_session: AsyncMock):
+    tx_context = SqlAlchemyTransactionContext(session=mock_session)
+    tx_context._transaction = AsyncMock()  # type: ignore
+    mock_session.execute.return_value = MagicMock(
+        scalar_one_or_none=MagicMock(return_value=None)
+    )
+    outbox = SQLAlchemyStorageOutbox(context=tx_context)
+
+    with pytest.raises(OperationalError):
+        await outbox.touch(
+            operation=OutboxOperation.UPLOAD, object_key="a", bucket=Buckets.DEFAULT
+        )
+
+    statement = str(
+        mock_session.execute.await_args.args[0].compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"render_postcompile": True},
+        )
+    )
+    assert "SET touched_at" in statement
+    assert "claimed_until IS NULL" in statement
+    # литерал, а не параметр - под частичный индекс ix_storage_outbox_upload_key
+    assert "storage_outbox.operation = 'upload'" in statement
@@ -0,0 +1,48 @@
+from unittest.mock import MagicMock
+
+import pytest
+from infrastructure.data_access.pool import InstrumentedAsyncPool
+from prometheus_client import REGISTRY
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.util import greenlet_spawn
+
+
+def sample(name: str, pool: str) -> float | None:
+    return REGISTRY.get_sample_value(name, {"pool": pool})
+
+
+@pytest.mark.unit
+def test_pool_reports_capacity_and_connections_in_use():
+    pool = InstrumentedAsyncPool(
+        MagicMock, pool_size=2, max_overflow=1, logging_name="test-usage"
+    )
+
+    assert sample("fileferry_db_pool_capacity", "test-usage") == 3
+    first, second = pool.connect(), pool.connect()
+    assert sample("fileferry_db_pool_in_use", "test-usage") == 2
+
+    first.close()
+    assert sample("fileferry_db_pool_in_use", "test-usage") == 1
+    assert sample("fileferry_db_pool_idle", "test-usage") == 1
+    second.close()
+    assert sample("fileferry_db_pool_in_use", "test-usage") == 0
+    assert sample("fileferry_db_pool_waiting", "test-usage") == 0
+    assert sample("fileferry_db_pool_checkout_wait_seconds_count", "test-usage") == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_pool_keeps_label_after_recreate():
+    pool = InstrumentedAsyncPool(
+        MagicMock, pool_size=1, max_overflow=0, timeout=0, logging_name="test-recreate"
+    )
+
+    recreated = pool.recreate()
+    held = recreated.connect()
+
+    assert isinstance(recreated, InstrumentedAsyncPool)
+    assert sample("fileferry_db_pool_in_use", "test-recreate") == 1
+    with pytest.raises(PoolTimeoutError):
+        await greenlet_spawn(recreated.connect)
+    assert sample("fileferry_db_pool_waiting", "test-recreate") == 0
+    held.close()
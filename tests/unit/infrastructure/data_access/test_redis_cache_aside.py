@@ -1,9 +1,15 @@
-from unittest.mock import AsyncMock
+import asyncio
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from domain.models import FileMeta
+from domain.models import FileId, FileMeta, FileSize
 from infrastructure.data_access.redis import CachedFileMetaDataAccess
 from infrastructure.tasks.scheduler import AsyncioFireAndForget
+from infrastructure.tx.routing import ReadRouter, reading_replica
+from infrastructure.types.cache import CachedFileMeta
+from infrastructure.utils.single_flight import SingleFlight
+from shared.exceptions.infrastructure import NoResultFoundError
 
 
 @pytest.mark.asyncio
@@ -83,6 +89,70 @@ async def test_delete_delegates_and_invalidates(
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_set_object_key_invalidates_and_returns_previous_key(
+    mock_sql_data_access: AsyncMock,
+    mock_redis_storage: AsyncMock,
+    mock_cache_invalidator: AsyncMock,
+    task_scheduler: AsyncioFireAndForget,
+    valid_uuid: str,
+):
+    mock_sql_data_access.set_object_key.return_value = valid_uuid
+    bus = MagicMock()
+    dao = CachedFileMetaDataAccess(
+        invalidator=mock_cache_invalidator,
+        storage=mock_redis_storage,
+        scheduler=task_scheduler,
+        delegate=mock_sql_data_access,
+        ttl=300,
+        bus=bus,
+    )
+
+    previous = await dao.set_object_key(valid_uuid, f"{valid_uuid}.v2")
+
+    assert previous == valid_uuid
+    mock_sql_data_access.set_object_key.assert_awaited_once_with(
+        valid_uuid, f"{valid_uuid}.v2"
+    )
+    mock_cache_invalidator.invalidate.assert_called_once_with(
+        valid_uuid, max_retry_seconds=300
+    )
+    bus.publish.assert_called_once_with(valid_uuid)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_rename_invalidates_and_returns_row(
+    mock_sql_data_access: AsyncMock,
+    mock_redis_storage: AsyncMock,
+    mock_cache_invalidator: AsyncMock,
+    task_scheduler: AsyncioFireAndForget,
+    filemeta: FileMeta,
+):
+    mock_sql_data_access.rename.return_value = filemeta
+    bus = MagicMock()
+    dao = CachedFileMetaDataAccess(
+        invalidator=mock_cache_invalidator,
+        storage=mock_redis_storage,
+        scheduler=task_scheduler,
+        delegate=mock_sql_data_access,
+        ttl=300,
+        bus=bus,
+    )
+
+    assert await dao.rename(filemeta.get_id(), "renamed.bin") == filemeta
+
+    mock_sql_data_access.rename.assert_awaited_once_with(
+        filemeta.get_id(), "renamed.bin"
+    )
+    mock_redis_storage.get.assert_not_called()
+    mock_cache_invalidator.invalidate.assert_called_once_with(
+        filemeta.get_id(), max_retry_seconds=300
+    )
+    bus.publish.assert_called_once_with(filemeta.get_id())
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_healthcheck_returns_aggregated_status(
@@ -213,6 +283,44 @@ async def test_get_fallbacks_to_delegate_and_sets_cache(
     mock_redis_storage.set.assert_called_once_with(filemeta, ttl=100)
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_replica_reads_do_not_fill_cache(
+    mock_sql_data_access: AsyncMock,
+    mock_redis_storage: AsyncMock,
+    mock_cache_invalidator: AsyncMock,
+    task_scheduler: AsyncioFireAndForget,
+    filemeta: FileMeta,
+):
+    mock_redis_storage.get.return_value = None
+    mock_redis_storage.get_many.return_value = {}
+    mock_sql_data_access.get.side_effect = [filemeta, NoResultFoundError("gone")]
+    mock_sql_data_access.get_many.return_value = [filemeta]
+    dao = CachedFileMetaDataAccess(
+        invalidator=mock_cache_invalidator,
+        storage=mock_redis_storage,
+        scheduler=task_scheduler,
+        delegate=mock_sql_data_access,
+        negative_ttl=15,
+    )
+    router = ReadRouter(primary=MagicMock(), replica=MagicMock())
+
+    router.read_bind()
+    try:
+        assert await dao.get(filemeta.get_id()) == filemeta
+        with pytest.raises(NoResultFoundError):
+            await dao.get(FileId.new().value)
+        assert await dao.get_many([filemeta.get_id(), FileId.new().value]) == [filemeta]
+        await asyncio.sleep(0)
+    finally:
+        router.end_read()
+
+    # реплика могла отстать: ни её строки, ни её промахи в кэш не попадают
+    mock_redis_storage.set.assert_not_called()
+    mock_redis_storage.set_many.assert_not_called()
+    mock_redis_storage.set_missing.assert_not_called()
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_get_returns_none_if_delegate_returns_none(
@@ -310,3 +418,432 @@ async def test_update_returns_none_and_skips_invalidation(
 
     assert result is None
     mock_cache_invalidator.invalidate.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_update_and_delete_broadcast_invalidation(
+    mock_sql_data_access: AsyncMock,
+    mock_redis_storage: AsyncMock,
+    mock_cache_invalidator: AsyncMock,
+    task_scheduler: AsyncioFireAndForget,
+    filemeta: FileMeta,
+):
+    mock_sql_data_access.update.return_value = filemeta
+    bus = MagicMock()
+    dao = CachedFileMetaDataAccess(
+        invalidator=mock_cache_invalidator,
+        storage=mock_redis_storage,
+        scheduler=task_scheduler,
+        delegate=mock_sql_data_access,
+        bus=bus,
+    )
+
+    await dao.update(filemeta)
+    await dao.delete(filemeta.get_id())
+
+    assert bus.publish.call_count == 2
+    bus.publish.assert_called_with(filemeta.get_id())
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_concurrent_misses_hit_delegate_once(
+    mock_sql_data_access: AsyncMock,
+    mock_redis_storage: AsyncMock,
+    mock_cache_invalidator: AsyncMock,
+    task_scheduler: AsyncioFireAndForget,
+    filemeta: FileMeta,
+):
+    mock_redis_storage.get.return_value = None
+
+    async def slow_get(file_id: str) -> FileMeta:
+        await asyncio.sleep(0.01)
+        return filemeta
+
+    mock_sql_data_access.get.side_effect = slow_get
+    flight: SingleFlight[FileMeta] = SingleFlight()
+    daos = [
+        CachedFileMetaDataAccess(
+            invalidator=mock_cache_invalidator,
+            storage=mock_redis_storage,
+            scheduler=task_scheduler,
+            delegate=mock_sql_data_access,
+            flight=flight,
+        )
+        for _ in range(5)
+    ]
+
+    results = await asyncio.gather(*(dao.get(filemeta.get_id()) for dao in daos))
+    await asyncio.sleep(0)
+
+    assert results == [filemeta] * 5
+    mock_sql_data_access.get.assert_awaited_once_with(filemeta.get_id())
+    mock_redis_storage.set.assert_called_once_with(filemeta, ttl=300)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_primary_miss_does_not_join_replica_flight(
+    mock_sql_data_access: AsyncMock,
+    mock_redis_storage: AsyncMock,
+    mock_cache_invalidator: AsyncMock,
+    task_scheduler: AsyncioFireAndForget,
+    filemeta: FileMeta,
+):
+    mock_redis_storage.get.return_value = None
+    stale = replace(filemeta, _size=FileSize(filemeta.get_size() + 1))
+    router = ReadRouter(primary=MagicMock(), replica=MagicMock())
+
+    async def get(file_id: str) -> FileMeta:
+        await asyncio.sleep(0.01)
+        return stale if reading_replica() else filemeta
+
+    mock_sql_data_access.get.side_effect = get
+    flight: SingleFlight[FileMeta] = SingleFlight()
+    dao = CachedFileMetaDataAccess(
+        invalidator=mock_cache_invalidator,
+        storage=mock_redis_storage,
+        scheduler=task_scheduler,
+        delegate=mock_sql_data_access,
+        flight=flight,
+    )
+
+    async def from_replica() -> FileMeta:
+        router.read_bind()
+        return await dao.get(filemeta.get_id())
+
+    replica_read = asyncio.create_task(from_replica())
+    await asyncio.sleep(0)
+    # тот же id с primary (read-your-writes) - свой запрос, не чужой результат
+    assert await dao.get(filemeta.get_id()) == filemeta
+    assert await replica_read == stale
+    assert mock_sql_data_access.get.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_get_caches_missing_id(
+    mock_sql_data_access: AsyncMock,
+    mock_redis_storage: AsyncMock,
+    mock_cache_invalidator: AsyncMock,
+    task_scheduler: AsyncioFireAndForget,
+    filemeta: FileMeta,
+):
+    mock_redis_storage.get.return_value = None
+    mock_sql_data_access.get.side_effect = NoResultFoundError()
+    dao = CachedFileMetaDataAccess(
+        invalidator=mock_cache_invalidator,
+        storage=mock_redis_storage,
+        scheduler=task_scheduler,
+        delegate=mock_sql_data_access,
+        negative_ttl=15,
+    )
+
+    with pytest.raises(NoResultFoundError):
+        await dao.get(filemeta.get_id())
+    await asyncio.sleep(0)
+
+    mock_redis_storage.set_missing.assert_called_once_with(filemeta.get_id(), ttl=15)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_get_skips_negative_cache_when_disabled(
+    mock_sql_data_access: AsyncMock,
+    mock_redis_storage: AsyncMock,
+    mock_cache_invalidator: AsyncMock,
+    task_scheduler: AsyncioFireAndForget,
+    filemeta: FileMeta,
+):
+    mock_redis_storage.get.return_value = None
+    mock_sql_data_access.get.side_effect = NoResultFoundError()
+    dao = CachedFileMetaDataAccess(
+        invalidator=mock_cache_invalidator,
+        storage=mock_redis_storage,
+        scheduler=task_scheduler,
+        delegate=mock_sql_data_access,
+        negative_ttl=0,
+    )
+
+    with pytest.raises(NoResultFoundError):
+        await dao.get(filemeta.get_id())
+    await asyncio.sleep(0)
+
+    mock_redis_storage.set_missing.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_save_clears_negative_entry_everywhere(
+    mock_sql_data_access: AsyncMock,
+    mock_redis_storage: AsyncMock,
+    mock_cache_invalidator: AsyncMock,
+    task_scheduler: AsyncioFireAndForget,
+    filemeta: FileMeta,
+):
+    mock_sql_data_access.save.return_value = filemeta
+    bus = MagicMock()
+    dao = CachedFileMetaDataAccess(
+        invalidator=mock_cache_invalidator,
+        storage=mock_redis_storage,
+        scheduler=task_scheduler,
+        delegate=mock_sql_data_access,
+        bus=bus,
+    )
+
+    await dao.save(filemeta)
+    await asyncio.sleep(0)
+
+    mock_redis_storage.set.assert_called_once_with(filemeta, ttl=300)
+    bus.publish.assert_called_once_with(filemeta.get_id())
+
+
+def _swr_dao(
+    storage: AsyncMock,
+    delegate: AsyncMock,
+    invalidator: AsyncMock,
+    scheduler: AsyncioFireAndForget,
+    refresher: AsyncMock,
+    negative_ttl: int = 30,
+) -> CachedFileMetaDataAccess:
+    return CachedFileMetaDataAccess(
+        invalidator=invalidator,
+        storage=storage,
+        scheduler=scheduler,
+        delegate=delegate,
+        ttl=300,
+        negative_ttl=negative_ttl,
+        stale_ttl=60,
+        refresher=refresher,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_swr_fresh_entry_does_not_refresh(
+    mock_sql_data_access: AsyncMock,
+    mock_redis_storage: AsyncMock,
+    mock_cache_invalidator: AsyncMock,
+    task_scheduler: AsyncioFireAndForget,
+    filemeta: FileMeta,
+):
+    refresher = AsyncMock()
+    mock_redis_storage.get_entry.return_value = CachedFileMeta(filemeta, 200.0)
+    dao = _swr_dao(
+        mock_redis_storage,
+        mock_sql_data_access,
+        mock_cache_invalidator,
+        task_scheduler,
+        refresher,
+    )
+
+    assert await dao.get(filemeta.get_id()) == filemeta
+    await asyncio.sleep(0)
+
+    refresher.get.assert_not_called()
+    mock_sql_data_access.get.assert_not_called()
+    mock_redis_storage.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_swr_stale_entry_served_and_refreshed_once(
+    mock_sql_data_access: AsyncMock,
+    mock_redis_storage: AsyncMock,
+    mock_cache_invalidator: AsyncMock,
+    task_scheduler: AsyncioFireAndForget,
+    filemeta: FileMeta,
+):
+    release = asyncio.Event()
+
+    async def slow_get(file_id: str) -> FileMeta:
+        await release.wait()
+        return filemeta
+
+    refresher = AsyncMock()
+    refresher.get.side_effect = slow_get
+    mock_redis_storage.get_entry.return_value = CachedFileMeta(filemeta, 10.0)
+    dao = _swr_dao(
+        mock_redis_storage,
+        mock_sql_data_access,
+        mock_cache_invalidator,
+        task_scheduler,
+        refresher,
+    )
+
+    results = [await dao.get(filemeta.get_id()) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert results == [filemeta] * 3
+    refresher.get.assert_awaited_once_with(filemeta.get_id())
+    mock_sql_data_access.get.assert_not_called()
+    mock_redis_storage.set.assert_called_once_with(filemeta, ttl=360)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_swr_expired_entry_is_a_miss(
+    mock_sql_data_access: AsyncMock,
+    mock_redis_storage: AsyncMock,
+    mock_cache_invalidator: AsyncMock,
+    task_scheduler: AsyncioFireAndForget,
+    filemeta: FileMeta,
+):
+    refresher = AsyncMock()
+    mock_redis_storage.get_entry.return_value = None
+    mock_sql_data_access.get.return_value = filemeta
+    dao = _swr_dao(
+        mock_redis_storage,
+        mock_sql_data_access,
+        mock_cache_invalidator,
+        task_scheduler,
+        refresher,
+    )
+
+    assert await dao.get(filemeta.get_id()) == filemeta
+    await asyncio.sleep(0)
+
+    mock_sql_data_access.get.assert_awaited_once_with(filemeta.get_id())
+    refresher.get.assert_not_called()
+    mock_redis_storage.set.assert_called_once_with(filemeta, ttl=360)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_swr_refresh_of_deleted_file_marks_missing(
+    mock_sql_data_access: AsyncMock,
+    mock_redis_storage: AsyncMock,
+    mock_cache_invalidator: AsyncMock,
+    task_scheduler: AsyncioFireAndForget,
+    filemeta: FileMeta,
+):
+    refresher = AsyncMock()
+    refresher.get.side_effect = NoResultFoundError()
+    mock_redis_storage.get_entry.return_value = CachedFileMeta(filemeta, 1.0)
+    dao = _swr_dao(
+        mock_redis_storage,
+        mock_sql_data_access,
+        mock_cache_invalidator,
+        task_scheduler,
+        refresher,
+        negative_ttl=15,
+    )
+
+    assert await dao.get(filemeta.get_id()) == filemeta
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    mock_redis_storage.delete.assert_awaited_once_with(filemeta.get_id())
+    mock_redis_storage.set_missing.assert_awaited_once_with(filemeta.get_id(), ttl=15)
+    mock_redis_storage.set.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_swr_disabled_without_refresher(
+    mock_sql_data_access: AsyncMock,
+    mock_redis_storage: AsyncMock,
+    mock_cache_invalidator: AsyncMock,
+    task_scheduler: AsyncioFireAndForget,
+    filemeta: FileMeta,
+):
+    mock_redis_storage.get.return_value = filemeta
+    dao = CachedFileMetaDataAccess(
+        invalidator=mock_cache_invalidator,
+        storage=mock_redis_storage,
+        scheduler=task_scheduler,
+        delegate=mock_sql_data_access,
+        stale_ttl=60,
+    )
+
+    assert await dao.get(filemeta.get_id()) == filemeta
+
+    mock_redis_storage.get_entry.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_get_many_loads_only_cache_misses(
+    mock_sql_data_access: AsyncMock,
+    mock_redis_storage: AsyncMock,
+    mock_cache_invalidator: AsyncMock,
+    task_scheduler: AsyncioFireAndForget,
+    filemeta: FileMeta,
+):
+    cold = replace(filemeta, _id=FileId.new())
+    gone, unknown = FileId.new().value, FileId.new().value
+    mock_redis_storage.get_many.return_value = {filemeta.get_id(): filemeta, gone: None}
+    mock_sql_data_access.get_many.return_value = [cold]
+    dao = CachedFileMetaDataAccess(
+        invalidator=mock_cache_invalidator,
+        storage=mock_redis_storage,
+        scheduler=task_scheduler,
+        delegate=mock_sql_data_access,
+        negative_ttl=15,
+    )
+
+    ids = [cold.get_id(), gone, filemeta.get_id(), unknown, cold.get_id()]
+    metas = await dao.get_many(ids)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert metas == [cold, filemeta]
+    mock_redis_storage.get_many.assert_awaited_once_with(
+        [cold.get_id(), gone, filemeta.get_id(), unknown]
+    )
+    mock_sql_data_access.get_many.assert_awaited_once_with([cold.get_id(), unknown])
+    mock_sql_data_access.get.assert_not_called()
+    mock_redis_storage.set_many.assert_awaited_once_with([cold], ttl=300)
+    mock_redis_storage.set_missing.assert_awaited_once_with(unknown, ttl=15)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_get_many_all_cached_skips_database(
+    mock_sql_data_access: AsyncMock,
+    mock_redis_storage: AsyncMock,
+    mock_cache_invalidator: AsyncMock,
+    task_scheduler: AsyncioFireAndForget,
+    filemeta: FileMeta,
+):
+    mock_redis_storage.get_many.return_value = {filemeta.get_id(): filemeta}
+    dao = CachedFileMetaDataAccess(
+        invalidator=mock_cache_invalidator,
+        storage=mock_redis_storage,
+        scheduler=task_scheduler,
+        delegate=mock_sql_data_access,
+    )
+
+    assert await dao.get_many([filemeta.get_id()]) == [filemeta]
+    mock_sql_data_access.get_many.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_delete_many_invalidates_deleted_ids_at_once(
+    mock_sql_data_access: AsyncMock,
+    mock_redis_storage: AsyncMock,
+    mock_cache_invalidator: AsyncMock,
+    task_scheduler: AsyncioFireAndForget,
+):
+    mock_sql_data_access.delete_many.return_value = {"a": "a", "c": "c.v2"}
+    bus = MagicMock()
+    dao = CachedFileMetaDataAccess(
+        invalidator=mock_cache_invalidator,
+        storage=mock_redis_storage,
+        scheduler=task_scheduler,
+        delegate=mock_sql_data_access,
+        bus=bus,
+    )
+
+    assert await dao.delete_many(["a", "b", "c"]) == {"a": "a", "c": "c.v2"}
+
+    mock_cache_invalidator.invalidate_many.assert_awaited_once_with(
+        ["a", "c"], max_retry_seconds=300
+    )
+    mock_cache_invalidator.invalidate.assert_not_called()
+    assert [c.args[0] for c in bus.publish.call_args_list] == ["a", "c"]
@@ -52,6 +52,45 @@ async def test_sql_data_access_save_get(
     await tx_context.close()
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sql_data_access_get_many(
+    tx_context: SqlAlchemyTransactionContext, filemeta: FileMeta
+):
+    dao = SQLAlchemyFileMetaDataAccess(context=tx_context)
+
+    await tx_context.begin()
+
+    await dao.save(filemeta)
+    unknown = uuid.uuid4().hex
+
+    metas = await dao.get_many([unknown, filemeta.get_id(), filemeta.get_id()])
+
+    assert [meta.get_id() for meta in metas] == [filemeta.get_id()]
+    assert await dao.get_many([]) == []
+
+    await tx_context.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sql_data_access_delete_many(
+    tx_context: SqlAlchemyTransactionContext, filemeta: FileMeta
+):
+    dao = SQLAlchemyFileMetaDataAccess(context=tx_context)
+
+    await tx_context.begin()
+
+    await dao.save(filemeta)
+
+    deleted = await dao.delete_many([filemeta.get_id(), uuid.uuid4().hex])
+
+    assert deleted == {filemeta.get_id(): filemeta.get_id()}
+    assert await dao.get_many([filemeta.get_id()]) == []
+
+    await tx_context.close()
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_sql_data_access_save_delete(
@@ -104,6 +143,32 @@ async def test_sql_data_access_save_update(
     assert meta.get_id() == replaced_meta.get_id()
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sql_data_access_set_object_key(
+    tx_context: SqlAlchemyTransactionContext, filemeta: FileMeta
+):
+    dao = SQLAlchemyFileMetaDataAccess(context=tx_context)
+    versioned = f"{filemeta.get_id()}.v2"
+
+    await tx_context.begin()
+
+    await dao.save(filemeta)
+
+    assert await dao.set_object_key(filemeta.get_id(), versioned) == filemeta.get_id()
+    meta = await dao.get(filemeta.get_id())
+    assert meta.get_object_key() == versioned
+    # update() ключ объекта не трогает
+    meta = await dao.update(meta=filemeta)
+    assert meta.get_object_key() == versioned
+    meta = await dao.rename(filemeta.get_id(), "renamed.bin")
+    assert meta.get_name() == "renamed.bin"
+    assert meta.get_object_key() == versioned
+    assert await dao.delete(filemeta.get_id()) == versioned
+
+    await tx_context.close()
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
@@ -118,6 +183,10 @@ async def test_sql_data_access_save_update(
         ("get", DataAccessError, DataAccessError, "execute"),
         ("get", Exception, DataAccessError, "execute"),
         ("get", RuntimeError, DataAccessError, "execute"),
+        ("update", NoResultFound, NoResultFoundError, "execute"),
+        ("update", OperationalError, AppOperationalError, "execute"),
+        ("rename", NoResultFound, NoResultFoundError, "execute"),
+        ("delete", NoResultFound, NoResultFoundError, "execute"),
     ],
 )
 async def test_sqlalchemy_error_mapping(
@@ -149,10 +218,18 @@ async def test_sqlalchemy_error_mapping(
     with pytest.raises(expected_error):
         if method_name == "save":
             await dao.save(file_meta)
+        elif method_name == "update":
+            await dao.update(file_meta)
+        elif method_name == "rename":
+            await dao.rename(_uuid, "renamed")
+        elif method_name == "delete":
+            await dao.delete(_uuid)
         else:
             await dao.get(_uuid)
 
     mocked_method.assert_called_once()
+    if method_name in ("update", "rename", "delete"):
+        mock_session.flush.assert_not_called()
 
 
 @pytest.mark.asyncio
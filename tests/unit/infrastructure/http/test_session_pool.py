@@ -0,0 +1,31 @@
+import pytest
+from infrastructure.http.session_pool import HttpSessionPool
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_session_is_reused_between_calls():
+    pool = HttpSessionPool(limit=5, limit_per_host=2, keepalive_timeout=15)
+
+    first = pool.session()
+    second = pool.session()
+
+    assert first is second
+    connector = first._client.connector  # type: ignore
+    assert connector.limit == 5
+    assert connector.limit_per_host == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_close_releases_session_and_allows_recreate():
+    pool = HttpSessionPool()
+
+    first = pool.session()
+    await pool.close()
+
+    assert first._client.closed  # type: ignore
+    second = pool.session()
+    assert second is not first
+    await pool.close()
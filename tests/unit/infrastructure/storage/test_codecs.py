@@ -0,0 +1,101 @@
+import json
+from dataclasses import replace
+from datetime import UTC, datetime
+
+import pytest
+from domain.models import FileMeta
+from domain.models.value_objects import Checksum, FileId
+from infrastructure.storage.codecs import (
+    BinaryFileMetaCodec,
+    JsonFileMetaCodec,
+    resolve_codec,
+)
+
+UPDATED_AT = datetime(2026, 5, 6, 7, 8, 9, 123456, tzinfo=UTC)
+
+
+@pytest.fixture
+def full_meta(filemeta: FileMeta) -> FileMeta:
+    return replace(
+        filemeta,
+        _checksum=Checksum("0f" * 32),
+        _updated_at=UPDATED_AT,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("trusted", [True, False])
+def test_binary_roundtrip(full_meta: FileMeta, trusted: bool):
+    codec = BinaryFileMetaCodec(trusted=trusted)
+
+    raw = codec.encode(full_meta)
+
+    assert raw[0] == BinaryFileMetaCodec.VERSION
+    assert codec.decode(raw) == full_meta
+
+
+@pytest.mark.unit
+def test_binary_roundtrip_without_optional_fields(filemeta: FileMeta):
+    codec = BinaryFileMetaCodec()
+
+    assert codec.decode(codec.encode(filemeta)) == filemeta
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("trusted", [True, False])
+def test_binary_roundtrip_with_object_key(full_meta: FileMeta, trusted: bool):
+    codec = BinaryFileMetaCodec(trusted=trusted)
+    versioned = replace(full_meta, _object_key=f"{full_meta.get_id()}.v2")
+
+    raw = codec.encode(versioned)
+
+    # старые читатели видят незнакомую версию - промах, а не объект по id
+    assert raw[0] == BinaryFileMetaCodec.VERSION_WITH_KEY
+    assert codec.decode(raw) == versioned
+    assert JsonFileMetaCodec().decode(JsonFileMetaCodec().encode(versioned)) == (
+        versioned
+    )
+
+
+@pytest.mark.unit
+def test_binary_is_smaller_than_json(full_meta: FileMeta):
+    assert len(BinaryFileMetaCodec().encode(full_meta)) < len(
+        JsonFileMetaCodec().encode(full_meta)
+    )
+
+
+@pytest.mark.unit
+def test_binary_reads_legacy_json(full_meta: FileMeta):
+    legacy = JsonFileMetaCodec().encode(full_meta)
+
+    assert BinaryFileMetaCodec().decode(legacy) == full_meta
+
+
+@pytest.mark.unit
+def test_binary_unknown_version_is_a_miss(full_meta: FileMeta):
+    raw = BinaryFileMetaCodec().encode(full_meta)
+
+    assert BinaryFileMetaCodec().decode(b"\x03" + raw[1:]) is None
+
+
+@pytest.mark.unit
+def test_binary_keeps_non_hex_ids_as_json(filemeta: FileMeta):
+    dashed = str(FileId.new().value)
+    dashed = (
+        f"{dashed[:8]}-{dashed[8:12]}-{dashed[12:16]}-{dashed[16:20]}-{dashed[20:]}"
+    )
+    meta = replace(filemeta, _id=FileId(dashed))
+    codec = BinaryFileMetaCodec()
+
+    raw = codec.encode(meta)
+
+    assert json.loads(raw)["id"] == dashed
+    assert codec.decode(raw) == meta
+
+
+@pytest.mark.unit
+def test_resolve_codec():
+    assert isinstance(resolve_codec("json"), JsonFileMetaCodec)
+    assert isinstance(resolve_codec("binary"), BinaryFileMetaCodec)
+    with pytest.raises(ValueError):
+        resolve_codec("xml")
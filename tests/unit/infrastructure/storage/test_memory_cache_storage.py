@@ -0,0 +1,187 @@
+from dataclasses import replace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from domain.models import FileId, FileMeta
+from infrastructure.storage.memory import (
+    LocalFileMetaCache,
+    TieredFileMetaCacheStorage,
+)
+from infrastructure.types.cache import CachedFileMeta
+from shared.exceptions.infrastructure import NoResultFoundError
+
+
+@pytest.mark.unit
+def test_local_cache_evicts_least_recently_used(filemeta: FileMeta):
+    cache = LocalFileMetaCache(max_entries=2, ttl=60)
+    first = replace(filemeta, _id=FileId.new())
+    second = replace(filemeta, _id=FileId.new())
+
+    cache.set(filemeta)
+    cache.set(first)
+    assert cache.get(filemeta.get_id()) is filemeta  # filemeta стал свежее first
+    cache.set(second)
+
+    assert len(cache) == 2
+    assert cache.get(first.get_id()) is None
+    assert cache.get(filemeta.get_id()) is filemeta
+    assert cache.get(second.get_id()) is second
+
+
+@pytest.mark.unit
+def test_local_cache_entry_expires(filemeta: FileMeta):
+    cache = LocalFileMetaCache(max_entries=10, ttl=5)
+
+    with patch("infrastructure.storage.memory.time.monotonic", return_value=100.0):
+        cache.set(filemeta, ttl=300)  # ttl L2 не продлевает жизнь в L1
+    with patch("infrastructure.storage.memory.time.monotonic", return_value=104.0):
+        assert cache.get(filemeta.get_id()) is filemeta
+    with patch("infrastructure.storage.memory.time.monotonic", return_value=105.0):
+        assert cache.get(filemeta.get_id()) is None
+
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_local_cache_disabled(filemeta: FileMeta):
+    cache = LocalFileMetaCache(max_entries=0)
+
+    cache.set(filemeta)
+
+    assert not cache.enabled
+    assert cache.get(filemeta.get_id()) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_tiered_hit_skips_remote(
+    mock_redis_storage: AsyncMock, filemeta: FileMeta
+):
+    mock_redis_storage.get.return_value = filemeta
+    storage = TieredFileMetaCacheStorage(
+        local=LocalFileMetaCache(), remote=mock_redis_storage
+    )
+
+    assert await storage.get(filemeta.get_id()) is filemeta
+    assert await storage.get(filemeta.get_id()) is filemeta
+
+    mock_redis_storage.get.assert_awaited_once_with(filemeta.get_id())
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_tiered_miss_is_not_cached_locally(
+    mock_redis_storage: AsyncMock, filemeta: FileMeta
+):
+    mock_redis_storage.get.return_value = None
+    local = LocalFileMetaCache()
+    storage = TieredFileMetaCacheStorage(local=local, remote=mock_redis_storage)
+
+    assert await storage.get(filemeta.get_id()) is None
+    assert len(local) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_tiered_get_entry_warms_local_and_reports_fresh(
+    mock_redis_storage: AsyncMock, filemeta: FileMeta
+):
+    mock_redis_storage.get_entry.return_value = CachedFileMeta(filemeta, 42.0)
+    storage = TieredFileMetaCacheStorage(
+        local=LocalFileMetaCache(), remote=mock_redis_storage
+    )
+
+    remote = await storage.get_entry(filemeta.get_id())
+    local = await storage.get_entry(filemeta.get_id())
+
+    assert remote == CachedFileMeta(filemeta, 42.0)
+    assert local == CachedFileMeta(filemeta, None)
+    mock_redis_storage.get_entry.assert_awaited_once_with(filemeta.get_id())
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_tiered_get_many_asks_remote_only_for_local_misses(
+    mock_redis_storage: AsyncMock, filemeta: FileMeta
+):
+    cold = replace(filemeta, _id=FileId.new())
+    local = LocalFileMetaCache()
+    local.set(filemeta)
+    local.set_missing("gone")
+    mock_redis_storage.get_many.return_value = {cold.get_id(): cold, "lost": None}
+    storage = TieredFileMetaCacheStorage(local=local, remote=mock_redis_storage)
+
+    found = await storage.get_many([filemeta.get_id(), "gone", cold.get_id(), "lost"])
+
+    assert found == {
+        filemeta.get_id(): filemeta,
+        "gone": None,
+        cold.get_id(): cold,
+        "lost": None,
+    }
+    mock_redis_storage.get_many.assert_awaited_once_with([cold.get_id(), "lost"])
+    assert local.get(cold.get_id()) is cold
+    with pytest.raises(NoResultFoundError):
+        local.get("lost")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_tiered_set_and_delete_reach_both_levels(
+    mock_redis_storage: AsyncMock, filemeta: FileMeta
+):
+    local = LocalFileMetaCache()
+    storage = TieredFileMetaCacheStorage(local=local, remote=mock_redis_storage)
+
+    await storage.set(filemeta, ttl=300)
+    assert local.get(filemeta.get_id()) is filemeta
+    mock_redis_storage.set.assert_awaited_once_with(filemeta, ttl=300)
+
+    await storage.delete(filemeta.get_id())
+    assert local.get(filemeta.get_id()) is None
+    mock_redis_storage.delete.assert_awaited_once_with(filemeta.get_id())
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_tiered_delete_evicts_local_even_if_remote_fails(
+    mock_redis_storage: AsyncMock, filemeta: FileMeta
+):
+    local = LocalFileMetaCache()
+    local.set(filemeta)
+    mock_redis_storage.delete.side_effect = ConnectionError()
+    storage = TieredFileMetaCacheStorage(local=local, remote=mock_redis_storage)
+
+    with pytest.raises(ConnectionError):
+        await storage.delete(filemeta.get_id())
+
+    assert local.get(filemeta.get_id()) is None
+
+
+@pytest.mark.unit
+def test_local_cache_missing_marker(filemeta: FileMeta):
+    cache = LocalFileMetaCache()
+
+    cache.set_missing(filemeta.get_id())
+    with pytest.raises(NoResultFoundError):
+        cache.get(filemeta.get_id())
+
+    cache.set(filemeta)  # сохранённая запись затирает маркер
+    assert cache.get(filemeta.get_id()) is filemeta
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_tiered_remembers_remote_missing(
+    mock_redis_storage: AsyncMock, filemeta: FileMeta
+):
+    mock_redis_storage.get.side_effect = NoResultFoundError()
+    storage = TieredFileMetaCacheStorage(
+        local=LocalFileMetaCache(), remote=mock_redis_storage
+    )
+
+    for _ in range(2):
+        with pytest.raises(NoResultFoundError):
+            await storage.get(filemeta.get_id())
+
+    mock_redis_storage.get.assert_awaited_once_with(filemeta.get_id())
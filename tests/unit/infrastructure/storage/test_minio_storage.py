@@ -1,14 +1,19 @@
+import asyncio
 from collections.abc import AsyncGenerator, AsyncIterator
+from datetime import UTC, datetime
 from typing import Any, Optional
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from infrastructure.config.minio import MinioConfig
 from domain.models import FileMeta
 from infrastructure.storage.minio import MiniOStorage
 from miniopy_async.error import S3Error
+from pydantic import ValidationError
 from shared.enums import Buckets
 from shared.exceptions.infrastructure import (
     AccessDeniedError,
+    EntityTooLargeError,
     NoSuchBucketError,
     NoSuchKeyError,
     StorageError,
@@ -26,6 +31,175 @@ async def test_miniostorage_upload(
     mock_minio_client.put_object.assert_called_once()
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_miniostorage_stage_writes_version_key(
+    filemeta: FileMeta, stream: AsyncIterator[bytes], mock_minio_client: AsyncMock
+):
+    storage = MiniOStorage(mock_minio_client)
+
+    key = storage.version_key(filemeta.get_id())
+    await storage.stage(
+        file_meta=filemeta, stream=stream, bucket=Buckets.DEFAULT, object_key=key
+    )
+
+    assert key.startswith(f"{filemeta.get_id()}.")
+    assert key != storage.version_key(filemeta.get_id())
+    assert mock_minio_client.put_object.await_args.kwargs["object_name"] == key
+    mock_minio_client.copy_object.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_miniostorage_upload_stream_single_part(
+    filemeta: FileMeta, stream: AsyncIterator[bytes], mock_minio_client: AsyncMock
+):
+    storage = MiniOStorage(mock_minio_client, part_size=1024)
+
+    size = await storage.upload_stream(
+        file_id=filemeta.get_id(),
+        content_type=filemeta.get_content_type(),
+        stream=stream,
+        bucket=Buckets.DEFAULT,
+    )
+
+    assert size == len(b"chunk1chunk2chunk3chunk4")
+    mock_minio_client.put_object.assert_awaited_once()
+    mock_minio_client.compose_object.assert_not_called()
+
+
+def _sent_parts(mock_minio_client: AsyncMock) -> dict[str, bytes]:
+    return {
+        call.kwargs["object_name"]: call.kwargs["data"].getvalue()
+        for call in mock_minio_client.put_object.await_args_list
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_miniostorage_upload_stream_composes_parts(
+    filemeta: FileMeta, stream: AsyncIterator[bytes], mock_minio_client: AsyncMock
+):
+    storage = MiniOStorage(mock_minio_client, part_size=10, parts_in_flight=2)
+
+    size = await storage.upload_stream(
+        file_id=filemeta.get_id(),
+        content_type=filemeta.get_content_type(),
+        stream=stream,
+        bucket=Buckets.DEFAULT,
+    )
+
+    assert size == len(b"chunk1chunk2chunk3chunk4")
+    parts = _sent_parts(mock_minio_client)
+    assert list(parts.values()) == [b"chunk1chun", b"k2chunk3ch", b"unk4"]
+    assert all(key.startswith(f"staging/{filemeta.get_id()}/") for key in parts)
+
+    bucket, object_name, sources = mock_minio_client.compose_object.await_args.args
+    assert (bucket, object_name) == (Buckets.DEFAULT.value, filemeta.get_id())
+    assert [source.object_name for source in sources] == list(parts)
+    assert mock_minio_client.compose_object.await_args.kwargs["metadata"] == {
+        "Content-Type": filemeta.get_content_type()
+    }
+    _, removed = mock_minio_client.remove_objects.await_args.args
+    assert [obj._name for obj in removed] == list(parts)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_miniostorage_upload_stream_bounds_parts_in_memory(
+    filemeta: FileMeta, mock_minio_client: AsyncMock
+):
+    in_flight = 0
+    release = asyncio.Event()
+
+    async def put_object(**kwargs: Any) -> None:
+        nonlocal in_flight
+        in_flight += 1
+        await release.wait()
+        in_flight -= 1
+
+    read = 0
+
+    async def source() -> AsyncIterator[bytes]:
+        nonlocal read
+        for _ in range(8):
+            read += 1
+            yield b"x" * 10
+
+    mock_minio_client.put_object.side_effect = put_object
+    storage = MiniOStorage(mock_minio_client, part_size=10, parts_in_flight=2)
+
+    upload = asyncio.create_task(
+        storage.upload_stream(
+            file_id=filemeta.get_id(),
+            content_type=filemeta.get_content_type(),
+            stream=source(),
+            bucket=Buckets.DEFAULT,
+        )
+    )
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    # пока обе части в полёте, следующая из потока не читается
+    assert in_flight == 2
+    assert read == 2
+    release.set()
+    assert await upload == 80
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_miniostorage_upload_stream_removes_parts_on_part_failure(
+    filemeta: FileMeta, stream: AsyncIterator[bytes], mock_minio_client: AsyncMock
+):
+    mock_minio_client.put_object.side_effect = [None, Exception("boom"), None]
+    storage = MiniOStorage(mock_minio_client, part_size=10, parts_in_flight=2)
+
+    with pytest.raises(StorageError):
+        await storage.upload_stream(
+            file_id=filemeta.get_id(),
+            content_type=filemeta.get_content_type(),
+            stream=stream,
+            bucket=Buckets.DEFAULT,
+        )
+
+    mock_minio_client.compose_object.assert_not_called()
+    _, removed = mock_minio_client.remove_objects.await_args.args
+    # удаляются все заведённые части, в том числе отменённые до отправки
+    assert set(_sent_parts(mock_minio_client)) <= {obj._name for obj in removed}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_miniostorage_upload_stream_stops_at_max_size(
+    filemeta: FileMeta, mock_minio_client: AsyncMock
+):
+    read = 0
+
+    async def source() -> AsyncIterator[bytes]:
+        nonlocal read
+        while True:
+            read += 1
+            yield b"x" * 10
+
+    storage = MiniOStorage(mock_minio_client, part_size=10, parts_in_flight=2)
+
+    with pytest.raises(EntityTooLargeError):
+        await storage.upload_stream(
+            file_id=filemeta.get_id(),
+            content_type=filemeta.get_content_type(),
+            stream=source(),
+            bucket=Buckets.DEFAULT,
+            max_size=35,
+        )
+
+    assert read == 4
+    mock_minio_client.compose_object.assert_not_called()
+    _, removed = mock_minio_client.remove_objects.await_args.args
+    assert set(_sent_parts(mock_minio_client)) <= {obj._name for obj in removed}
+    assert len(removed) == 3
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_miniostorage_retrieve(
@@ -45,6 +219,41 @@ async def test_miniostorage_retrieve(
     mock_minio_client.get_object.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_miniostorage_retrieve_uses_shared_session(
+    filemeta: FileMeta, mock_minio_client: AsyncMock, chunks: list[bytes]
+):
+    http_pool = MagicMock()
+    storage = MiniOStorage(mock_minio_client, http_pool=http_pool)
+
+    stream = await storage.retrieve(file_id=filemeta.get_id(), bucket=Buckets.DEFAULT)
+    collected = [chunk async for chunk in stream]
+
+    assert collected == chunks
+    session = mock_minio_client.get_object.await_args.kwargs["session"]
+    assert session is http_pool.session.return_value
+    session.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_miniostorage_retrieve_range_passes_offset_and_length(
+    filemeta: FileMeta, mock_minio_client: AsyncMock, chunks: list[bytes]
+):
+    storage = MiniOStorage(mock_minio_client)
+
+    stream = await storage.retrieve(
+        file_id=filemeta.get_id(), bucket=Buckets.DEFAULT, offset=10, length=5
+    )
+    collected = [chunk async for chunk in stream]
+
+    assert collected == chunks
+    kwargs = mock_minio_client.get_object.await_args.kwargs
+    assert kwargs["offset"] == 10
+    assert kwargs["length"] == 5
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_miniostorage_delete(mock_minio_client: AsyncMock, filemeta: FileMeta):
@@ -55,6 +264,70 @@ async def test_miniostorage_delete(mock_minio_client: AsyncMock, filemeta: FileM
     mock_minio_client.remove_object.assert_called_once()
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_miniostorage_delete_many_reports_failed_objects(
+    mock_minio_client: AsyncMock,
+):
+    error = MagicMock()
+    error.name, error.code = "b", "AccessDenied"
+    mock_minio_client.remove_objects = AsyncMock(return_value=[error])
+    storage = MiniOStorage(mock_minio_client)
+
+    failed = await storage.delete_many(file_ids=["a", "b"], bucket=Buckets.DEFAULT)
+
+    assert failed == {"b": "AccessDenied"}
+    bucket, objects = mock_minio_client.remove_objects.await_args.args
+    assert bucket == Buckets.DEFAULT.value
+    assert [obj._name for obj in objects] == ["a", "b"]
+    mock_minio_client.remove_object.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_miniostorage_list_objects_pages_by_start_after(
+    mock_minio_client: AsyncMock,
+):
+    names = ["a", "b", "c", "d", "e"]
+
+    async def list_objects(bucket, recursive, start_after):
+        for name in names:
+            if start_after is None or name > start_after:
+                yield MagicMock(object_name=name, size=1, last_modified=None)
+
+    mock_minio_client.list_objects = MagicMock(side_effect=list_objects)
+    storage = MiniOStorage(mock_minio_client)
+
+    with patch("infrastructure.storage.minio.LIST_PAGE_SIZE", 2):
+        keys = [obj.key async for obj in storage.list_objects(bucket=Buckets.DEFAULT)]
+
+    assert keys == names
+    starts = [
+        call.kwargs["start_after"]
+        for call in mock_minio_client.list_objects.call_args_list
+    ]
+    assert starts == [None, "b", "d"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_miniostorage_list_objects_fills_missing_size_and_date(
+    mock_minio_client: AsyncMock,
+):
+    async def list_objects(bucket, recursive, start_after):
+        yield MagicMock(object_name="a", size=None, last_modified=None)
+
+    mock_minio_client.list_objects = MagicMock(side_effect=list_objects)
+    storage = MiniOStorage(mock_minio_client)
+    before = datetime.now(UTC)
+
+    [obj] = [obj async for obj in storage.list_objects(bucket=Buckets.DEFAULT)]
+
+    assert obj.key == "a"
+    assert obj.size == 0
+    assert obj.last_modified >= before
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 @pytest.mark.parametrize(
@@ -237,3 +510,25 @@ async def test_minio_healthcheck(
         assert result.get("latency_ms") == pytest.approx(  # type: ignore
             latency_seconds * 1000, rel=0.1
         )
+
+
+@pytest.mark.unit
+def test_minio_config_rejects_part_size_below_compose_minimum():
+    # compose_object не примет части меньше 5 MiB - ловим это при старте
+    with pytest.raises(ValidationError):
+        MinioConfig(
+            access="a",
+            secret="s",
+            endpoint="e",
+            secure=False,
+            multipart_part_size=5 * 1024 * 1024 - 1,
+        )
+
+    config = MinioConfig(
+        access="a",
+        secret="s",
+        endpoint="e",
+        secure=False,
+        multipart_part_size=5 * 1024 * 1024,
+    )
+    assert config.multipart_part_size == 5 * 1024 * 1024
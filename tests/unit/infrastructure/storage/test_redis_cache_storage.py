@@ -1,10 +1,15 @@
+import json
+from dataclasses import replace
+from datetime import UTC, datetime
 from typing import Optional
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from domain.models import FileMeta
-from infrastructure.storage.redis import RedisFileMetaCacheStorage
+from infrastructure.storage.codecs import JsonFileMetaCodec
+from infrastructure.storage.redis import MISSING_MARKER, RedisFileMetaCacheStorage
 from infrastructure.types.health.component_health import ComponentStatus
+from shared.exceptions.infrastructure import NoResultFoundError
 from redis.exceptions import ConnectionError, RedisError, TimeoutError
 
 
@@ -49,24 +54,235 @@ async def test_cache_get_miss_returns_none(
     )
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cache_get_missing_marker_raises(
+    mock_redis_client: AsyncMock,
+    cache_prefix: str,
+    filemeta: FileMeta,
+):
+    mock_redis_client.get.return_value = MISSING_MARKER
+    storage = RedisFileMetaCacheStorage(client=mock_redis_client, prefix=cache_prefix)
+
+    with pytest.raises(NoResultFoundError):
+        await storage.get(filemeta.get_id())
+
+
+def _pipeline(client: AsyncMock, *results: object) -> MagicMock:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=list(results))
+    client.pipeline = MagicMock()
+    client.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    client.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+    return pipe
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cache_get_entry_returns_remaining_ttl(
+    mock_redis_client: AsyncMock,
+    cache_prefix: str,
+    filemeta_bytes: bytes,
+    filemeta: FileMeta,
+):
+    pipe = _pipeline(mock_redis_client, filemeta_bytes, 12_500)
+    storage = RedisFileMetaCacheStorage(client=mock_redis_client, prefix=cache_prefix)
+
+    entry = await storage.get_entry(filemeta.get_id())
+
+    assert entry is not None
+    assert entry.meta.get_id() == filemeta.get_id()
+    assert entry.expires_in == pytest.approx(12.5)
+    pipe.get.assert_called_once_with(f"{cache_prefix}:{filemeta.get_id()}")
+    pipe.pttl.assert_called_once_with(f"{cache_prefix}:{filemeta.get_id()}")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "raw, pttl, expected",
+    [(None, -2, None), (MISSING_MARKER, 1000, NoResultFoundError)],
+)
+async def test_cache_get_entry_miss_and_marker(
+    mock_redis_client: AsyncMock,
+    cache_prefix: str,
+    filemeta: FileMeta,
+    raw: Optional[bytes],
+    pttl: int,
+    expected: Optional[type[Exception]],
+):
+    _pipeline(mock_redis_client, raw, pttl)
+    storage = RedisFileMetaCacheStorage(client=mock_redis_client, prefix=cache_prefix)
+
+    if expected is None:
+        assert await storage.get_entry(filemeta.get_id()) is None
+    else:
+        with pytest.raises(expected):
+            await storage.get_entry(filemeta.get_id())
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cache_set_missing_does_not_overwrite(
+    mock_redis_client: AsyncMock,
+    cache_prefix: str,
+    filemeta: FileMeta,
+):
+    storage = RedisFileMetaCacheStorage(client=mock_redis_client, prefix=cache_prefix)
+
+    await storage.set_missing(filemeta.get_id(), ttl=30)
+
+    mock_redis_client.set.assert_awaited_once_with(
+        name=f"{cache_prefix}:{filemeta.get_id()}",
+        value=MISSING_MARKER,
+        ex=30,
+        nx=True,
+    )
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_cache_set(
     mock_redis_client: AsyncMock,
     cache_prefix: str,
-    filemeta_string: str,
+    filemeta_bytes: bytes,
     filemeta: FileMeta,
 ):
     client = mock_redis_client
-    storage = RedisFileMetaCacheStorage(client=client, prefix=cache_prefix)
+    storage = RedisFileMetaCacheStorage(
+        client=client, prefix=cache_prefix, codec=JsonFileMetaCodec()
+    )
     ttl = 300
 
     await storage.set(meta=filemeta, ttl=ttl)
 
     client.set.assert_called_once_with(
-        name=f"{cache_prefix}:{filemeta.get_id()}", value=filemeta_string, ex=ttl
+        name=f"{cache_prefix}:{filemeta.get_id()}", value=filemeta_bytes, ex=ttl
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("rnd, expected", [(0.0, 300), (0.5, 285), (0.999, 270)])
+async def test_cache_set_applies_ttl_jitter(
+    mock_redis_client: AsyncMock,
+    cache_prefix: str,
+    filemeta: FileMeta,
+    rnd: float,
+    expected: int,
+):
+    storage = RedisFileMetaCacheStorage(
+        client=mock_redis_client, prefix=cache_prefix, ttl_jitter=0.1
     )
 
+    with patch("infrastructure.storage.redis.random.random", return_value=rnd):
+        await storage.set(meta=filemeta, ttl=300)
+
+    assert mock_redis_client.set.call_args.kwargs["ex"] == expected
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "pttl, rnd, refreshed",
+    [
+        (60_000, 0.5, False),  # далеко до истечения: 1 * ln2 < 60
+        (500, 0.5, True),  # 1 * ln2 >= 0.5
+        (500, 0.0, False),  # -ln(1) = 0
+    ],
+)
+async def test_cache_get_refreshes_early(
+    mock_redis_client: AsyncMock,
+    cache_prefix: str,
+    filemeta_bytes: bytes,
+    filemeta: FileMeta,
+    pttl: int,
+    rnd: float,
+    refreshed: bool,
+):
+    _pipeline(mock_redis_client, filemeta_bytes, pttl)
+    storage = RedisFileMetaCacheStorage(
+        client=mock_redis_client, prefix=cache_prefix, early_refresh=1.0
+    )
+
+    with patch("infrastructure.storage.redis.random.random", return_value=rnd):
+        result = await storage.get(filemeta.get_id())
+
+    if refreshed:
+        assert result is None
+    else:
+        assert result is not None
+        assert result.get_id() == filemeta.get_id()
+    mock_redis_client.get.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cache_get_entry_early_refresh_marks_stale(
+    mock_redis_client: AsyncMock,
+    cache_prefix: str,
+    filemeta_bytes: bytes,
+    filemeta: FileMeta,
+):
+    _pipeline(mock_redis_client, filemeta_bytes, 500)
+    storage = RedisFileMetaCacheStorage(
+        client=mock_redis_client, prefix=cache_prefix, early_refresh=1.0
+    )
+
+    with patch("infrastructure.storage.redis.random.random", return_value=0.5):
+        entry = await storage.get_entry(filemeta.get_id())
+
+    assert entry is not None
+    assert entry.meta.get_id() == filemeta.get_id()
+    assert entry.expires_in == 0.0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cache_get_many_uses_single_mget(
+    mock_redis_client: AsyncMock,
+    cache_prefix: str,
+    filemeta_bytes: bytes,
+    filemeta: FileMeta,
+):
+    mock_redis_client.mget.return_value = [filemeta_bytes, MISSING_MARKER, None]
+    storage = RedisFileMetaCacheStorage(client=mock_redis_client, prefix=cache_prefix)
+
+    found = await storage.get_many([filemeta.get_id(), "gone", "cold"])
+
+    assert set(found) == {filemeta.get_id(), "gone"}
+    assert found[filemeta.get_id()].get_id() == filemeta.get_id()  # type: ignore[union-attr]
+    assert found["gone"] is None
+    mock_redis_client.mget.assert_awaited_once_with(
+        [
+            f"{cache_prefix}:{filemeta.get_id()}",
+            f"{cache_prefix}:gone",
+            f"{cache_prefix}:cold",
+        ]
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cache_set_many_is_pipelined(
+    mock_redis_client: AsyncMock,
+    cache_prefix: str,
+    filemeta_bytes: bytes,
+    filemeta: FileMeta,
+):
+    pipe = _pipeline(mock_redis_client)
+    storage = RedisFileMetaCacheStorage(
+        client=mock_redis_client, prefix=cache_prefix, codec=JsonFileMetaCodec()
+    )
+
+    await storage.set_many([filemeta], ttl=300)
+
+    pipe.set.assert_called_once_with(
+        name=f"{cache_prefix}:{filemeta.get_id()}", value=filemeta_bytes, ex=300
+    )
+    pipe.execute.assert_awaited_once()
+    mock_redis_client.set.assert_not_called()
+
 
 @pytest.mark.unit
 @pytest.mark.asyncio
@@ -83,23 +299,76 @@ async def test_cache_delete(
     client.delete.assert_awaited_once_with(f"{cache_prefix}:{filemeta.get_id()}")
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cache_delete_many_is_single_del(
+    mock_redis_client: AsyncMock,
+    cache_prefix: str,
+):
+    storage = RedisFileMetaCacheStorage(client=mock_redis_client, prefix=cache_prefix)
+
+    await storage.delete_many(["a", "b"])
+    await storage.delete_many([])
+
+    mock_redis_client.delete.assert_awaited_once_with(
+        f"{cache_prefix}:a", f"{cache_prefix}:b"
+    )
+
+
 @pytest.mark.unit
 def test_cache_serialize_and_deserialize(
     mock_redis_client: AsyncMock,
     cache_prefix: str,
     filemeta: FileMeta,
-    filemeta_string: str,
     filemeta_bytes: bytes,
 ):
-    """BTW Redis encoding strings by itself"""
     client = mock_redis_client
-    storage = RedisFileMetaCacheStorage(client=client, prefix=cache_prefix)
+    storage = RedisFileMetaCacheStorage(
+        client=client, prefix=cache_prefix, codec=JsonFileMetaCodec()
+    )
 
     serialized = storage.serialize_meta(filemeta)
     deserialized = storage.deserialize_meta(filemeta_bytes)
 
     assert deserialized == filemeta
-    assert serialized == filemeta_string
+    assert serialized == filemeta_bytes
+
+
+@pytest.mark.unit
+def test_cache_roundtrip_keeps_updated_at(
+    mock_redis_client: AsyncMock,
+    cache_prefix: str,
+    filemeta: FileMeta,
+):
+    storage = RedisFileMetaCacheStorage(client=mock_redis_client, prefix=cache_prefix)
+    meta = replace(filemeta, _updated_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC))
+
+    raw = storage.serialize_meta(meta)
+
+    assert storage.deserialize_meta(raw).get_updated_at() == meta.get_updated_at()
+
+
+@pytest.mark.unit
+def test_cache_deserialize_entry_without_checksum(
+    mock_redis_client: AsyncMock,
+    cache_prefix: str,
+    filemeta: FileMeta,
+):
+    """Записи, положенные в кэш до появления checksum, читаются как раньше"""
+    storage = RedisFileMetaCacheStorage(client=mock_redis_client, prefix=cache_prefix)
+    legacy = json.dumps(
+        {
+            "id": filemeta.get_id(),
+            "name": filemeta.get_name(),
+            "content_type": filemeta.get_content_type(),
+            "size": filemeta.get_size(),
+        }
+    ).encode("utf-8")
+
+    deserialized = storage.deserialize_meta(legacy)
+
+    assert deserialized == filemeta
+    assert deserialized.get_checksum() is None
 
 
 @pytest.mark.asyncio
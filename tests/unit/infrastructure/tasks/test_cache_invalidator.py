@@ -49,3 +49,18 @@ async def test_invalidate_timeout(mock_task_manager: AsyncMock):
 
     assert done.is_set()
     assert storage.delete.await_count >= 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_invalidate_many_is_one_task_with_retries(mock_task_manager: AsyncMock):
+    storage = AsyncMock()
+    storage.delete_many.side_effect = [RedisError(), None]
+    invalidator = CacheInvalidator(storage, mock_task_manager, retry_interval=0.01)
+
+    done = await invalidator.invalidate_many(["a", "b", "c"], max_retry_seconds=0.1)
+    await asyncio.wait_for(done.wait(), timeout=0.3)
+
+    assert storage.delete_many.await_count == 2
+    storage.delete_many.assert_awaited_with(["a", "b", "c"])
+    storage.delete.assert_not_called()
@@ -0,0 +1,91 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from domain.models import FileMeta
+from infrastructure.storage.memory import LocalFileMetaCache
+from infrastructure.tasks.invalidation_bus import RedisInvalidationBus
+from redis.exceptions import ConnectionError
+
+
+async def idle_message(timeout: float) -> None:
+    await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def pubsub_client() -> MagicMock:
+    client = MagicMock()
+    client.publish = AsyncMock()
+    pubsub = client.pubsub.return_value
+    pubsub.subscribe = AsyncMock()
+    pubsub.aclose = AsyncMock()
+    pubsub.get_message = AsyncMock(side_effect=idle_message)
+    return client
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_publish_batches_ids_per_tick(pubsub_client: MagicMock):
+    bus = RedisInvalidationBus(
+        client=pubsub_client,
+        local=LocalFileMetaCache(),
+        channel="inv",
+        flush_interval=0.02,
+    )
+    await bus.start()
+
+    bus.publish("b")
+    bus.publish("a")
+    bus.publish("b")
+    await asyncio.sleep(0.1)
+    await bus.stop()
+
+    pubsub_client.publish.assert_awaited_once_with("inv", json.dumps(["a", "b"]))
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_stop_flushes_pending(pubsub_client: MagicMock):
+    bus = RedisInvalidationBus(
+        client=pubsub_client, local=LocalFileMetaCache(), channel="inv"
+    )
+
+    bus.publish("a")
+    await bus.stop()
+
+    pubsub_client.publish.assert_awaited_once_with("inv", json.dumps(["a"]))
+
+
+@pytest.mark.unit
+def test_handle_evicts_local_entries(filemeta: FileMeta):
+    local = LocalFileMetaCache()
+    local.set(filemeta)
+    bus = RedisInvalidationBus(client=MagicMock(), local=local, channel="inv")
+
+    bus.handle(b"not json")
+    assert local.get(filemeta.get_id()) is filemeta
+
+    bus.handle(json.dumps([filemeta.get_id()]).encode())
+    assert local.get(filemeta.get_id()) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_resubscribe_resets_local_cache(
+    pubsub_client: MagicMock, filemeta: FileMeta
+):
+    local = LocalFileMetaCache()
+    local.set(filemeta)
+    pubsub = pubsub_client.pubsub.return_value
+    pubsub.subscribe.side_effect = [ConnectionError(), None]
+    bus = RedisInvalidationBus(
+        client=pubsub_client, local=local, channel="inv", reconnect_interval=0
+    )
+
+    await bus.start()
+    await asyncio.sleep(0.05)
+    await bus.stop()
+
+    assert pubsub.subscribe.await_count == 2
+    assert len(local) == 0
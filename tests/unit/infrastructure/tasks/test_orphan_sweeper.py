@@ -0,0 +1,174 @@
+from collections.abc import AsyncIterator, Iterable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from infrastructure.tasks.orphan_sweeper import (
+    OrphanSweeper,
+    SweepCheckpoint,
+    SweepReport,
+)
+from infrastructure.types.storage import StoredObject
+from shared.enums import Buckets
+
+OLD = datetime.now(UTC) - timedelta(days=7)
+FRESH = datetime.now(UTC)
+
+
+async def stream(items: Iterable[object]) -> AsyncIterator[object]:
+    for item in items:
+        yield item
+
+
+def objects(*keys: str, modified: datetime = OLD) -> list[StoredObject]:
+    return [StoredObject(key=key, size=10, last_modified=modified) for key in keys]
+
+
+def listing(buckets: dict[Buckets, list[StoredObject]]) -> MagicMock:
+    def list_objects(*, bucket: Buckets, start_after: str = ""):
+        return stream(obj for obj in buckets.get(bucket, []) if obj.key > start_after)
+
+    return MagicMock(side_effect=list_objects)
+
+
+def ids(*keys: str) -> MagicMock:
+    def iter_keys(*, after: str = "", page_size: int = 1000):
+        return stream(key for key in keys if key > after)
+
+    return MagicMock(side_effect=iter_keys)
+
+
+@pytest.fixture
+def storage() -> AsyncMock:
+    storage = AsyncMock()
+    storage.delete_many = AsyncMock(return_value={})
+    return storage
+
+
+@pytest.fixture
+def reader() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_sweep_reports_orphans_and_missing_rows(
+    storage: AsyncMock, reader: AsyncMock
+):
+    storage.list_objects = listing({Buckets.DEFAULT: objects("a", "b", "d")})
+    reader.iter_keys = ids("a", "c", "d")
+    sweeper = OrphanSweeper(storage, reader, buckets=[Buckets.DEFAULT], rate=0)
+
+    report = await sweeper.run()
+
+    assert report == SweepReport(
+        objects=3, rows=3, orphans=1, orphan_bytes=10, missing=1
+    )
+    storage.delete_many.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_sweep_skips_objects_within_grace(storage: AsyncMock, reader: AsyncMock):
+    storage.list_objects = listing({Buckets.DEFAULT: objects("a", "b", modified=FRESH)})
+    reader.iter_keys = ids()
+    sweeper = OrphanSweeper(
+        storage, reader, buckets=[Buckets.DEFAULT], remove=True, rate=0
+    )
+
+    report = await sweeper.run()
+
+    assert (report.objects, report.orphans) == (2, 0)
+    storage.delete_many.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_sweep_merges_buckets_and_removes_in_batches(
+    storage: AsyncMock, reader: AsyncMock
+):
+    storage.list_objects = listing(
+        {
+            Buckets.DEFAULT: objects("a", "c", "e", "f"),
+            Buckets.PRIVATE: objects("a", "b", "d"),
+        }
+    )
+    storage.delete_many.side_effect = lambda file_ids, bucket: (
+        {"e": "AccessDenied"} if "e" in file_ids else {}
+    )
+    reader.iter_keys = ids("a")
+    sweeper = OrphanSweeper(
+        storage,
+        reader,
+        buckets=[Buckets.DEFAULT, Buckets.PRIVATE],
+        remove=True,
+        rate=0,
+        page_size=2,
+    )
+
+    report = await sweeper.run()
+
+    assert (report.objects, report.rows, report.orphans) == (7, 1, 5)
+    assert (report.removed, report.failed) == (4, 1)
+    removed = {
+        (call.kwargs["bucket"], key)
+        for call in storage.delete_many.await_args_list
+        for key in call.kwargs["file_ids"]
+    }
+    assert removed == {
+        (Buckets.DEFAULT, "c"),
+        (Buckets.DEFAULT, "e"),
+        (Buckets.DEFAULT, "f"),
+        (Buckets.PRIVATE, "b"),
+        (Buckets.PRIVATE, "d"),
+    }
+    assert all(
+        len(call.kwargs["file_ids"]) <= 2
+        for call in storage.delete_many.await_args_list
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_sweep_resumes_from_checkpoint(
+    storage: AsyncMock, reader: AsyncMock, tmp_path: Path
+):
+    checkpoint = SweepCheckpoint(tmp_path / "sweep.json")
+    checkpoint.save("b", SweepReport(objects=2, rows=2))
+    storage.list_objects = listing({Buckets.DEFAULT: objects("a", "b", "c", "d")})
+    reader.iter_keys = ids("a", "b", "c")
+    sweeper = OrphanSweeper(
+        storage, reader, buckets=[Buckets.DEFAULT], rate=0, checkpoint=checkpoint
+    )
+
+    report = await sweeper.run()
+
+    storage.list_objects.assert_called_once_with(
+        bucket=Buckets.DEFAULT, start_after="b"
+    )
+    assert (report.objects, report.rows, report.orphans) == (4, 3, 1)
+    assert not (tmp_path / "sweep.json").exists()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_sweep_saves_checkpoint_between_pages(
+    storage: AsyncMock, reader: AsyncMock, tmp_path: Path
+):
+    checkpoint = MagicMock(wraps=SweepCheckpoint(tmp_path / "sweep.json"))
+    storage.list_objects = listing({Buckets.DEFAULT: objects("a", "b", "c", "d")})
+    reader.iter_keys = ids("a", "b", "c", "d")
+    sweeper = OrphanSweeper(
+        storage,
+        reader,
+        buckets=[Buckets.DEFAULT],
+        rate=0,
+        page_size=2,
+        checkpoint=checkpoint,
+    )
+
+    await sweeper.run()
+
+    assert [call.args[0] for call in checkpoint.save.call_args_list] == ["b", "d"]
+    checkpoint.clear.assert_called_once()
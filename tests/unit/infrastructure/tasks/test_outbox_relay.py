@@ -0,0 +1,149 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from infrastructure.models.sqlalchemy import StorageOutbox
+from infrastructure.tasks.outbox_relay import StorageOutboxRelay
+from shared.enums import Buckets, OutboxOperation
+from shared.exceptions.infrastructure import StorageError
+from sqlalchemy.dialects import postgresql
+
+
+def entry(entry_id: int, operation: OutboxOperation, key: str) -> StorageOutbox:
+    return StorageOutbox(
+        id=entry_id,
+        operation=operation,
+        bucket=Buckets.DEFAULT.value,
+        object_key=key,
+        attempts=0,
+    )
+
+
+@pytest.fixture
+def outbox_session() -> AsyncMock:
+    session = AsyncMock()
+    session.begin = MagicMock()
+    return session
+
+
+@pytest.fixture
+def relay(
+    outbox_session: AsyncMock, mock_minio_storage: AsyncMock
+) -> StorageOutboxRelay:
+    sessionmaker = MagicMock()
+    sessionmaker.return_value.__aenter__.return_value = outbox_session
+    mock_minio_storage.delete_many = AsyncMock(return_value={})
+    return StorageOutboxRelay(
+        sessionmaker=sessionmaker, storage=mock_minio_storage, batch_size=10
+    )
+
+
+def statement_ids(call: object) -> list[int]:
+    params = call.args[0].compile().params  # type: ignore
+    return next(value for value in params.values() if isinstance(value, list))
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_relay_removes_deleted_and_abandoned_objects(
+    relay: StorageOutboxRelay,
+    outbox_session: AsyncMock,
+    mock_minio_storage: AsyncMock,
+):
+    outbox_session.scalars.side_effect = [
+        [
+            entry(3, OutboxOperation.UPLOAD, "saved"),
+            entry(1, OutboxOperation.DELETE, "gone"),
+            entry(2, OutboxOperation.UPLOAD, "abandoned"),
+        ],
+        ["saved"],  # на эту загрузку строка в files ссылается
+    ]
+
+    handled = await relay.relay_once()
+
+    assert handled == 3
+    mock_minio_storage.delete_many.assert_awaited_once_with(
+        file_ids=["gone", "abandoned"], bucket=Buckets.DEFAULT
+    )
+    (removed,) = outbox_session.execute.await_args_list
+    assert "DELETE FROM storage_outbox" in str(removed.args[0])
+    assert statement_ids(removed) == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_relay_keeps_entries_for_failed_objects(
+    relay: StorageOutboxRelay,
+    outbox_session: AsyncMock,
+    mock_minio_storage: AsyncMock,
+):
+    outbox_session.scalars.side_effect = [
+        [entry(1, OutboxOperation.DELETE, "a"), entry(2, OutboxOperation.DELETE, "b")]
+    ]
+    mock_minio_storage.delete_many.return_value = {"b": "AccessDenied"}
+
+    await relay.relay_once()
+
+    removed, retried = outbox_session.execute.await_args_list
+    assert statement_ids(removed) == [1]
+    assert "UPDATE storage_outbox" in str(retried.args[0])
+    assert statement_ids(retried) == [2]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_relay_leaves_entries_when_storage_is_down(
+    relay: StorageOutboxRelay,
+    outbox_session: AsyncMock,
+    mock_minio_storage: AsyncMock,
+):
+    outbox_session.scalars.side_effect = [[entry(1, OutboxOperation.DELETE, "a")]]
+    mock_minio_storage.delete_many.side_effect = StorageError("down")
+
+    with pytest.raises(StorageError):
+        await relay.relay_once()
+
+    # запись остаётся в аренде и вернётся, когда та истечёт
+    outbox_session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_relay_claims_entries_before_storage_io(
+    relay: StorageOutboxRelay,
+    outbox_session: AsyncMock,
+    mock_minio_storage: AsyncMock,
+):
+    events: list[str] = []
+    outbox_session.begin.return_value.__aexit__ = AsyncMock(
+        side_effect=lambda *args: events.append("commit")
+    )
+    outbox_session.scalars.side_effect = [[entry(1, OutboxOperation.DELETE, "a")]]
+    mock_minio_storage.delete_many.side_effect = (
+        lambda **kwargs: events.append("io") or {}
+    )
+
+    await relay.relay_once()
+
+    claim = str(
+        outbox_session.scalars.await_args_list[0]
+        .args[0]
+        .compile(dialect=postgresql.dialect())
+    )
+    assert "UPDATE storage_outbox SET claimed_until" in claim
+    assert "FOR UPDATE SKIP LOCKED" in claim
+    assert "storage_outbox.not_before <= now()" in claim
+    # блокировки отпущены до запроса в хранилище, снятие - отдельной транзакцией
+    assert events == ["commit", "io", "commit"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_relay_idle_pass(
+    relay: StorageOutboxRelay,
+    outbox_session: AsyncMock,
+    mock_minio_storage: AsyncMock,
+):
+    outbox_session.scalars.side_effect = [[]]
+
+    assert await relay.relay_once() == 0
+    mock_minio_storage.delete_many.assert_not_called()
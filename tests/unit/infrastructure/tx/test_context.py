@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from infrastructure.tx.context import SqlAlchemyTransactionContext
@@ -21,6 +21,26 @@ async def test_tx_context(session: AsyncSession):
     assert not ctx._session.in_transaction()  # type: ignore
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_tx_context_read_only_uses_autocommit_bind(session: AsyncSession):
+    autocommit = MagicMock()
+    bind = session.sync_session.bind
+    ctx = SqlAlchemyTransactionContext(session=session, autocommit_bind=autocommit)
+
+    await ctx.begin(read_only=True)
+
+    assert ctx.session is session
+    assert not session.in_transaction()
+    assert session.sync_session.bind is autocommit.sync_engine
+
+    await ctx.close()
+
+    assert session.sync_session.bind is bind
+    with pytest.raises(RuntimeError):
+        ctx.session
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_tx_context_raises_runtime_error(session: AsyncSession):
@@ -69,3 +89,29 @@ async def test_rollback_does_nothing_when_transaction_is_none():
     await ctx.rollback()
 
     session.rollback.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_tx_context_read_only_binds_router_choice(session: AsyncSession):
+    router = MagicMock()
+    ctx = SqlAlchemyTransactionContext(session=session, router=router)
+
+    await ctx.begin(read_only=True)
+
+    assert session.sync_session.bind is router.read_bind.return_value.sync_engine
+    await ctx.close()
+    router.end_read.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_commit_reports_write_to_router():
+    session = AsyncMock()
+    router = MagicMock()
+    ctx = SqlAlchemyTransactionContext(session=session, router=router)
+
+    await ctx.begin()
+    await ctx.commit()
+
+    router.mark_write.assert_called_once()
@@ -0,0 +1,102 @@
+import contextvars
+from unittest.mock import MagicMock, patch
+
+import pytest
+from infrastructure.tx.routing import ReadRouter, reading_replica
+from shared.logging.context import set_client
+
+
+def in_context(func, *args):
+    # отдельный контекст - как отдельный запрос
+    return contextvars.copy_context().run(func, *args)
+
+
+def read_as(router: ReadRouter, client: str):
+    def read():
+        set_client(client)
+        return router.read_bind()
+
+    return in_context(read)
+
+
+def write_as(router: ReadRouter, client: str):
+    def write():
+        set_client(client)
+        router.mark_write()
+        return router.read_bind()
+
+    return in_context(write)
+
+
+@pytest.fixture
+def primary() -> MagicMock:
+    return MagicMock(name="primary")
+
+
+@pytest.fixture
+def replica() -> MagicMock:
+    return MagicMock(name="replica")
+
+
+@pytest.mark.unit
+def test_router_without_replica_reads_primary(primary: MagicMock):
+    router = ReadRouter(primary=primary)
+
+    assert write_as(router, "10.0.0.1") is primary
+    assert read_as(router, "10.0.0.2") is primary
+    assert not router._recent
+
+
+@pytest.mark.unit
+def test_router_sticks_writer_to_primary(primary: MagicMock, replica: MagicMock):
+    router = ReadRouter(primary=primary, replica=replica, sticky_seconds=5.0)
+
+    assert read_as(router, "10.0.0.1") is replica
+    # в том же запросе - сразу primary
+    assert write_as(router, "10.0.0.1") is primary
+    # следующий запрос того же клиента - тоже primary, другого - реплика
+    assert read_as(router, "10.0.0.1") is primary
+    assert read_as(router, "10.0.0.2") is replica
+
+
+@pytest.mark.unit
+def test_router_stickiness_expires(primary: MagicMock, replica: MagicMock):
+    router = ReadRouter(primary=primary, replica=replica, sticky_seconds=5.0)
+
+    with patch("infrastructure.tx.routing.time.monotonic", return_value=100.0):
+        write_as(router, "10.0.0.1")
+    with patch("infrastructure.tx.routing.time.monotonic", return_value=106.0):
+        assert read_as(router, "10.0.0.1") is replica
+
+    assert not router._recent
+
+
+@pytest.mark.unit
+def test_router_evicts_oldest_clients(primary: MagicMock, replica: MagicMock):
+    router = ReadRouter(primary=primary, replica=replica, max_clients=2)
+
+    for client in ("a", "b", "c"):
+        write_as(router, client)
+
+    assert list(router._recent) == ["b", "c"]
+    assert read_as(router, "a") is replica
+
+
+@pytest.mark.unit
+def test_router_flags_replica_reads(primary: MagicMock, replica: MagicMock):
+    router = ReadRouter(primary=primary, replica=replica)
+
+    def read_then_end():
+        set_client("10.0.0.1")
+        router.read_bind()
+        during = reading_replica()
+        router.end_read()
+        return during, reading_replica()
+
+    def write_then_read():
+        router.mark_write()
+        router.read_bind()
+        return reading_replica()
+
+    assert in_context(read_then_end) == (True, False)
+    assert in_context(write_then_read) is False
@@ -0,0 +1,41 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from infrastructure.utils.mime_detector import MimeDetector
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_detect_runs_outside_event_loop_thread():
+    detector = MimeDetector(workers=1)
+    loop_thread = threading.get_ident()
+    seen: list[int] = []
+
+    def fake_magic(mime: bool) -> MagicMock:
+        magic = MagicMock()
+        magic.from_buffer.side_effect = lambda buf: (
+            seen.append(threading.get_ident()) or "application/pdf"
+        )
+        return magic
+
+    with patch("infrastructure.utils.mime_detector.Magic", side_effect=fake_magic):
+        mime = await detector.detect(b"%PDF-1.4")
+
+    detector.shutdown()
+    assert mime == "application/pdf"
+    assert seen and seen[0] != loop_thread
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_magic_handle_created_once_per_thread():
+    detector = MimeDetector(workers=2)
+
+    with patch("infrastructure.utils.mime_detector.Magic") as magic_cls:
+        magic_cls.return_value.from_buffer.return_value = "text/plain"
+        await asyncio.gather(*(detector.detect(b"hello") for _ in range(20)))
+
+    detector.shutdown()
+    assert 1 <= magic_cls.call_count <= 2
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+from infrastructure.utils.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_concurrent_calls_share_one_load():
+    flight: SingleFlight[int] = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def loader() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 42
+
+    tasks = [asyncio.create_task(flight.do("k", loader)) for _ in range(10)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == [42] * 10
+    assert calls == 1
+    assert flight.inflight() == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_error_is_shared_and_not_cached():
+    flight: SingleFlight[int] = SingleFlight()
+    release = asyncio.Event()
+
+    async def failing() -> int:
+        await release.wait()
+        raise LookupError("missing")
+
+    tasks = [asyncio.create_task(flight.do("k", failing)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(r, LookupError) for r in results)
+
+    async def ok() -> int:
+        return 1
+
+    assert await flight.do("k", ok) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_waiters_reload_when_leader_cancelled():
+    flight: SingleFlight[int] = SingleFlight()
+    started = asyncio.Event()
+
+    async def slow() -> int:
+        started.set()
+        await asyncio.sleep(10)
+        return 0
+
+    async def fast() -> int:
+        return 7
+
+    leader = asyncio.create_task(flight.do("k", slow))
+    await started.wait()
+    waiter = asyncio.create_task(flight.do("k", fast))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await waiter == 7
+    with pytest.raises(asyncio.CancelledError):
+        await leader
@@ -0,0 +1,107 @@
+import tempfile
+from collections.abc import AsyncIterator
+from typing import Any, SupportsIndex
+
+import pytest
+from infrastructure.utils import stream_reader
+from infrastructure.utils.stream_reader import AsyncStreamReader
+from shared.io import peekable_stream
+from shared.io.peekable_stream import PeekableAsyncStream
+
+MB = 1024 * 1024
+CHUNK = b"x" * 4096  # такими порциями отдаёт тело Starlette
+PART = 16 * MB  # размер части, которую запрашивает MiniO
+
+SIZES = [
+    pytest.param(MB, id="1MB"),
+    pytest.param(64 * MB, id="64MB"),
+    pytest.param(1024 * MB, id="1GB", marks=pytest.mark.slow),
+]
+
+
+async def fixed_chunks(total: int) -> AsyncIterator[bytes]:
+    for _ in range(total // len(CHUNK)):
+        yield CHUNK
+
+
+class CountingBuffer(bytearray):
+    """bytearray, считающий байты, которые буфер копирует сам в себе."""
+
+    moved = 0
+
+    def __iadd__(self, other: Any) -> "CountingBuffer":
+        CountingBuffer.moved += len(other)
+        return super().__iadd__(other)
+
+    def __delitem__(self, key: SupportsIndex | slice) -> None:
+        if isinstance(key, slice):
+            start, stop, _ = key.indices(len(self))
+            CountingBuffer.moved += len(self) - stop  # хвост сдвигается к началу
+        super().__delitem__(key)
+
+
+class CountingSpool(tempfile.SpooledTemporaryFile[bytes]):
+    written = 0
+    read_back = 0
+
+    def write(self, s: Any) -> int:
+        CountingSpool.written += len(s)
+        return super().write(s)
+
+    def read(self, *args: Any) -> bytes:
+        data = super().read(*args)
+        CountingSpool.read_back += len(data)
+        return data
+
+
+@pytest.fixture
+def counting_buffer(monkeypatch: pytest.MonkeyPatch) -> type[CountingBuffer]:
+    monkeypatch.setattr(stream_reader, "bytearray", CountingBuffer, raising=False)
+    CountingBuffer.moved = 0
+    return CountingBuffer
+
+
+@pytest.fixture
+def counting_spool(monkeypatch: pytest.MonkeyPatch) -> type[CountingSpool]:
+    monkeypatch.setattr(peekable_stream.tempfile, "SpooledTemporaryFile", CountingSpool)
+    CountingSpool.written = CountingSpool.read_back = 0
+    return CountingSpool
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.parametrize("total", SIZES)
+@pytest.mark.parametrize("part", [PART, 10_000], ids=["minio-part", "odd-reads"])
+async def test_stream_reader_moves_each_byte_a_bounded_number_of_times(
+    total: int, part: int, counting_buffer: type[CountingBuffer]
+):
+    """Копирований внутри буфера - O(объёма), а не O(объёма^2 / чанк)."""
+    reader = AsyncStreamReader(fixed_chunks(total), expected_size=total)
+
+    read = 0
+    while data := await reader.read(part):
+        read += len(data)
+
+    assert read == total
+    # каждый байт один раз дописан и не больше одного раза сдвинут
+    assert total <= counting_buffer.moved <= 2 * total
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.parametrize("total", SIZES)
+async def test_peekable_stream_spools_each_byte_once(
+    total: int, counting_spool: type[CountingSpool]
+):
+    stream = PeekableAsyncStream(fixed_chunks(total), max_memory_size=MB // 4)
+
+    await stream.peek(2048)
+    assert await stream.length() == total
+    read = 0
+    async for chunk in stream.iter():
+        read += len(chunk)
+
+    assert read == total
+    assert counting_spool.written == total
+    # peek перечитывает только свои 2 КБ, остальное воспроизводится один раз
+    assert counting_spool.read_back == total + 2048
@@ -3,6 +3,7 @@ from typing import AsyncIterator
 
 import pytest
 from infrastructure.utils.stream_reader import AsyncStreamReader
+from shared.exceptions.infrastructure import EntityTooLargeError, IncompleteBodyError
 
 
 async def async_byte_stream(
@@ -72,3 +73,75 @@ async def test_read_past_end_returns_empty():
 
     remainder = await reader.read()
     assert remainder == b""
+
+
+@pytest.mark.asyncio
+async def test_read_declared_size_matches():
+    chunks = [b"chunk1", b"chunk2", b"chunk3", b"chunk4"]
+    total_length = sum(len(c) for c in chunks)
+    reader = AsyncStreamReader(async_byte_stream(chunks), expected_size=total_length)
+
+    data = await reader.read(total_length)
+    assert data == b"".join(chunks)
+
+
+@pytest.mark.asyncio
+async def test_read_shorter_than_declared_raises():
+    chunks = [b"chunk1", b"chunk2", b"chunk3", b"chunk4"]
+    total_length = sum(len(c) for c in chunks)
+    reader = AsyncStreamReader(
+        async_byte_stream(chunks), expected_size=total_length + 1
+    )
+
+    with pytest.raises(IncompleteBodyError):
+        await reader.read(total_length + 1)
+
+
+@pytest.mark.asyncio
+async def test_read_longer_than_declared_raises():
+    chunks = [b"chunk1", b"chunk2", b"chunk3", b"chunk4"]
+    reader = AsyncStreamReader(async_byte_stream(chunks), expected_size=12)
+
+    # MiniO прочитает ровно заявленное, хвост должен быть замечен
+    with pytest.raises(IncompleteBodyError):
+        await reader.read(12)
+
+
+@pytest.mark.asyncio
+async def test_iterate_longer_than_declared_raises():
+    chunks = [b"chunk1", b"chunk2", b"chunk3", b"chunk4"]
+    reader = AsyncStreamReader(async_byte_stream(chunks), expected_size=10)
+
+    with pytest.raises(IncompleteBodyError):
+        async for _ in reader:
+            pass
+
+
+@pytest.mark.asyncio
+async def test_read_over_max_size_raises_before_stream_ends():
+    pulled: list[int] = []
+
+    async def endless() -> AsyncIterator[bytes]:
+        while True:
+            pulled.append(1)
+            yield b"chunk1"
+
+    reader = AsyncStreamReader(endless(), max_size=10)
+    assert await reader.read(6) == b"chunk1"
+    with pytest.raises(EntityTooLargeError):
+        await reader.read(6)
+    assert len(pulled) == 2
+
+
+@pytest.mark.asyncio
+async def test_read_small_pieces_reassemble_stream():
+    chunks = [b"chunk1", b"chunk2", b"chunk3", b"chunk4"]
+    reader = AsyncStreamReader(async_byte_stream(chunks))
+
+    pieces: list[bytes] = []
+    while piece := await reader.read(5):
+        assert isinstance(piece, bytes)
+        pieces.append(piece)
+
+    assert b"".join(pieces) == b"".join(chunks)
+    assert all(len(piece) == 5 for piece in pieces[:-1])
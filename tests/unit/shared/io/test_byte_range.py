@@ -0,0 +1,68 @@
+import pytest
+from shared.exceptions.infrastructure import InvalidRangeError
+from shared.io.byte_range import (
+    MAX_RANGES,
+    ByteRange,
+    RangeSpec,
+    parse_range_header,
+    resolve_ranges,
+)
+
+
+@pytest.mark.unit
+def test_parse_range_header_forms():
+    assert parse_range_header("bytes=0-99, 200-, -50") == [
+        RangeSpec(0, 99),
+        RangeSpec(200, None),
+        RangeSpec(None, 50),
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value",
+    [
+        "items=0-1",
+        "bytes",
+        "bytes=",
+        "bytes=-",
+        "bytes=5-1",
+        "bytes=a-b",
+        "bytes=1-2-3",
+        "bytes=" + ",".join(["0-1"] * (MAX_RANGES + 1)),
+    ],
+)
+def test_parse_range_header_rejects_malformed(value: str):
+    assert parse_range_header(value) is None
+
+
+@pytest.mark.unit
+def test_resolve_ranges_clamps_to_size():
+    ranges = resolve_ranges(
+        [RangeSpec(0, 999), RangeSpec(None, 3), RangeSpec(8, None)], size=10
+    )
+
+    assert ranges == [ByteRange(0, 9), ByteRange(7, 9), ByteRange(8, 9)]
+    assert ranges[1].length == 3
+    assert ranges[1].content_range(10) == "bytes 7-9/10"
+
+
+@pytest.mark.unit
+def test_resolve_ranges_drops_unsatisfiable():
+    assert resolve_ranges([RangeSpec(10, None), RangeSpec(2, 3)], size=10) == [
+        ByteRange(2, 3)
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "specs, size",
+    [
+        ([RangeSpec(10, None)], 10),
+        ([RangeSpec(None, 0)], 10),
+        ([RangeSpec(None, 5)], 0),
+    ],
+)
+def test_resolve_ranges_unsatisfiable(specs: list[RangeSpec], size: int):
+    with pytest.raises(InvalidRangeError):
+        resolve_ranges(specs, size)
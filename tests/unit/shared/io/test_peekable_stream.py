@@ -0,0 +1,104 @@
+import asyncio
+from collections.abc import AsyncIterator
+from unittest.mock import patch
+
+import pytest
+from shared.io.peekable_stream import PeekableAsyncStream
+
+
+async def async_byte_stream(
+    chunks: list[bytes], delay: float = 0.01
+) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        await asyncio.sleep(delay)
+        yield chunk
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_peek_does_not_consume(chunks: list[bytes]):
+    stream = PeekableAsyncStream(async_byte_stream(chunks))
+
+    header = await stream.peek(8)
+    again = await stream.peek(8)
+
+    assert header == again == b"chunk1ch"
+
+    collected = b"".join([chunk async for chunk in stream.iter()])
+    assert collected == b"".join(chunks)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_length_then_replay(chunks: list[bytes]):
+    stream = PeekableAsyncStream(async_byte_stream(chunks))
+
+    assert await stream.length() == sum(len(c) for c in chunks)
+
+    collected = b"".join([chunk async for chunk in stream.iter()])
+    assert collected == b"".join(chunks)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_spills_to_disk_past_threshold(chunks: list[bytes]):
+    stream = PeekableAsyncStream(
+        async_byte_stream(chunks), max_memory_size=8, chunk_size=5
+    )
+
+    await stream.peek(4)
+    assert not stream._spool._rolled  # type: ignore
+
+    length = await stream.length()
+    assert stream._spool._rolled  # type: ignore
+
+    replayed = [chunk async for chunk in stream.iter()]
+    assert all(len(chunk) <= 5 for chunk in replayed)
+    assert b"".join(replayed) == b"".join(chunks)
+    assert len(b"".join(replayed)) == length
+    assert stream._spool.closed
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_iter_continues_source_after_peek(chunks: list[bytes]):
+    stream = PeekableAsyncStream(async_byte_stream(chunks))
+
+    await stream.peek(3)
+
+    collected = [chunk async for chunk in stream.iter()]
+    assert b"".join(collected) == b"".join(chunks)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_aclose_releases_spool_without_iteration(chunks: list[bytes]):
+    stream = PeekableAsyncStream(async_byte_stream(chunks))
+    await stream.peek(8)
+
+    replay = stream.iter()
+    await replay.aclose()
+
+    # отказ до передачи: воспроизведение не начато, спул всё равно закрыт
+    assert stream._spool.closed
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_disk_spool_io_runs_off_the_loop(chunks: list[bytes]):
+    stream = PeekableAsyncStream(
+        async_byte_stream(chunks, delay=0), max_memory_size=8, chunk_size=5
+    )
+
+    with patch(
+        "shared.io.peekable_stream.asyncio.to_thread", wraps=asyncio.to_thread
+    ) as to_thread:
+        await stream.peek(4)
+        assert not to_thread.called
+
+        await stream.length()
+        replayed = [chunk async for chunk in stream.iter()]
+
+    assert b"".join(replayed) == b"".join(chunks)
+    offloaded = {call.args[0].__name__ for call in to_thread.call_args_list}
+    assert offloaded == {"_append", "_read_sync"}
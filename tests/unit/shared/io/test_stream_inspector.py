@@ -0,0 +1,46 @@
+import hashlib
+from collections.abc import AsyncIterator
+
+import pytest
+from shared.io.stream_inspector import StreamInspector
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_inspector_passes_chunks_through(
+    stream: AsyncIterator[bytes], chunks: list[bytes]
+):
+    inspector = StreamInspector(stream)
+
+    collected = [chunk async for chunk in inspector]
+
+    assert collected == chunks
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_inspector_computes_size_header_and_digest(
+    stream: AsyncIterator[bytes], chunks: list[bytes]
+):
+    data = b"".join(chunks)
+    inspector = StreamInspector(stream, header_size=8)
+
+    async for _ in inspector:
+        pass
+
+    assert inspector.size == len(data)
+    assert inspector.header == data[:8]
+    assert inspector.hexdigest() == hashlib.sha256(data).hexdigest()
+    assert inspector.checksum() == hashlib.sha256(data).hexdigest()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_inspector_checksum_is_none_until_exhausted(
+    stream: AsyncIterator[bytes],
+):
+    inspector = StreamInspector(stream)
+
+    await inspector.__anext__()
+
+    assert inspector.checksum() is None
@@ -0,0 +1,83 @@
+from dataclasses import replace
+from datetime import UTC, datetime
+
+import pytest
+from domain.models import FileMeta
+from domain.models.value_objects import Checksum
+from transport.rest.conditional import Preconditions, entity_tag, validator_headers
+
+UPDATED_AT = datetime(2026, 3, 1, 12, 30, 15, 500000, tzinfo=UTC)
+CHECKSUM = "ab" * 32
+
+
+@pytest.fixture
+def versioned_meta(filemeta: FileMeta) -> FileMeta:
+    return replace(filemeta, _updated_at=UPDATED_AT)
+
+
+@pytest.mark.unit
+def test_validator_headers(versioned_meta: FileMeta):
+    headers = validator_headers(versioned_meta)
+
+    assert headers["Last-Modified"] == "Sun, 01 Mar 2026 12:30:15 GMT"
+    assert headers["ETag"].startswith('W/"')
+
+
+@pytest.mark.unit
+def test_entity_tag_prefers_checksum(versioned_meta: FileMeta):
+    meta = replace(versioned_meta, _checksum=Checksum(CHECKSUM))
+
+    assert entity_tag(meta) == f'"{CHECKSUM}"'
+    assert Preconditions(if_none_match=f'W/"{CHECKSUM}"').not_modified(meta)
+
+
+@pytest.mark.unit
+def test_entity_tag_absent_without_validators(filemeta: FileMeta):
+    meta = replace(filemeta, _checksum=None, _updated_at=None)
+
+    assert entity_tag(meta) is None
+    assert validator_headers(meta) == {}
+    assert not Preconditions(if_none_match="*").not_modified(meta)
+
+
+@pytest.mark.unit
+def test_if_none_match(versioned_meta: FileMeta):
+    etag = entity_tag(versioned_meta)
+    assert etag is not None
+
+    assert Preconditions(if_none_match=etag).not_modified(versioned_meta)
+    assert Preconditions(if_none_match=f'"x", {etag}').not_modified(versioned_meta)
+    assert Preconditions(if_none_match="*").not_modified(versioned_meta)
+    assert not Preconditions(if_none_match='"other"').not_modified(versioned_meta)
+
+
+@pytest.mark.unit
+def test_if_none_match_takes_precedence(versioned_meta: FileMeta):
+    preconditions = Preconditions(
+        if_none_match='"other"',
+        if_modified_since="Sun, 01 Mar 2026 12:30:15 GMT",
+    )
+
+    assert not preconditions.not_modified(versioned_meta)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "since, expected",
+    [
+        ("Sun, 01 Mar 2026 12:30:15 GMT", True),
+        ("Mon, 02 Mar 2026 00:00:00 GMT", True),
+        ("Sun, 01 Mar 2026 12:30:14 GMT", False),
+        ("not a date", False),
+    ],
+)
+def test_if_modified_since(versioned_meta: FileMeta, since: str, expected: bool):
+    assert (
+        Preconditions(if_modified_since=since).not_modified(versioned_meta) is expected
+    )
+
+
+@pytest.mark.unit
+def test_empty_preconditions_are_falsy():
+    assert not Preconditions()
+    assert Preconditions(if_modified_since="Sun, 01 Mar 2026 12:30:15 GMT")
@@ -0,0 +1,126 @@
+from dataclasses import replace
+from unittest.mock import AsyncMock
+
+import pytest
+from domain.models import FileMeta
+from domain.models.value_objects import Checksum
+from fastapi.testclient import TestClient
+from shared.enums import Buckets
+from shared.exceptions.application import FileOperationFailed
+
+CHECKSUM = "ab" * 32
+
+
+@pytest.fixture
+def tagged_meta(filemeta: FileMeta) -> FileMeta:
+    return replace(filemeta, _checksum=Checksum(CHECKSUM))
+
+
+@pytest.mark.unit
+def test_retrieve_checks_preconditions_before_range(
+    files_client: TestClient, mock_crud_adapter: AsyncMock, tagged_meta: FileMeta
+):
+    mock_crud_adapter.retrieve_meta.return_value = tagged_meta
+    mock_crud_adapter.retrieve_range.side_effect = FileOperationFailed(
+        "Range not satisfiable", type="InvalidRangeError", status_code=416
+    )
+
+    response = files_client.get(
+        f"/files/{tagged_meta.get_id()}",
+        headers={
+            "X-Bucket": Buckets.DEFAULT.value,
+            "If-None-Match": f'"{CHECKSUM}"',
+            "Range": "bytes=999999999-",
+        },
+    )
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == f'"{CHECKSUM}"'
+    mock_crud_adapter.retrieve_range.assert_not_called()
+
+
+@pytest.mark.unit
+def test_retrieve_range_not_satisfiable_when_precondition_fails(
+    files_client: TestClient, mock_crud_adapter: AsyncMock, tagged_meta: FileMeta
+):
+    mock_crud_adapter.retrieve_meta.return_value = tagged_meta
+    mock_crud_adapter.retrieve_range.side_effect = FileOperationFailed(
+        "Range not satisfiable", type="InvalidRangeError", status_code=416
+    )
+
+    response = files_client.get(
+        f"/files/{tagged_meta.get_id()}",
+        headers={
+            "X-Bucket": Buckets.DEFAULT.value,
+            "If-None-Match": '"other"',
+            "Range": "bytes=999999999-",
+        },
+    )
+
+    assert response.status_code == 416
+    mock_crud_adapter.retrieve_range.assert_awaited_once()
+
+
+@pytest.mark.unit
+def test_head_file_returns_headers_without_body(
+    files_client: TestClient, mock_crud_adapter: AsyncMock, tagged_meta: FileMeta
+):
+    mock_crud_adapter.retrieve_meta.return_value = tagged_meta
+
+    response = files_client.head(f"/files/{tagged_meta.get_id()}")
+
+    assert response.status_code == 200
+    assert response.content == b""
+    assert response.headers["Content-Length"] == str(tagged_meta.get_size())
+    assert response.headers["ETag"] == f'"{CHECKSUM}"'
+    assert response.headers["Content-Type"].startswith(tagged_meta.get_content_type())
+    assert response.headers["X-FileID"] == tagged_meta.get_id()
+    mock_crud_adapter.retrieve.assert_not_called()
+
+
+@pytest.mark.unit
+def test_head_file_not_modified(
+    files_client: TestClient, mock_crud_adapter: AsyncMock, tagged_meta: FileMeta
+):
+    mock_crud_adapter.retrieve_meta.return_value = tagged_meta
+
+    response = files_client.head(
+        f"/files/{tagged_meta.get_id()}", headers={"If-None-Match": f'"{CHECKSUM}"'}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@pytest.mark.unit
+def test_retrieve_file_meta(
+    files_client: TestClient, mock_crud_adapter: AsyncMock, tagged_meta: FileMeta
+):
+    mock_crud_adapter.retrieve_meta.return_value = tagged_meta
+
+    response = files_client.get(f"/files/{tagged_meta.get_id()}/meta")
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["id"] == tagged_meta.get_id()
+    assert data["size"] == tagged_meta.get_size()
+    assert data["checksum"] == CHECKSUM
+    mock_crud_adapter.retrieve.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("suffix", ["", "/meta"])
+def test_file_meta_not_found(
+    files_client: TestClient,
+    mock_crud_adapter: AsyncMock,
+    filemeta: FileMeta,
+    suffix: str,
+):
+    mock_crud_adapter.retrieve_meta.side_effect = FileOperationFailed(
+        "No row", type="NoResultFoundError", status_code=404
+    )
+
+    url = f"/files/{filemeta.get_id()}{suffix}"
+    response = files_client.head(url) if not suffix else files_client.get(url)
+
+    assert response.status_code == 404